@@ -0,0 +1,293 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Measure conflicts of concurrent pastes into the same folder.
+
+Several threads, each with its own connection to a FileStorage in a
+temporary directory, move and copy items from their own folder into one
+shared folder, rename the items they put there and add them to their
+clipboard, one operation per transaction.  Transactions failing with a
+`ConflictError` are retried.
+
+The throughput of committed transactions, the fraction of attempts that
+conflicted and the latency added by retries are reported per operation.
+
+Run with ``python benchmarks/conflicts.py``, for instance::
+
+  python benchmarks/conflicts.py --threads 8 --folder ordered
+"""
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+import transaction
+from persistent import Persistent
+from persistent.mapping import PersistentMapping
+from ZODB.DB import DB
+from ZODB.FileStorage import FileStorage
+from ZODB.POSException import ConflictError
+from zope.component import provideAdapter
+from zope.component import testing
+from zope.container.btree import BTreeContainer
+from zope.container.contained import Contained
+from zope.container.ordered import OrderedContainer
+from zope.container.testing import PlacelessSetup
+from zope.copy.interfaces import ICopyHook
+from zope.location.interfaces import IContained
+from zope.location.interfaces import ILocation
+from zope.location.pickling import LocationCopyHook
+
+from zope.copypastemove import ContainerItemRenamer
+from zope.copypastemove import ObjectCopier
+from zope.copypastemove import ObjectMover
+from zope.copypastemove import PrincipalClipboard
+from zope.copypastemove.interfaces import IObjectMover
+
+
+FOLDERS = {
+    'btree': BTreeContainer,
+    'ordered': OrderedContainer,
+}
+
+OPERATIONS = ('move', 'copy', 'rename', 'clipboard')
+
+
+class Item(Persistent, Contained):
+
+    def __init__(self, size):
+        self.data = b'x' * size
+
+
+class Stats:
+    """What happened to the transactions of one operation."""
+
+    def __init__(self):
+        self.committed = self.attempts = self.conflicts = self.failed = 0
+        # Seconds from the first attempt to the commit of the
+        # transactions that were retried.
+        self.retried = []
+
+    def add(self, other):
+        self.committed += other.committed
+        self.attempts += other.attempts
+        self.conflicts += other.conflicts
+        self.failed += other.failed
+        self.retried.extend(other.retried)
+
+
+class Worker:
+    """Runs the transactions of one thread."""
+
+    def __init__(self, db, number, options):
+        self.db = db
+        self.number = number
+        self.options = options
+        self.random = random.Random(number)
+        self.stats = {operation: Stats() for operation in OPERATIONS}
+        # The names of the items this worker put into the shared folder.
+        self.names = []
+        self.error = None
+
+    def move(self, root):
+        source = root['sources'][self.number]
+        name = next(iter(source.keys()), None)
+        if name is None:
+            return self.copy(root)
+        chosen = ObjectMover(source[name]).moveTo(root['folder'])
+        return lambda: self.names.append(chosen)
+
+    def copy(self, root):
+        source = root['sources'][self.number]
+        name = 'original-%d' % self.number
+        chosen = ObjectCopier(source[name]).copyTo(root['folder'])
+        return lambda: self.names.append(chosen)
+
+    def rename(self, root):
+        if not self.names:
+            return self.copy(root)
+        index = self.random.randrange(len(self.names))
+        old = self.names[index]
+        new = '%s-r%d' % (old.split('-r')[0], self.random.randrange(10 ** 9))
+        ContainerItemRenamer(root['folder']).renameItem(old, new)
+
+        def renamed():
+            self.names[index] = new
+        return renamed
+
+    def clipboard(self, root):
+        name = self.random.choice(self.names) if self.names else 'none'
+        clipboard = PrincipalClipboard(root['clipboards'][self.number])
+        clipboard.addItems('copy', ['/folder/' + name])
+
+    def run(self):
+        tm = transaction.TransactionManager()
+        conn = self.db.open(tm)
+        try:
+            for i in range(self.options.transactions):
+                operation = self.random.choices(
+                    OPERATIONS, self.options.mix)[0]
+                self.transaction(tm, conn, operation)
+        except BaseException as error:
+            self.error = error
+            raise
+        finally:
+            conn.close()
+
+    def transaction(self, tm, conn, operation):
+        stats = self.stats[operation]
+        started = time.perf_counter()
+        for attempt in range(self.options.retries + 1):
+            stats.attempts += 1
+            tm.begin()
+            try:
+                committed = getattr(self, operation)(conn.root())
+                tm.commit()
+            except ConflictError:
+                tm.abort()
+                stats.conflicts += 1
+                if self.options.backoff:
+                    time.sleep(self.random.uniform(
+                        0, self.options.backoff * 2 ** attempt))
+                continue
+            if committed is not None:
+                committed()
+            stats.committed += 1
+            if attempt:
+                stats.retried.append(time.perf_counter() - started)
+            return
+        stats.failed += 1
+
+
+def setUp():
+    testing.setUp()
+    PlacelessSetup().setUp()
+    provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+    provideAdapter(ObjectMover, (IContained, ), IObjectMover)
+
+
+def populate(db, options):
+    tm = transaction.TransactionManager()
+    conn = db.open(tm)
+    root = conn.root()
+    root['folder'] = FOLDERS[options.folder]()
+    root['sources'] = sources = PersistentMapping()
+    root['clipboards'] = clipboards = PersistentMapping()
+    for number in range(options.threads):
+        sources[number] = source = BTreeContainer()
+        clipboards[number] = PersistentMapping()
+        # Enough items to move in every transaction.
+        for i in range(options.transactions):
+            source['item-%d-%d' % (number, i)] = Item(options.object_size)
+        # Kept to be copied.
+        source['original-%d' % number] = Item(options.object_size)
+    tm.commit()
+    conn.close()
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def report(stats, seconds):
+    print('{:<10} {:>9} {:>8} {:>9} {:>7} {:>9} {:>9} {:>9}'.format(
+        'operation', 'committed', 'tx/s', 'conflicts', 'failed',
+        'retry p50', 'retry p95', 'retry max'))
+    for operation, stat in stats.items():
+        if not stat.attempts:
+            continue
+        line = '{:<10} {:>9} {:>8.1f} {:>8.1%} {:>7}'.format(
+            operation, stat.committed, stat.committed / seconds,
+            stat.conflicts / stat.attempts, stat.failed)
+        if stat.retried:
+            line += ' {:>7.1f}ms {:>7.1f}ms {:>7.1f}ms'.format(
+                statistics.median(stat.retried) * 1000,
+                percentile(stat.retried, 0.95) * 1000,
+                max(stat.retried) * 1000)
+        print(line)
+
+
+def mix(value):
+    weights = [float(weight) for weight in value.split(',')]
+    if len(weights) != len(OPERATIONS) or sum(weights) <= 0:
+        raise argparse.ArgumentTypeError(
+            'expected %d weights for %s' % (len(OPERATIONS),
+                                            ', '.join(OPERATIONS)))
+    return weights
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--transactions', type=int, default=200,
+                        help='transactions per thread')
+    parser.add_argument('--folder', choices=FOLDERS, default='btree',
+                        help='kind of the shared folder')
+    parser.add_argument('--mix', type=mix, default=[1, 1, 1, 1],
+                        help='comma separated weights of the operations %s'
+                        % ', '.join(OPERATIONS))
+    parser.add_argument('--object-size', type=int, default=100)
+    parser.add_argument('--retries', type=int, default=10,
+                        help='retries of a conflicting transaction')
+    parser.add_argument('--backoff', type=float, default=0.001,
+                        help='seconds of the first random backoff between'
+                        ' retries, doubled on every retry')
+    options = parser.parse_args(args)
+
+    directory = tempfile.mkdtemp()
+    setUp()
+    try:
+        db = DB(FileStorage(os.path.join(directory, 'Data.fs')),
+                pool_size=options.threads)
+        try:
+            populate(db, options)
+            workers = [Worker(db, number, options)
+                       for number in range(options.threads)]
+            threads = [threading.Thread(target=worker.run)
+                       for worker in workers]
+            started = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            seconds = time.perf_counter() - started
+        finally:
+            db.close()
+    finally:
+        testing.tearDown()
+        shutil.rmtree(directory)
+
+    stats = {operation: Stats() for operation in OPERATIONS}
+    total = Stats()
+    for worker in workers:
+        for operation, stat in worker.stats.items():
+            stats[operation].add(stat)
+            total.add(stat)
+    stats['total'] = total
+    print('%d threads, %d transactions in %.2fs' % (
+        options.threads, total.committed + total.failed, seconds))
+    report(stats, seconds)
+    errors = any(worker.error is not None for worker in workers)
+    return 1 if total.failed or errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,102 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Compare copying simple records by pickling and with a copy strategy.
+
+Run with ``python benchmarks/copy_strategies.py``.
+"""
+import argparse
+import timeit
+
+from zope.component import provideAdapter
+from zope.component import testing
+from zope.container.contained import Contained
+from zope.container.sample import SampleContainer
+from zope.container.testing import PlacelessSetup
+from zope.copy.interfaces import ICopyHook
+from zope.location.interfaces import ILocation
+from zope.location.pickling import LocationCopyHook
+
+from zope.copypastemove import ObjectCopier
+from zope.copypastemove.strategies import copyAttributes
+from zope.copypastemove.strategies import registerCopyStrategy
+from zope.copypastemove.strategies import unregisterCopyStrategy
+
+
+class Record(Contained):
+
+    def __init__(self, title, number):
+        self.title = title
+        self.number = number
+        self.tags = ('a', 'b', 'c')
+
+
+def setUp():
+    testing.setUp()
+    PlacelessSetup().setUp()
+    provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+
+
+def run(records, repeat):
+    source = SampleContainer()
+    for i in range(records):
+        source['record%d' % i] = Record('Record %d' % i, i)
+    folder = SampleContainer()
+    source['folder'] = folder
+    for i in range(records):
+        folder['record%d' % i] = Record('Record %d' % i, i)
+
+    def copyRecords():
+        target = SampleContainer()
+        for name in list(source)[:records]:
+            ObjectCopier(source[name]).copyTo(target)
+
+    def copyFolder():
+        ObjectCopier(folder).copyTo(SampleContainer())
+
+    results = {}
+    for label in ('pickle', 'strategy'):
+        if label == 'strategy':
+            registerCopyStrategy(Record, copyAttributes)
+        else:
+            unregisterCopyStrategy(Record)
+        for name, func in (('records', copyRecords), ('folder', copyFolder)):
+            results[name, label] = min(timeit.repeat(
+                func, number=1, repeat=repeat))
+    unregisterCopyStrategy(Record)
+    return results
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=1000,
+                        help='number of records copied')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='best of how many runs')
+    options = parser.parse_args(args)
+    setUp()
+    try:
+        results = run(options.records, options.repeat)
+    finally:
+        testing.tearDown()
+    for name, description in (
+            ('records', '%d records one by one' % options.records),
+            ('folder', 'a folder of %d records' % options.records)):
+        pickled = results[name, 'pickle']
+        strategy = results[name, 'strategy']
+        print('%-32s pickle %8.4fs  strategy %8.4fs  %5.1fx' % (
+            description, pickled, strategy, pickled / strategy))
+
+
+if __name__ == '__main__':
+    main()
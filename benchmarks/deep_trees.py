@@ -0,0 +1,94 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Compare copying deep trees with dense cross references.
+
+`zope.copy.clone` walks the `__parent__` chain for every reference to a
+location, `zope.copypastemove.cloning.clone` remembers where locations are.
+
+Run with ``python benchmarks/deep_trees.py``.
+"""
+import argparse
+import random
+import sys
+import timeit
+
+import zope.copy
+from zope.component import provideAdapter
+from zope.component import testing
+from zope.copy.interfaces import ICopyHook
+from zope.location.interfaces import ILocation
+from zope.location.location import Location
+from zope.location.pickling import LocationCopyHook
+
+from zope.copypastemove import cloning
+
+
+class Node(Location):
+
+    def __init__(self, parent):
+        self.__parent__ = parent
+        self.children = []
+        self.references = []
+        if parent is not None:
+            parent.children.append(self)
+
+
+def tree(depth, width, references):
+    """A tree `depth` levels deep with `width` nodes on every level.
+
+    Every node refers to `references` random nodes in and outside the
+    tree.
+    """
+    outside = Node(None)
+    root = Node(outside)
+    nodes = [outside, root]
+    parent = root
+    for i in range(depth):
+        level = [Node(parent) for j in range(width)]
+        nodes.extend(level)
+        parent = level[0]
+    rnd = random.Random(42)
+    for node in nodes[1:]:
+        node.references = rnd.sample(nodes, min(references, len(nodes)))
+    return root
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--depth', type=int, default=100)
+    parser.add_argument('--width', type=int, default=5)
+    parser.add_argument('--references', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=5)
+    options = parser.parse_args(args)
+    # Pickling recurses along the references.
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 100 * options.depth))
+
+    testing.setUp()
+    provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+    try:
+        root = tree(options.depth, options.width, options.references)
+        results = [
+            min(timeit.repeat(lambda: clone(root), number=1,
+                              repeat=options.repeat))
+            for clone in (zope.copy.clone, cloning.clone)]
+    finally:
+        testing.tearDown()
+    print('depth %d, width %d, %d references per node' % (
+        options.depth, options.width, options.references))
+    print('zope.copy.clone %8.4fs  cloning.clone %8.4fs  %5.1fx' % (
+        results[0], results[1], results[0] / results[1]))
+
+
+if __name__ == '__main__':
+    main()
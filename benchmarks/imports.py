@@ -0,0 +1,77 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Time importing and registering the package in new processes.
+
+Compares importing ``zope.copypastemove`` alone, registering it with
+`zope.copypastemove.registration.register` and loading its
+``configure.zcml``.  Every case runs in a new interpreter, the best time
+and the number of modules loaded are reported.
+
+Run with ``python benchmarks/imports.py``.
+"""
+import argparse
+import subprocess
+import sys
+
+
+CASES = {
+    'import': 'import zope.copypastemove',
+    'register': (
+        'from zope.copypastemove.registration import register\n'
+        'register()'),
+    'zcml': (
+        'import zope.configuration.xmlconfig\n'
+        'import zope.copypastemove\n'
+        'zope.configuration.xmlconfig.XMLConfig('
+        '"configure.zcml", zope.copypastemove)()'),
+}
+
+TEMPLATE = '''\
+import sys
+import time
+started = time.perf_counter()
+{}
+print(time.perf_counter() - started, len(sys.modules))
+'''
+
+
+def measure(code, repeat):
+    """Return the best time and the number of modules after running `code`
+    in `repeat` new interpreters."""
+    best = None
+    for i in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, '-c', TEMPLATE.format(code)])
+        seconds, modules = output.split()
+        seconds = float(seconds)
+        best = seconds if best is None else min(best, seconds)
+    return best, int(modules)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=10)
+    options = parser.parse_args(args)
+
+    baseline, modules = measure('pass', options.repeat)
+    print('{:<10} {:>9} {:>8}'.format('case', 'time', 'modules'))
+    for name, code in CASES.items():
+        seconds, loaded = measure(code, options.repeat)
+        print('{:<10} {:>7.1f}ms {:>8}'.format(
+            name, (seconds - baseline) * 1000, loaded - modules))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
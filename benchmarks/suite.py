@@ -0,0 +1,324 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Time moves, copies, renames and clipboard updates in large containers.
+
+For every kind of container and every size, a container with that many
+items is stored in an in-memory ZODB.  Every item is a tree with the given
+fan-out and depth, whose leaves hold the given number of bytes.  Then
+every benchmark runs a number of operations on the container, in a
+transaction that is aborted afterwards, and the best time per operation
+of several runs is reported.
+
+Run with ``python benchmarks/suite.py``, for instance::
+
+  python benchmarks/suite.py --sizes 100,10000,1000000 --save base.json
+  python benchmarks/suite.py --sizes 100,10000,1000000 --compare base.json
+
+Comparing with a saved baseline exits with status 1 if a benchmark got
+slower by more than the tolerance.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+import transaction
+from persistent import Persistent
+from persistent.mapping import PersistentMapping
+from ZODB.DB import DB
+from ZODB.MappingStorage import MappingStorage
+from zope.component import provideAdapter
+from zope.component import testing
+from zope.container.btree import BTreeContainer
+from zope.container.contained import Contained
+from zope.container.ordered import OrderedContainer
+from zope.container.sample import SampleContainer
+from zope.container.testing import PlacelessSetup
+from zope.copy.interfaces import ICopyHook
+from zope.location.interfaces import IContained
+from zope.location.interfaces import ILocation
+from zope.location.pickling import LocationCopyHook
+
+from zope.copypastemove import ContainerItemRenamer
+from zope.copypastemove import ObjectCopier
+from zope.copypastemove import ObjectMover
+from zope.copypastemove import OrderedContainerItemRenamer
+from zope.copypastemove import PrincipalClipboard
+from zope.copypastemove.interfaces import IObjectCopier
+from zope.copypastemove.interfaces import IObjectMover
+
+
+CONTAINERS = {
+    'sample': SampleContainer,
+    'ordered': OrderedContainer,
+    'btree': BTreeContainer,
+}
+
+
+class Item(Persistent, Contained):
+
+    def __init__(self, size):
+        self.data = b'x' * size
+
+
+def item(fanout, depth, size):
+    """An item with `fanout` children on `depth` levels below it."""
+    if depth <= 0:
+        return Item(size)
+    folder = BTreeContainer()
+    for i in range(fanout):
+        folder['child%d' % i] = item(fanout, depth - 1, size)
+    return folder
+
+
+def names(container, count):
+    """The names of the first `count` items, in a stable order."""
+    result = []
+    for name in container.keys():
+        result.append(name)
+        if len(result) == count:
+            break
+    return result
+
+
+def moveTo(root, container, count):
+    target = root['target']
+    for name in names(container, count):
+        ObjectMover(container[name]).moveTo(target)
+
+
+def copyTo(root, container, count):
+    # Into the same container, so that names have to be chosen.
+    for name in names(container, count):
+        ObjectCopier(container[name]).copyTo(container)
+
+
+def renameItem(root, container, count):
+    renamer = ContainerItemRenamer(container)
+    for name in names(container, count):
+        renamer.renameItem(name, 'renamed-' + name)
+
+
+def orderedRename(root, container, count):
+    renamer = OrderedContainerItemRenamer(container)
+    for name in names(container, count):
+        renamer.renameItem(name, 'renamed-' + name)
+
+
+def clipboard(root, container, count):
+    # Add to a clipboard holding as many items as the container.
+    clipboard = PrincipalClipboard(root['annotations'])
+    for i in range(count):
+        clipboard.addItems('copy', ['/container/item%d' % i])
+
+
+#: The benchmarks and the kinds of containers they run with, ``None`` for
+#: all of them.
+BENCHMARKS = {
+    'moveTo': (moveTo, None),
+    'copyTo': (copyTo, None),
+    'renameItem': (renameItem, None),
+    'orderedRename': (orderedRename, ('ordered', )),
+    'clipboard': (clipboard, ('btree', )),
+}
+
+
+def setUp():
+    testing.setUp()
+    PlacelessSetup().setUp()
+    provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+    provideAdapter(ObjectMover, (IContained, ), IObjectMover)
+    provideAdapter(ObjectCopier, (IContained, ), IObjectCopier)
+
+
+def build(kind, size, options):
+    """Return a database with a container of `kind` with `size` items."""
+    db = DB(MappingStorage())
+    conn = db.open()
+    root = conn.root()
+    container = root['container'] = CONTAINERS[kind]()
+    root['target'] = CONTAINERS[kind]()
+    for i in range(size):
+        container['item%d' % i] = item(
+            options.fanout, options.depth, options.object_size)
+        if i % 10000 == 9999:
+            transaction.savepoint(optimistic=True)
+    root['annotations'] = PersistentMapping()
+    root['annotations']['clipboard'] = tuple(
+        {'action': 'copy', 'target': '/container/item%d' % i}
+        for i in range(size))
+    transaction.commit()
+    conn.close()
+    return db
+
+
+def measure(db, benchmark, count, repeat):
+    """Return the best time per operation of `repeat` runs."""
+    best = None
+    for i in range(repeat):
+        conn = db.open()
+        try:
+            root = conn.root()
+            container = root['container']
+            started = time.perf_counter()
+            benchmark(root, container, count)
+            seconds = time.perf_counter() - started
+        finally:
+            transaction.abort()
+            # SampleContainer is not persistent, its changes are only
+            # undone by loading it again.
+            conn.cacheMinimize()
+            conn.close()
+        best = seconds if best is None else min(best, seconds)
+    return best / count
+
+
+def run(options):
+    results = []
+    for kind in options.containers:
+        for size in options.sizes:
+            db = build(kind, size, options)
+            try:
+                for name in options.benchmarks:
+                    benchmark, kinds = BENCHMARKS[name]
+                    if kinds is not None and kind not in kinds:
+                        continue
+                    seconds = measure(db, benchmark,
+                                      min(options.count, size),
+                                      options.repeat)
+                    result = {'benchmark': name, 'container': kind,
+                              'size': size, 'seconds': seconds}
+                    results.append(result)
+                    print(format(result), flush=True)
+            finally:
+                db.close()
+    return results
+
+
+def format(result, baseline=None):
+    line = '{:<14} {:<8} {:>8}  {:9.1f}us'.format(
+        result['benchmark'], result['container'], result['size'],
+        result['seconds'] * 1e6)
+    if baseline is not None:
+        ratio = result['seconds'] / baseline['seconds']
+        line += '  {:9.1f}us  {:5.2f}x'.format(
+            baseline['seconds'] * 1e6, ratio)
+    return line
+
+
+def key(result):
+    return result['benchmark'], result['container'], result['size']
+
+
+def compare(results, baseline, tolerance):
+    """Print the results next to the baseline and return the number of
+    benchmarks slower by more than `tolerance`."""
+    saved = {key(result): result for result in baseline['results']}
+    slower = 0
+    print('\n{:<14} {:<8} {:>8}  {:>11}  {:>11}  {:>6}'.format(
+        'benchmark', 'kind', 'size', 'now', 'baseline', 'ratio'))
+    for result in results:
+        old = saved.get(key(result))
+        if old is None:
+            print(format(result) + '  (new)')
+            continue
+        line = format(result, old)
+        if result['seconds'] > old['seconds'] * (1 + tolerance):
+            line += '  SLOWER'
+            slower += 1
+        print(line)
+    return slower
+
+
+def sizes(value):
+    return [int(float(size)) for size in value.split(',')]
+
+
+def choices(available):
+    def parse(value):
+        chosen = value.split(',')
+        for choice in chosen:
+            if choice not in available:
+                raise argparse.ArgumentTypeError(
+                    '%r is not one of %s' % (choice, ', '.join(available)))
+        return chosen
+    return parse
+
+
+def settings(options):
+    return {
+        'fanout': options.fanout,
+        'depth': options.depth,
+        'object_size': options.object_size,
+        'count': options.count,
+    }
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=sizes, default=[100, 1000, 10000],
+                        help='comma separated numbers of items, up to 1e6')
+    parser.add_argument('--containers', type=choices(CONTAINERS),
+                        default=list(CONTAINERS),
+                        help='comma separated kinds of containers')
+    parser.add_argument('--benchmarks', type=choices(BENCHMARKS),
+                        default=list(BENCHMARKS),
+                        help='comma separated benchmarks to run')
+    parser.add_argument('--fanout', type=int, default=3,
+                        help='number of children of every item node')
+    parser.add_argument('--depth', type=int, default=0,
+                        help='levels of children below every item')
+    parser.add_argument('--object-size', type=int, default=100,
+                        help='bytes held by every leaf')
+    parser.add_argument('--count', type=int, default=100,
+                        help='operations per run')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='best of how many runs')
+    parser.add_argument('--save', metavar='FILE',
+                        help='save the results as JSON')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='compare with results saved before')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='fraction by which a benchmark may be slower')
+    options = parser.parse_args(args)
+
+    setUp()
+    try:
+        results = run(options)
+    finally:
+        testing.tearDown()
+
+    if options.save:
+        with open(options.save, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'options': settings(options),
+                'results': results,
+            }, f, indent=2)
+    if options.compare:
+        with open(options.compare) as f:
+            baseline = json.load(f)
+        if baseline['options'] != settings(options):
+            print('\nThe baseline was measured with other options: %s'
+                  % baseline['options'])
+        if compare(results, baseline, options.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -36,6 +36,8 @@ ZCML_REQUIRES = [
 ]
 
 TESTS_REQUIRE = ZCML_REQUIRES + [
+    # zope.copypastemove.blobs relies on internals of ZODB.blob.
+    'ZODB >= 5.6, < 7',
     'zope.dublincore >= 3.8',
     'zope.principalannotation',
     'zope.testing',
@@ -88,6 +90,7 @@ setup(name='zope.copypastemove',
           'zope.interface',
           'zope.lifecycleevent',
           'zope.location',
+          'zope.proxy',
       ],
       include_package_data=True,
       zip_safe=False,
@@ -15,6 +15,8 @@
 """
 __docformat__ = 'restructuredtext'
 
+from collections import namedtuple
+
 import zope.component
 from zope.annotation.interfaces import IAnnotations
 from zope.component import adapter
@@ -22,25 +24,79 @@ from zope.container.constraints import checkObject
 from zope.container.interfaces import IContainer
 from zope.container.interfaces import INameChooser
 from zope.container.interfaces import IOrderedContainer
-from zope.container.sample import SampleContainer
-from zope.copy import copy
 from zope.event import notify
-from zope.exceptions import DuplicationError
 from zope.interface import Invalid
 from zope.interface import implementer
 from zope.lifecycleevent import ObjectCopiedEvent
 from zope.location.interfaces import IContained
 from zope.location.interfaces import ISublocations
 
+from zope.copypastemove.cloning import DEFAULT_MAX_MEMORY
+from zope.copypastemove.cloning import copy
+from zope.copypastemove.instrumentation import phase
 from zope.copypastemove.interfaces import IContainerItemRenamer
+from zope.copypastemove.interfaces import IContainerItemReorderer
+from zope.copypastemove.interfaces import IObjectBatchCopier
+from zope.copypastemove.interfaces import IObjectBatchMover
 from zope.copypastemove.interfaces import IObjectCopier
 from zope.copypastemove.interfaces import IObjectMover
+from zope.copypastemove.interfaces import IOrderedObjectCopier
+from zope.copypastemove.interfaces import IOrderedObjectMover
 from zope.copypastemove.interfaces import IPrincipalClipboard
 from zope.copypastemove.interfaces import ItemNotFoundError
+from zope.copypastemove.lookup import getObjectCopier
+from zope.copypastemove.lookup import getObjectMover
+from zope.copypastemove.metrics import constraintChecked
+from zope.copypastemove.metrics import metered
+from zope.copypastemove.metrics import nameChosen
+from zope.copypastemove.ordering import insertionOrder
+from zope.copypastemove.ordering import keyPosition
+from zope.copypastemove.ordering import placeInTarget
+from zope.copypastemove.ordering import placeKeys
+from zope.copypastemove.progress import checkpoint
+from zope.copypastemove.progress import operation
+
+
+def _jar(obj):
+    # Return the ZODB connection of `obj`, or the one of the nearest
+    # location above it that is stored, or None.
+    while obj is not None:
+        jar = getattr(obj, '_p_jar', None)
+        if jar is not None:
+            return jar
+        obj = getattr(obj, '__parent__', None)
+    return None
+
+
+def _database(obj):
+    # Return the ZODB database `obj` is stored in, or the one of the
+    # nearest location above it that is, or None.
+    jar = _jar(obj)
+    return None if jar is None else jar.db()
+
+
+_Ref = namedtuple('_Ref', ['database', 'oid'])
+
+
+def _ref(obj):
+    # Refer to a stored object across connections.  Objects that aren't
+    # persistent, like global sites, are used as they are.
+    if getattr(obj, '_p_jar', None) is None:
+        if hasattr(type(obj), '_p_oid'):
+            raise ValueError('%r is not stored in a database' % (obj, ))
+        return obj
+    return _Ref(obj._p_jar.db().database_name, obj._p_oid)
+
+
+def _load(conn, ref):
+    # Return the object `ref` refers to, loaded in the connection `conn`.
+    if isinstance(ref, _Ref):
+        return conn.get_connection(ref.database).get(ref.oid)
+    return ref
 
 
 @adapter(IContained)
-@implementer(IObjectMover)
+@implementer(IOrderedObjectMover)
 class ObjectMover:
     """Adapter for moving objects between containers
 
@@ -51,6 +107,7 @@ class ObjectMover:
 
     >>> from zope.container.contained import Contained
     >>> ob = Contained()
+    >>> from zope.copypastemove import ExampleContainer
     >>> container = ExampleContainer()
     >>> container['foo'] = ob
     >>> mover = ObjectMover(ob)
@@ -168,12 +225,38 @@ class ObjectMover:
     >>> mover2.moveableTo(container)
     True
 
+    Ordered containers let us choose where the moved object ends up.
+    Instead of appending it and reordering afterwards, we can give an
+    index or the name of a neighbour:
+
+    >>> from zope.container.ordered import OrderedContainer
+    >>> ordered = OrderedContainer()
+    >>> for name in ('a', 'b', 'c'):
+    ...     ordered[name] = Contained()
+    >>> mover.moveToPosition(ordered, index=1)
+    'splat_'
+    >>> list(ordered.keys())
+    ['a', 'splat_', 'b', 'c']
+    >>> ObjectMover(ordered['a']).moveToPosition(ordered, after='c')
+    'a'
+    >>> list(ordered.keys())
+    ['splat_', 'b', 'c', 'a']
+
+    In a ZODB with several databases, objects moved to a container in
+    another database are copied there, with everything in them, and then
+    removed from their source, instead of being referred to across
+    databases.  The copy gets new object ids in the target database in
+    a single pass of the copier, see `zope.copypastemove.cloning`.  As
+    the moved object is replaced, subscribers see it removed and its copy
+    added, not moved.
+
     """
 
     def __init__(self, object):
         self.context = object
         self.__parent__ = object  # TODO: see if we can automate this
 
+    @metered('moveTo')
     def moveTo(self, target, new_name=None):
         """Move this object to the `target` given.
 
@@ -187,23 +270,50 @@ class ObjectMover:
         if new_name is None:
             new_name = orig_name
 
-        checkObject(target, new_name, obj)
+        with phase('moveTo', 'checkObject'):
+            checkObject(target, new_name, obj)
 
         if target is container and new_name == orig_name:
             # Nothing to do
             return
 
-        chooser = INameChooser(target)
-        new_name = chooser.chooseName(new_name, obj)
+        with phase('moveTo', 'chooseName'):
+            chooser = INameChooser(target)
+            name = chooser.chooseName(new_name, obj)
+        nameChosen(new_name, name)
+        new_name = name
 
         if target is container and new_name == orig_name:
             # obstinate namechooser
             return
 
-        target[new_name] = obj
-        del container[orig_name]
+        source, destination = _database(container), _database(target)
+        if source is not None and destination not in (None, source):
+            # Objects can't change their database, the object is replaced
+            # by a copy stored in the database of the target.
+            with phase('moveTo', 'copy'):
+                obj = copy(obj)
+
+        with phase('moveTo', 'setitem'):
+            target[new_name] = obj
+        with phase('moveTo', 'delitem'):
+            del container[orig_name]
         return new_name
 
+    def moveToPosition(self, target, new_name=None, index=None, before=None,
+                       after=None):
+        """Move this object to the `target` given and position it there.
+
+        Returns the new name within the `target`.
+        """
+        orig_name = self.context.__name__
+        name = self.moveTo(target, new_name)
+        if name is None:
+            # The object stayed where it was.
+            name = orig_name
+        placeInTarget(target, [name], index, before, after)
+        return name
+
     def moveable(self):
         """Returns ``True`` if the object is moveable, otherwise ``False``."""
         return True
@@ -219,12 +329,14 @@ class ObjectMover:
         try:
             checkObject(target, name, self.context)
         except Invalid:
+            constraintChecked('moveableTo', False)
             return False
+        constraintChecked('moveableTo', True)
         return True
 
 
 @adapter(IContained)
-@implementer(IObjectCopier)
+@implementer(IOrderedObjectCopier)
 class ObjectCopier:
     """Adapter for copying objects between containers
 
@@ -234,6 +346,7 @@ class ObjectCopier:
 
     >>> from zope.container.contained import Contained
     >>> ob = Contained()
+    >>> from zope.copypastemove import ExampleContainer
     >>> container = ExampleContainer()
     >>> container['foo'] = ob
     >>> copier = ObjectCopier(ob)
@@ -362,8 +475,72 @@ class ObjectCopier:
     >>> copier2.copyableTo(container)
     True
 
+    Copies can be positioned within ordered containers:
+
+    >>> from zope.container.ordered import OrderedContainer
+    >>> ordered = OrderedContainer()
+    >>> for name in ('a', 'b'):
+    ...     ordered[name] = Contained()
+    >>> copier.copyToPosition(ordered, index=0)
+    'foo'
+    >>> list(ordered.keys())
+    ['foo', 'a', 'b']
+    >>> ObjectCopier(ordered['b']).copyToPosition(ordered, 'b2', before='a')
+    'b2'
+    >>> list(ordered.keys())
+    ['foo', 'b2', 'a', 'b']
+
+    The copy is made by pickling the object.  Pickles of up to `maxMemory`
+    bytes are kept in memory, larger ones are spooled to a temporary file.
+    The limit can be changed per copier or in a subclass:
+
+    >>> copier.maxMemory = 1024
+    >>> copier.copyTo(container2, 'small')
+    'small'
+
+    Objects that are copied again and again, like templates, can be copied
+    using a `zope.copypastemove.caching.CopyCache` keeping their pickles:
+
+    >>> from zope.copypastemove.caching import CopyCache
+    >>> copier = ObjectCopier(container2['bar'])
+    >>> copier.cache = CopyCache(versionOf=lambda obj: 1)
+    >>> copier.copyTo(container, 'bar1'), copier.copyTo(container, 'bar2')
+    ('bar1', 'bar2')
+    >>> copier.cache.hits
+    1
+
+    A copy policy can have large objects copied in the background, see
+    `zope.copypastemove.background`.  The name of the copy is returned
+    right away and reserved until the copy is added to the target:
+
+    >>> from zope.copypastemove.background import BackgroundCopyPolicy
+    >>> copier = ObjectCopier(container2)
+    >>> copier.policy = BackgroundCopyPolicy(maxLocations=0)
+    >>> copier.copyTo(container, 'large')
+    'large'
+    >>> copier.future.result()
+    'large'
+    >>> container['large'].__name__
+    'large'
+    >>> copier.policy.executor.shutdown()
+
     """
 
+    #: Size in bytes up to which the pickle of a copy is kept in memory.
+    #: ``None`` means no limit, ``0`` always spools to a file.
+    maxMemory = DEFAULT_MAX_MEMORY
+
+    #: A `zope.copypastemove.caching.CopyCache` used to copy the object, or
+    #: ``None``.
+    cache = None
+
+    #: An `zope.copypastemove.interfaces.ICopyPolicy` deciding whether to
+    #: copy the object later, or ``None`` to always copy right away.
+    policy = None
+
+    #: The `concurrent.futures.Future` of the last copy made later.
+    future = None
+
     def __init__(self, object):
         self.context = object
         self.__parent__ = object  # TODO: see if we can automate this
@@ -375,21 +552,54 @@ class ObjectCopier:
         is created and before adding it to the target container,
         an `IObjectCopied` event is published.
         """
+        return self._copyTo(target, new_name, None)
+
+    def copyToPosition(self, target, new_name=None, index=None, before=None,
+                       after=None):
+        """Copy this object to the `target` given and position the copy.
+
+        Returns the new name within the `target`.
+        """
+        return self._copyTo(target, new_name, (index, before, after))
+
+    @metered('copyTo')
+    def _copyTo(self, target, new_name, position):
         obj = self.context
 
         orig_name = obj.__name__
         if new_name is None:
             new_name = orig_name
 
-        checkObject(target, new_name, obj)
-
-        chooser = INameChooser(target)
-        new_name = chooser.chooseName(new_name, obj)
-
-        new = copy(obj)
-        notify(ObjectCopiedEvent(new, obj))
+        with phase('copyTo', 'checkObject'):
+            checkObject(target, new_name, obj)
+
+        policy = self.policy
+        with phase('copyTo', 'chooseName'):
+            if policy is None:
+                name = INameChooser(target).chooseName(new_name, obj)
+            else:
+                name = policy.chooseName(target, new_name, obj)
+        nameChosen(new_name, name)
+        new_name = name
+
+        if policy is not None and policy.defer(obj):
+            self.future = policy.submit(self, target, new_name, position)
+        else:
+            self._copyInto(target, new_name, position)
+        return new_name
 
-        target[new_name] = new
+    def _copyInto(self, target, new_name, position):
+        obj = self.context
+        with phase('copyTo', 'copy'):
+            new = copy(obj, self.maxMemory, self.cache)
+        with phase('copyTo', 'notify'):
+            notify(ObjectCopiedEvent(new, obj))
+
+        with phase('copyTo', 'setitem'):
+            target[new_name] = new
+        if position is not None:
+            with phase('copyTo', 'position'):
+                placeInTarget(target, [new_name], *position)
         return new_name
 
     def copyable(self):
@@ -407,10 +617,155 @@ class ObjectCopier:
         try:
             checkObject(target, name, self.context)
         except Invalid:
+            constraintChecked('copyableTo', False)
             return False
+        constraintChecked('copyableTo', True)
         return True
 
 
+@adapter(IContainer)
+@implementer(IObjectBatchMover)
+class ObjectBatchMover:
+    """Moves several objects into a container at once.
+
+    The adapter is created for the target container and uses the
+    `IObjectMover` of every object:
+
+      >>> from zope.location.interfaces import IContained
+      >>> gsm = zope.component.getGlobalSiteManager()
+      >>> gsm.registerAdapter(ObjectMover, (IContained, ), IObjectMover)
+
+      >>> from zope.container.contained import Contained
+      >>> from zope.container.ordered import OrderedContainer
+      >>> from zope.copypastemove import ExampleContainer
+      >>> source = ExampleContainer()
+      >>> target = OrderedContainer()
+      >>> for name in ('a', 'b', 'c'):
+      ...     source[name] = Contained()
+      ...     target[name.upper()] = Contained()
+
+    When moving into an ordered container, all objects are placed with a
+    single order update:
+
+      >>> ObjectBatchMover(target).moveObjects(
+      ...     [source['c'], source['a']], index=1)
+      ['c', 'a']
+      >>> list(target.keys())
+      ['A', 'c', 'a', 'B', 'C']
+      >>> list(source)
+      ['b']
+
+    Without a position the objects are appended, as with `IObjectMover`:
+
+      >>> ObjectBatchMover(target).moveObjects([source['b']])
+      ['b']
+      >>> list(target.keys())
+      ['A', 'c', 'a', 'B', 'C', 'b']
+
+    The progress is reported after every object, and a cancellation token
+    is checked before every object:
+
+      >>> from zope.copypastemove.progress import CancellationToken
+      >>> token = CancellationToken()
+      >>> def progress(report):
+      ...     token.cancel()
+      >>> ObjectBatchMover(source).moveObjects(
+      ...     [target['A'], target['B']], progress=progress, token=token)
+      Traceback (most recent call last):
+      ...
+      zope.copypastemove.interfaces.OperationCancelled
+      >>> list(source)
+      ['A']
+
+    """
+
+    def __init__(self, container):
+        self.context = container
+        self.__parent__ = container
+
+    @metered('moveObjects', len)
+    def moveObjects(self, objects, index=None, before=None, after=None,
+                    progress=None, token=None):
+        target = self.context
+        # Moving changes the source containers, which `objects` may be a
+        # view of, like the values of a source.
+        objects = list(objects)
+        names = {}
+        with operation(progress, token) as op:
+            for i, obj in insertionOrder(target, objects):
+                op.check()
+                orig_name = obj.__name__
+                name = getObjectMover(obj).moveTo(target)
+                names[i] = orig_name if name is None else name
+                op.done()
+        names = [name for i, name in sorted(names.items())]
+        placeInTarget(target, names, index, before, after)
+        return names
+
+
+@adapter(IContainer)
+@implementer(IObjectBatchCopier)
+class ObjectBatchCopier:
+    """Copies several objects into a container at once.
+
+    The adapter is created for the target container and uses the
+    `IObjectCopier` of every object:
+
+      >>> from zope.location.interfaces import IContained
+      >>> gsm = zope.component.getGlobalSiteManager()
+      >>> gsm.registerAdapter(ObjectCopier, (IContained, ), IObjectCopier)
+
+      >>> from zope.container.contained import Contained
+      >>> from zope.container.ordered import OrderedContainer
+      >>> from zope.copypastemove import ExampleContainer
+      >>> source = ExampleContainer()
+      >>> target = OrderedContainer()
+      >>> for name in ('a', 'b'):
+      ...     source[name] = Contained()
+      ...     target[name.upper()] = Contained()
+
+      >>> ObjectBatchCopier(target).copyObjects(
+      ...     [source['a'], source['b']], before='A')
+      ['a', 'b']
+      >>> list(target.keys())
+      ['a', 'b', 'A', 'B']
+      >>> list(source)
+      ['a', 'b']
+
+    The progress, including the size of the pickles copied, is reported
+    after every object:
+
+      >>> reports = []
+      >>> ObjectBatchCopier(target).copyObjects(
+      ...     [source['a'], source['b']], progress=reports.append)
+      ['a-2', 'b-2']
+      >>> [report.items for report in reports if report.bytes]
+      [0, 1, 1, 2]
+
+    """
+
+    def __init__(self, container):
+        self.context = container
+        self.__parent__ = container
+
+    @metered('copyObjects', len)
+    def copyObjects(self, objects, index=None, before=None, after=None,
+                    progress=None, token=None):
+        target = self.context
+        # Copying changes the target, which `objects` may be a view of,
+        # like the values of the target itself.
+        objects = list(objects)
+        names = {}
+        with operation(progress, token) as op:
+            for i, obj in insertionOrder(target, objects):
+                op.check()
+                names[i] = getObjectCopier(obj).copyTo(target)
+                op.done()
+        names = [name for i, name in sorted(names.items())]
+        placeInTarget(target, names, index, before, after)
+        return names
+
+
 @adapter(IContainer)
 @implementer(IContainerItemRenamer)
 class ContainerItemRenamer:
@@ -426,6 +781,7 @@ class ContainerItemRenamer:
     To rename an item in a container, instantiate a ContainerItemRenamer
     with the container:
 
+      >>> from zope.container.sample import SampleContainer
       >>> container = SampleContainer()
       >>> renamer = ContainerItemRenamer(container)
 
@@ -465,19 +821,23 @@ class ContainerItemRenamer:
     def __init__(self, container):
         self.container = container
 
+    @metered('renameItem')
     def renameItem(self, oldName, newName):
         return self._renameItem(oldName, newName)
 
     def _renameItem(self, oldName, newName):
-        object = self.container.get(oldName)
-        if object is None:
-            raise ItemNotFoundError(self.container, oldName)
-        mover = IObjectMover(object)
+        with phase('renameItem', 'lookup'):
+            object = self.container.get(oldName)
+            if object is None:
+                raise ItemNotFoundError(self.container, oldName)
+            mover = getObjectMover(object)
 
-        if newName in self.container:
-            raise DuplicationError("%s is already in use" % newName)
+            if newName in self.container:
+                from zope.exceptions import DuplicationError
+                raise DuplicationError("%s is already in use" % newName)
 
-        return mover.moveTo(self.container, newName)
+        with phase('renameItem', 'moveTo'):
+            return mover.moveTo(self.container, newName)
 
 
 @adapter(IOrderedContainer)
@@ -543,14 +903,126 @@ class OrderedContainerItemRenamer(ContainerItemRenamer):
 
     """
 
+    @metered('renameItem')
     def renameItem(self, oldName, newName):
         order = list(self.container.keys())
         newName = self._renameItem(oldName, newName)
-        order[order.index(oldName)] = newName
-        self.container.updateOrder(order)
+        with phase('renameItem', 'updateOrder'):
+            order[order.index(oldName)] = newName
+            self.container.updateOrder(order)
         return newName
 
 
+@adapter(IOrderedContainer)
+@implementer(IContainerItemReorderer)
+class OrderedContainerItemReorderer:
+    """Changes the position of items within an ordered container.
+
+    Unlike rebuilding the full key list and calling ``updateOrder``, the
+    reorderer only rewrites the part of the order that changes.
+
+      >>> from zope.container.ordered import OrderedContainer
+      >>> container = OrderedContainer()
+      >>> for name in ('a', 'b', 'c', 'd', 'e'):
+      ...     container[name] = 'Item ' + name
+      >>> reorderer = OrderedContainerItemReorderer(container)
+
+    Items can be moved to an index or next to another item:
+
+      >>> reorderer.moveToIndex('d', 0)
+      True
+      >>> container.keys()
+      ['d', 'a', 'b', 'c', 'e']
+      >>> reorderer.moveAfter('d', 'b')
+      True
+      >>> container.keys()
+      ['a', 'b', 'd', 'c', 'e']
+      >>> reorderer.moveBefore('e', 'a')
+      True
+      >>> container.keys()
+      ['e', 'a', 'b', 'd', 'c']
+
+    The usual editor operations are available too:
+
+      >>> reorderer.moveUp('c')
+      True
+      >>> reorderer.moveDown('e', 2)
+      True
+      >>> container.keys()
+      ['a', 'b', 'e', 'c', 'd']
+      >>> reorderer.moveToTop('d')
+      True
+      >>> reorderer.moveToBottom('a')
+      True
+      >>> container.keys()
+      ['d', 'b', 'e', 'c', 'a']
+
+    Moving an item where it already is doesn't change anything:
+
+      >>> reorderer.moveToTop('d')
+      False
+
+    Several items can be moved at once; they end up next to each other in
+    the order given:
+
+      >>> reorderer.moveItemsToIndex(['a', 'e'], 1)
+      True
+      >>> container.keys()
+      ['d', 'a', 'e', 'b', 'c']
+      >>> reorderer.moveItemsAfter(['d', 'a'], 'c')
+      True
+      >>> container.keys()
+      ['e', 'b', 'c', 'd', 'a']
+      >>> reorderer.moveItemsBefore(['c', 'a'], 'e')
+      True
+      >>> container.keys()
+      ['c', 'a', 'e', 'b', 'd']
+
+    Unknown items raise an error:
+
+      >>> reorderer.moveUp('x') # doctest:+ELLIPSIS
+      Traceback (most recent call last):
+      ItemNotFoundError: (<...OrderedContainer...>, 'x')
+
+    """
+
+    def __init__(self, container):
+        self.container = container
+
+    def moveToIndex(self, name, index):
+        return placeKeys(self.container, [name], index=index)
+
+    def moveBefore(self, name, anchor):
+        return placeKeys(self.container, [name], before=anchor)
+
+    def moveAfter(self, name, anchor):
+        return placeKeys(self.container, [name], after=anchor)
+
+    def moveUp(self, name, delta=1):
+        position = keyPosition(self.container, name)
+        return placeKeys(self.container, [name],
+                         index=max(position - delta, 0))
+
+    def moveDown(self, name, delta=1):
+        position = keyPosition(self.container, name)
+        return placeKeys(self.container, [name], index=position + delta)
+
+    def moveToTop(self, name):
+        return placeKeys(self.container, [name], index=0)
+
+    def moveToBottom(self, name):
+        return placeKeys(self.container, [name])
+
+    def moveItemsToIndex(self, names, index):
+        return placeKeys(self.container, names, index=index)
+
+    def moveItemsBefore(self, names, anchor):
+        return placeKeys(self.container, names, before=anchor)
+
+    def moveItemsAfter(self, names, anchor):
+        return placeKeys(self.container, names, after=anchor)
+
+
 @adapter(IAnnotations)
 @implementer(IPrincipalClipboard)
 class PrincipalClipboard:
@@ -563,10 +1035,12 @@ class PrincipalClipboard:
     def __init__(self, annotation):
         self.context = annotation
 
+    @metered('clipboard.clearContents')
     def clearContents(self):
         """Clear the contents of the clipboard"""
         self.context['clipboard'] = ()
 
+    @metered('clipboard.addItems')
     def addItems(self, action, targets):
         """Add new items to the clipboard"""
         contents = self.getContents()
@@ -575,6 +1049,7 @@ class PrincipalClipboard:
             actions.append({'action': action, 'target': target})
         self.context['clipboard'] = contents + tuple(actions)
 
+    @metered('clipboard.setContents')
     def setContents(self, clipboard):
         """Replace the contents of the clipboard by the given value"""
         self.context['clipboard'] = clipboard
@@ -584,14 +1059,16 @@ class PrincipalClipboard:
         return self.context.get('clipboard', ())
 
 
-@implementer(INameChooser)
-class ExampleContainer(SampleContainer):
-    # Sample container used for examples in doc stringss in this module
-
-    def chooseName(self, name, ob):
-        while name in self:
-            name += '_'
-        return name
+def __getattr__(name):
+    # The sample container used for examples in doc strings in this module
+    # is only imported when asked for, importing `SampleContainer` takes
+    # longer than importing this package.
+    if name != 'ExampleContainer':
+        raise AttributeError(
+            'module %r has no attribute %r' % (__name__, name))
+    from zope.copypastemove._example import ExampleContainer
+    globals()[name] = ExampleContainer
+    return ExampleContainer
 
 
 def dispatchToSublocations(object, event):
@@ -665,4 +1142,5 @@ def dispatchToSublocations(object, event):
     subs = ISublocations(object, None)
     if subs is not None:
         for sub in subs.sublocations():
+            checkpoint()
             zope.component.handle(sub, event)
@@ -0,0 +1,28 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Sample container used for examples in doc strings
+"""
+from zope.container.interfaces import INameChooser
+from zope.container.sample import SampleContainer
+from zope.interface import implementer
+
+
+@implementer(INameChooser)
+class ExampleContainer(SampleContainer):
+    # Sample container used for examples in doc strings in this package
+
+    def chooseName(self, name, ob):
+        while name in self:
+            name += '_'
+        return name
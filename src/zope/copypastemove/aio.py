@@ -0,0 +1,169 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Batch moves and copies for asyncio applications
+
+The batch movers and copiers in this module are coroutines.  They move or
+copy the objects in slices of `sliceSize` objects, and wait between the
+slices, so that a large batch doesn't hold up other work.
+
+The slices are run by an `executor`.  Objects loaded from a ZODB may only
+be used by the thread of their connection, so for them this is an
+executor with that one thread, typically a
+``concurrent.futures.ThreadPoolExecutor(1)`` that opened the connection.
+Without an executor the slices are run by the event loop itself.
+"""
+__docformat__ = 'restructuredtext'
+
+import asyncio
+from itertools import islice
+
+from zope.component import adapter
+from zope.component.hooks import getSite
+from zope.component.hooks import site as siteContext
+from zope.container.interfaces import IContainer
+from zope.interface import implementer
+
+from zope.copypastemove.interfaces import IAsyncObjectBatchCopier
+from zope.copypastemove.interfaces import IAsyncObjectBatchMover
+from zope.copypastemove.lookup import getObjectCopier
+from zope.copypastemove.lookup import getObjectMover
+from zope.copypastemove.ordering import insertionOrder
+from zope.copypastemove.ordering import placeInTarget
+from zope.copypastemove.progress import Operation
+from zope.copypastemove.progress import currentOperation
+from zope.copypastemove.progress import running
+
+
+class _AsyncBatch:
+
+    #: The number of objects handled between two waits.
+    sliceSize = 100
+
+    def __init__(self, container, executor=None):
+        self.context = container
+        self.__parent__ = container
+        self.executor = executor
+
+    async def _call(self, op, func, *args):
+        # Call `func` in the executor, with the site and operation of the
+        # caller, and let other tasks run.
+        current = getSite()
+
+        def call():
+            with siteContext(current), running(op):
+                return func(*args)
+        if self.executor is None:
+            res = call()
+            await asyncio.sleep(0)
+            return res
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, call)
+
+    async def _batch(self, objects, position, progress, token):
+        op = Operation(progress, token, currentOperation())
+        objects = await self._call(op, self._order, objects)
+        names = {}
+        while await self._call(op, self._slice, op, objects, names):
+            pass
+        names = [name for i, name in sorted(names.items())]
+        await self._call(op, placeInTarget, self.context, names, *position)
+        return names
+
+    def _order(self, objects):
+        # The objects are listed first, moving them changes the source.
+        # Like handling them, this reads their state.
+        return iter(insertionOrder(self.context, list(objects)))
+
+    def _slice(self, op, objects, names):
+        # Returns the number of objects handled, 0 when done.
+        count = 0
+        for i, obj in islice(objects, self.sliceSize):
+            op.check()
+            names[i] = self._handle(obj)
+            op.done()
+            count += 1
+        return count
+
+
+@adapter(IContainer)
+@implementer(IAsyncObjectBatchMover)
+class AsyncObjectBatchMover(_AsyncBatch):
+    """Moves several objects into a container, in slices.
+
+      >>> from zope.component import provideAdapter
+      >>> from zope.location.interfaces import IContained
+      >>> from zope.copypastemove import ObjectMover
+      >>> from zope.copypastemove.interfaces import IObjectMover
+      >>> provideAdapter(ObjectMover, (IContained, ), IObjectMover)
+
+      >>> from zope.container.contained import Contained
+      >>> from zope.container.ordered import OrderedContainer
+      >>> source = OrderedContainer()
+      >>> target = OrderedContainer()
+      >>> for name in ('a', 'b', 'c'):
+      ...     source[name] = Contained()
+      >>> target['A'] = Contained()
+
+      >>> mover = AsyncObjectBatchMover(target)
+      >>> mover.sliceSize = 2
+      >>> asyncio.run(mover.moveObjects(source.values(), index=0))
+      ['a', 'b', 'c']
+      >>> list(target.keys()), list(source.keys())
+      (['a', 'b', 'c', 'A'], [])
+    """
+
+    async def moveObjects(self, objects, index=None, before=None,
+                          after=None, progress=None, token=None):
+        return await self._batch(
+            objects, (index, before, after), progress, token)
+
+    def _handle(self, obj):
+        orig_name = obj.__name__
+        name = getObjectMover(obj).moveTo(self.context)
+        return orig_name if name is None else name
+
+
+@adapter(IContainer)
+@implementer(IAsyncObjectBatchCopier)
+class AsyncObjectBatchCopier(_AsyncBatch):
+    """Copies several objects into a container, in slices.
+
+      >>> from zope.component import provideAdapter
+      >>> from zope.location.interfaces import IContained
+      >>> from zope.copypastemove import ObjectCopier
+      >>> from zope.copypastemove.interfaces import IObjectCopier
+      >>> provideAdapter(ObjectCopier, (IContained, ), IObjectCopier)
+
+      >>> from zope.container.contained import Contained
+      >>> from zope.container.sample import SampleContainer
+      >>> source = SampleContainer()
+      >>> for name in ('a', 'b', 'c'):
+      ...     source[name] = Contained()
+      >>> target = SampleContainer()
+
+      >>> copier = AsyncObjectBatchCopier(target)
+      >>> asyncio.run(copier.copyObjects(
+      ...     [source['a'], source['b'], source['c']]))
+      ['a', 'b', 'c']
+      >>> sorted(target), sorted(source)
+      (['a', 'b', 'c'], ['a', 'b', 'c'])
+    """
+
+    async def copyObjects(self, objects, index=None, before=None,
+                          after=None, progress=None, token=None):
+        return await self._batch(
+            objects, (index, before, after), progress, token)
+
+    def _handle(self, obj):
+        return getObjectCopier(obj).copyTo(self.context)
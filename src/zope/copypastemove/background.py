@@ -0,0 +1,356 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Estimating the size of copies and copying large objects in the background
+
+`estimateCopy` estimates the number of locations and the pickle size of
+an object from a sample of its sublocations.  A `BackgroundCopyPolicy`
+uses it to have an `zope.copypastemove.ObjectCopier` copy large objects
+in a background thread instead of the calling one, a
+`ConnectionCopyPolicy` does the same for objects stored in a ZODB.
+"""
+__docformat__ = 'restructuredtext'
+
+import copy as pycopy
+import io
+import logging
+import threading
+from collections import deque
+from collections import namedtuple
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pickle import Pickler
+
+from zope.component.hooks import getSite
+from zope.component.hooks import site as siteContext
+from zope.container.interfaces import INameChooser
+from zope.interface import implementer
+from zope.location.interfaces import ILocation
+from zope.location.interfaces import ISublocations
+from zope.proxy import ProxyBase
+from zope.proxy import getProxiedObject
+
+from zope.copypastemove import _jar
+from zope.copypastemove import _load
+from zope.copypastemove import _ref
+from zope.copypastemove.cloning import DEFAULT_MAX_MEMORY
+from zope.copypastemove.interfaces import ICopyPolicy
+from zope.copypastemove.interfaces import OperationCancelled
+from zope.copypastemove.progress import currentOperation
+from zope.copypastemove.progress import running
+
+
+log = logging.getLogger(__name__)
+
+#: The estimated number of `locations` copied and `size` in bytes of the
+#: pickle.  `exact` tells whether all locations were visited.
+CopyEstimate = namedtuple('CopyEstimate', ['locations', 'size', 'exact'])
+
+
+def _ownSize(obj):
+    # The size of the pickle of an object without its sublocations and
+    # other persistent objects, which would be loaded otherwise.
+    def persistent_id(other):
+        if other is obj:
+            return None
+        if ILocation.providedBy(other) or hasattr(other, '_p_jar'):
+            return 1
+        return None
+    out = io.BytesIO()
+    pickler = Pickler(out, protocol=-1)
+    pickler.persistent_id = persistent_id
+    try:
+        pickler.dump(obj)
+    except Exception:
+        # Estimating shouldn't fail for what copy hooks can copy.
+        return 0
+    return out.tell()
+
+
+def estimateCopy(obj, width=10, budget=100):
+    """Estimate the size of a copy of `obj` by visiting at most `budget`
+    locations.
+
+    The locations are visited breadth first.  Of the sublocations of a
+    location, only the first `width` are visited and taken to be typical
+    for all of them.  When the budget is spent, the sublocations of the
+    remaining locations are counted, but not visited, and taken to have the
+    average size of the locations visited.
+
+      >>> from zope.container.sample import SampleContainer
+      >>> from zope.container.contained import Contained
+      >>> folder = SampleContainer()
+      >>> for i in range(100):
+      ...     folder['item%d' % i] = item = Contained()
+      ...     item.data = 'x' * 100
+      >>> estimate = estimateCopy(folder, width=5)
+      >>> estimate.locations, estimate.exact
+      (101, False)
+      >>> estimate.size > 100 * 100
+      True
+      >>> estimateCopy(folder['item0'])
+      CopyEstimate(locations=1, size=..., exact=True)
+    """
+    queue = deque([(obj, 1.0)])
+    locations = size = 0.0
+    visited = 0
+    exact = True
+    while queue:
+        location, weight = queue.popleft()
+        visited += 1
+        locations += weight
+        size += weight * _ownSize(location)
+
+        subs = ISublocations(location, None)
+        if subs is None:
+            continue
+        sublocations = subs.sublocations()
+        sample = list(islice(sublocations, width))
+        if not sample:
+            continue
+        try:
+            count = len(location)
+        except TypeError:
+            count = len(sample) + sum(1 for sub in sublocations)
+        # Only as many sublocations are visited as the budget allows.
+        sample = sample[:max(budget - visited - len(queue), 0)]
+        if count > len(sample):
+            exact = False
+        if not sample:
+            # Count them with the average size of the locations visited.
+            unvisited = weight * count
+            size += unvisited * size / locations
+            locations += unvisited
+            continue
+        for sub in sample:
+            queue.append((sub, weight * count / len(sample)))
+    return CopyEstimate(int(round(locations)), int(round(size)), exact)
+
+
+def _key(obj):
+    # Identifies a target across connections if it is stored.
+    oid = getattr(obj, '_p_oid', None)
+    if oid is None:
+        return id(obj)
+    return obj._p_jar.db().database_name, oid
+
+
+class _Reserving(ProxyBase):
+    # A target in which the `names` reserved for copies are taken.
+
+    __slots__ = ('_names', )
+
+    def __new__(cls, target, names):
+        return ProxyBase.__new__(cls, target)
+
+    def __init__(self, target, names):
+        ProxyBase.__init__(self, target)
+        self._names = names
+
+    def __contains__(self, name):
+        return name in self._names or name in getProxiedObject(self)
+
+
+@implementer(ICopyPolicy)
+class BackgroundCopyPolicy:
+    """Copy objects larger than the limits in a background thread.
+
+    An object is large if its copy is estimated to have more than
+    `maxLocations` locations or a pickle larger than `maxSize` bytes.  Large
+    objects are copied by `executor`, by default one thread copying one
+    object after the other.  The copies are made with the site and the
+    `zope.copypastemove.progress` operation of the caller, so cancelling
+    the operation also cancels the copies it deferred.
+
+    The name of a copy is reserved until the copy is added, the name
+    chooser of the target finds it taken when choosing names for other
+    copies.  Copies that fail are
+    reported by `failed`.
+
+    The objects are accessed from the background thread, which is only
+    safe for objects that aren't stored in a ZODB.  Use a
+    `ConnectionCopyPolicy` for those.
+    """
+
+    def __init__(self, executor=None, maxLocations=1000,
+                 maxSize=DEFAULT_MAX_MEMORY, width=10, budget=100):
+        self.executor = executor
+        self.maxLocations = maxLocations
+        self.maxSize = maxSize
+        self.width = width
+        self.budget = budget
+        self._reserved = set()
+        self._lock = threading.Lock()
+
+    def defer(self, obj):
+        estimate = estimateCopy(obj, self.width, self.budget)
+        return (estimate.locations > self.maxLocations
+                or estimate.size > self.maxSize)
+
+    def reserved(self, target, name):
+        with self._lock:
+            return (_key(target), name) in self._reserved
+
+    def chooseName(self, target, name, obj):
+        key = _key(target)
+        with self._lock:
+            reserved = frozenset(
+                n for k, n in self._reserved if k == key)
+        name = INameChooser(_Reserving(target, reserved)).chooseName(
+            name, obj)
+        if name in reserved:
+            # Targets choosing names themselves don't see the proxy.
+            from zope.exceptions import DuplicationError
+            raise DuplicationError("%s is reserved" % name)
+        return name
+
+    def submit(self, copier, target, name, position):
+        reservation = self._reserve(target, name)
+        return self.execute(
+            self._run, reservation, copier.context, target, name,
+            copier._copyInto, target, name, position)
+
+    def _reserve(self, target, name):
+        reservation = _key(target), name
+        with self._lock:
+            self._reserved.add(reservation)
+        return reservation
+
+    def _release(self, reservation):
+        with self._lock:
+            self._reserved.discard(reservation)
+
+    def _run(self, reservation, obj, target, name, func, *args):
+        # Call `func` to copy `obj`, reporting failures and releasing the
+        # reservation of the name when done.
+        try:
+            return func(*args)
+        except OperationCancelled:
+            raise
+        except Exception as error:
+            self.failed(obj, target, name, error)
+            raise
+        finally:
+            self._release(reservation)
+
+    def failed(self, obj, target, name, error):
+        """Report that copying `obj` to `target` as `name` failed with
+        `error`.  This logs the error."""
+        log.error('Copying %r to %r as %r failed', obj, target, name,
+                  exc_info=error)
+
+    def execute(self, func, *args):
+        """Have `func` called with `args` by the executor, with the site
+        and the operation of the caller.
+
+        Returns a `concurrent.futures.Future` of the result.
+        """
+        current = getSite()
+        op = currentOperation()
+
+        def run():
+            with siteContext(current), running(op):
+                return func(*args)
+        return self._executor().submit(run)
+
+    def _executor(self):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                1, thread_name_prefix='zope.copypastemove')
+        return self.executor
+
+
+class ConnectionCopyPolicy(BackgroundCopyPolicy):
+    """Copy large objects stored in the ZODB `db` in a background thread.
+
+    The copy is made once the transaction of the caller is committed, and
+    dropped, cancelling its future, if it is aborted.  The background
+    thread opens its own connection to `db`, loads the object, the target
+    and a stored site in it and commits the copy in its own transaction.
+    Conflicting transactions are retried `retries` times.
+
+    The object and the target must be stored in `db` or another database
+    of its multi-database when the transaction of the caller is committed.
+    """
+
+    #: How often a copy conflicting with another transaction is retried.
+    retries = 3
+
+    def __init__(self, db, executor=None, **kw):
+        super().__init__(executor, **kw)
+        self.db = db
+
+    def submit(self, copier, target, name, position):
+        jar = _jar(copier.context)
+        if jar is None:
+            raise ValueError(
+                '%r is not stored in a database' % (copier.context, ))
+        reservation = self._reserve(target, name)
+        future = Future()
+        site = getSite()
+        op = currentOperation()
+
+        def afterCommit(committed):
+            if not committed or not future.set_running_or_notify_cancel():
+                # Aborted, or cancelled by the caller.
+                self._release(reservation)
+                future.cancel()
+                return
+            try:
+                refs = _ref(copier.context), _ref(target), _ref(site)
+            except ValueError as error:
+                self._release(reservation)
+                self.failed(copier.context, target, name, error)
+                future.set_exception(error)
+                return
+            # The site and the objects of the caller are only used by the
+            # caller's thread, the copy loads them again.
+            _chain(self._executor().submit(
+                self._run, reservation, copier.context, target, name,
+                self._copyStored, refs, op, copier, name, position), future)
+
+        txn = jar.transaction_manager.get()
+        txn.addAfterCommitHook(afterCommit)
+        txn.addAfterAbortHook(afterCommit, (False, ))
+        return future
+
+    def _copyStored(self, refs, op, copier, name, position):
+        import transaction
+        tm = transaction.TransactionManager()
+        conn = self.db.open(tm)
+        try:
+            for attempt in tm.attempts(self.retries + 1):
+                with attempt:
+                    source, target, site = [
+                        _load(conn, ref) for ref in refs]
+                    stored = pycopy.copy(copier)
+                    stored.context = stored.__parent__ = source
+                    stored.policy = None
+                    with siteContext(site), running(op):
+                        stored._copyInto(target, name, position)
+            return name
+        finally:
+            conn.close()
+
+
+def _chain(source, future):
+    # Complete the running `future` like `source`.
+    def done(source):
+        try:
+            result = source.result()
+        except Exception as error:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    source.add_done_callback(done)
@@ -0,0 +1,150 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Copying ZODB blobs without copying their data
+
+Pickling a `ZODB.blob.Blob` doesn't include its data, so blobs are copied
+by a copy hook.  The data of a committed blob is never changed by ZODB, so
+the copy can share it: the committed file is cloned on file systems
+supporting reflinks, or hard linked if this process can't write to it.
+Otherwise, and for blobs with uncommitted changes, the data is copied.
+
+The shared file is handed to the copy the way `Blob` creates its own
+uncommitted files, which uses internals of ZODB: the
+``_p_blob_uncommitted`` file name, and the ``_p_blob_ref`` weak reference
+kept in ``ZODB.blob._blob_close_refs`` that removes the file if the blob
+is dropped before it is committed.  They are the same in ZODB 5 and 6,
+which are the versions tested.  When committing, the connection takes
+the file over through ``Blob._uncommitted``, like any uncommitted file.
+If ``_blob_close_refs`` is gone, the data is copied instead of shared.
+
+The hook is registered in ``configure.zcml`` if ZODB is installed.
+"""
+__docformat__ = 'restructuredtext'
+
+import os
+import shutil
+import weakref
+
+from ZODB.blob import Blob
+from ZODB.interfaces import BlobError
+from ZODB.utils import mktemp
+from zope.component import adapter
+from zope.copy.interfaces import ICopyHook
+from zope.interface import implementer
+
+
+try:
+    from ZODB.blob import _blob_close_refs
+except ImportError:
+    _blob_close_refs = None
+
+try:
+    import fcntl
+except ModuleNotFoundError:  # pragma: no cover (Windows)
+    fcntl = None
+
+# The Linux ioctl cloning a file on copy on write file systems.
+FICLONE = 0x40049409
+
+
+def reflink(source, target):
+    """Clone the `source` file as `target`, sharing the data on disk.
+
+    Returns whether the file system supports this.
+    """
+    if fcntl is None:  # pragma: no cover (Windows)
+        return False
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            return False
+    return True
+
+
+def hardlink(source, target):
+    """Hard link the `source` file as `target`.
+
+    Returns ``False`` if this process could write to `source`, writing to
+    the blob copy would then change the original, or if the file system
+    doesn't support this.  Until it is committed, a hard linked copy can
+    only be changed with `Blob.consumeFile`, opening it for writing fails.
+    """
+    if os.access(source, os.W_OK):
+        return False
+    try:
+        os.link(source, target)
+    except OSError:
+        return False
+    return True
+
+
+def _adopt(blob, filename):
+    # Make a file the uncommitted data of a new blob, like
+    # `Blob.consumeFile`, but leaving the file where it is.  That is the
+    # temporary directory of the storage, on the file system the blob
+    # file is moved to when committing.  Like the files of
+    # `Blob._create_uncommitted_file`, it is removed when the blob is
+    # gone without being committed.
+    blob._p_blob_uncommitted = filename
+
+    def cleanup(ref):
+        # The file is gone if it was removed with the temporary directory
+        # of the storage.
+        if os.path.exists(filename):
+            os.remove(filename)
+        try:
+            _blob_close_refs.remove(ref)
+        except ValueError:  # pragma: no cover
+            pass
+    blob._p_blob_ref = weakref.ref(blob, cleanup)
+    _blob_close_refs.append(blob._p_blob_ref)
+
+
+@implementer(ICopyHook)
+@adapter(Blob)
+class BlobCopyHook:
+    """Copies blobs, sharing the data of committed blobs."""
+
+    #: The ways to share the data of a committed blob, tried in order.
+    share = (reflink, hardlink)
+
+    def __init__(self, context):
+        self.context = context
+
+    def __call__(self, toplevel, register):
+        blob = self.context
+        blob._p_activate()
+        copy = Blob()
+        try:
+            committed = blob.committed()
+        except BlobError:
+            # Uncommitted changes, or a blob not in a database.
+            committed = None
+        if committed is not None and _blob_close_refs is not None:
+            storage = blob._p_jar.db().storage
+            target = mktemp(dir=storage.temporaryDirectory(), prefix='BUC')
+            os.remove(target)
+            for share in self.share:
+                if share(committed, target):
+                    break
+                if os.path.exists(target):
+                    os.remove(target)
+            else:
+                shutil.copyfile(committed, target)
+            _adopt(copy, target)
+            return copy
+        with blob.open('r') as source, copy.open('w') as target:
+            shutil.copyfileobj(source, target)
+        return copy
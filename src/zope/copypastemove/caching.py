@@ -0,0 +1,271 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Caching the pickles of frequently copied objects
+
+When the same objects, templates for instance, are copied over and over,
+pickling them again for every copy is wasted work.  A `CopyCache` keeps the
+pickles of recently copied objects and makes new copies by only unpickling
+them.
+"""
+__docformat__ = 'restructuredtext'
+
+import io
+import threading
+from collections import OrderedDict
+from pickle import Unpickler
+
+from zope.component import getSiteManager
+
+from zope.copypastemove import _load
+from zope.copypastemove import _ref
+from zope.copypastemove import _Ref
+from zope.copypastemove import progress
+from zope.copypastemove.cloning import _CopyPersistent
+from zope.copypastemove.cloning import _memo
+from zope.copypastemove.cloning import _pickle
+from zope.copypastemove.cloning import _unpickle
+from zope.copypastemove.instrumentation import phase
+
+
+def _isPersistent(obj):
+    return hasattr(obj, '_p_oid') and not isinstance(obj, type)
+
+
+def _persistentVersion(obj):
+    # The serial of a persistent object, or None if changes of the object
+    # can't be detected.
+    if getattr(obj, '_p_oid', None) is None:
+        return None
+    # Ghosts have no serial, and the object is copied anyway.
+    obj._p_activate()
+    if obj._p_changed:
+        return None
+    return obj._p_serial
+
+
+def _key(obj):
+    # Stored objects are keyed by their oid, so that their pickles are used
+    # across connections.
+    if _isPersistent(obj) and obj._p_jar is not None:
+        return _ref(obj)
+    return id(obj)
+
+
+class _RecordingPersistent(_CopyPersistent):
+    # Records the persistent objects copied with the pickle.
+
+    def __init__(self, toplevel):
+        _CopyPersistent.__init__(self, toplevel)
+        self.persistent = []
+        self.cacheable = True
+        # Whether persistent objects that aren't stored are shared.
+        self.unsaved = False
+
+    def id(self, obj):
+        pid = _CopyPersistent.id(self, obj)
+        if pid is not None:
+            if self.others_by_pid[pid] is not obj:
+                # Copied by a hook or strategy, every copy needs a new one.
+                self.cacheable = False
+            elif _isPersistent(obj) and obj._p_jar is None:
+                self.unsaved = True
+        elif _isPersistent(obj):
+            serial = _persistentVersion(obj)
+            if serial is None:
+                self.cacheable = False
+            else:
+                self.persistent.append((obj, serial))
+        return pid
+
+
+class _Entry:
+    # The persistent objects of the entry of a stored object are referred
+    # to by their oid and loaded in the connection of the object copied.
+
+    def __init__(self, source, version, generations, data, persistent,
+                 others):
+        self.source = source
+        self.version = version
+        self.generations = generations
+        self.data = data
+        self.persistent = persistent
+        self.others = others
+
+    def current(self, obj, version, generations):
+        if self.source is not None and self.source is not obj:
+            return False
+        if version != self.version or generations != self.generations:
+            return False
+        jar = getattr(obj, '_p_jar', None)
+        for ref, serial in self.persistent:
+            copied = _load(jar, ref)
+            # Load ghosts, their serial may be outdated.
+            copied._p_activate()
+            if copied._p_changed or copied._p_serial != serial:
+                return False
+        return True
+
+
+class CopyCache:
+    """A size bounded cache of pickled copies.
+
+    The cache holds the pickles of up to `maxSize` bytes, dropping the
+    least recently used ones when it's full.  A cached pickle is keyed by
+    the identity of the copied object and its version, and it is only used
+    while all persistent objects copied with it have their serial and no
+    unsaved changes, and while the copy hooks registered stay the same.
+    Stored objects are identified by their database and oid, so their
+    pickles are used for copies of the object in all connections, and the
+    cache doesn't keep the objects themselves.
+
+    Persistent objects are versioned by their ``_p_serial``.  Other objects
+    are only cached if `versionOf` returns a version for them, which must
+    change whenever the object or anything copied along with it changes:
+
+      >>> from zope.location.location import Location
+      >>> template = Location()
+      >>> template.data = ['some', 'data']
+      >>> template.version = 1
+      >>> cache = CopyCache(
+      ...     versionOf=lambda obj: getattr(obj, 'version', None))
+      >>> first = cache.clone(template)
+      >>> first.data, first is template
+      (['some', 'data'], False)
+      >>> cache.hits, cache.misses
+      (0, 1)
+      >>> second = cache.clone(template)
+      >>> second.data == first.data, second.data is first.data
+      (True, False)
+      >>> cache.hits, cache.misses
+      (1, 1)
+
+      >>> template.data.append('changed')
+      >>> template.version = 2
+      >>> cache.clone(template).data
+      ['some', 'data', 'changed']
+      >>> cache.hits, cache.misses
+      (1, 2)
+
+    Objects without a version aren't cached:
+
+      >>> cache.clone({'a': 1})
+      {'a': 1}
+      >>> len(cache)
+      1
+    """
+
+    def __init__(self, maxSize=64 * 1024 * 1024, versionOf=None):
+        self.maxSize = maxSize
+        self.versionOf = versionOf
+        self.size = 0
+        self.hits = self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _version(self, obj):
+        if _isPersistent(obj):
+            return _persistentVersion(obj)
+        if self.versionOf is not None:
+            return self.versionOf(obj)
+        return None
+
+    def clone(self, obj, maxMemory=None):
+        """Return a copy of `obj`, as `zope.copypastemove.cloning.clone`.
+
+        Objects that aren't cached are pickled into a spooled file of up to
+        `maxMemory` bytes.
+        """
+        version = self._version(obj)
+        adapters = getSiteManager().adapters
+        generations = (adapters,
+                       [registry._generation for registry in adapters.ro])
+        key = _key(obj)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.current(obj, version, generations):
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                if entry is not None:
+                    # Outdated, or for an object that's gone.
+                    del self._entries[key]
+                    self.size -= len(entry.data)
+                entry = None
+                self.misses += 1
+        if entry is not None:
+            jar = getattr(obj, '_p_jar', None)
+            with phase('clone', 'unpickle'):
+                unpickler = Unpickler(io.BytesIO(entry.data))
+                unpickler.persistent_load = (
+                    lambda pid: _load(jar, entry.others[pid]))
+                res = unpickler.load()
+            progress.copied(len(entry.data), lambda: _memo(unpickler))
+            return res
+
+        tmp, pickler, persistent = _pickle(
+            obj, maxMemory, _RecordingPersistent(obj))
+        with tmp:
+            # Copy hooks registering cleanups prevent caching, the cleanups
+            # need the memo of the pickler.  Shared persistent objects that
+            # aren't stored can't be loaded in other connections.
+            stored = isinstance(key, _Ref)
+            if (version is not None and persistent.cacheable
+                    and not persistent.registered
+                    and not (stored and persistent.unsaved)
+                    and tmp.tell() <= self.maxSize):
+                tmp.seek(0)
+                self._store(key, self._entry(
+                    stored, obj, version, generations, tmp.read(),
+                    persistent))
+            return _unpickle(tmp, pickler, persistent)
+
+    def _entry(self, stored, obj, version, generations, data, persistent):
+        if not stored:
+            return _Entry(obj, version, generations, data,
+                          persistent.persistent, persistent.others_by_pid)
+        return _Entry(None, version, generations, data,
+                      [(_ref(copied), serial)
+                       for copied, serial in persistent.persistent],
+                      {pid: _ref(other)
+                       for pid, other in persistent.others_by_pid.items()})
+
+    def _store(self, key, entry):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:  # pragma: no cover (stored by another thread)
+                self.size -= len(old.data)
+            self._entries[key] = entry
+            self.size += len(entry.data)
+            while self.size > self.maxSize:
+                key, old = self._entries.popitem(last=False)
+                self.size -= len(old.data)
+
+    def invalidate(self, obj):
+        """Drop the cached pickle of `obj`."""
+        key = _key(obj)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry.source is None
+                                      or entry.source is obj):
+                del self._entries[key]
+                self.size -= len(entry.data)
+
+    def clear(self):
+        """Drop all cached pickles."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
@@ -0,0 +1,295 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Cloning of object graphs for the object copier
+
+This works like `zope.copy.clone` and `zope.copy.copy`, including the
+support for `zope.copy.interfaces.ICopyHook` adapters, but the pickle is
+spooled: it stays in memory up to a configurable size and is moved to a
+temporary file beyond that.  Small copies don't touch the disk and large
+copies don't hold the whole pickle in memory.
+
+Objects providing `zope.copypastemove.interfaces.IShareable` are shared
+by the copies instead of being copied, using the `shareableCopyHook`
+registered in ``configure.zcml``.  Objects of classes with a copy strategy
+(see `zope.copypastemove.strategies`) are copied by it instead of being
+pickled.
+"""
+__docformat__ = 'restructuredtext'
+
+import tempfile
+from pickle import Pickler
+from pickle import Unpickler
+
+from zope.component import adapter
+from zope.copy import CopyPersistent
+from zope.copy.interfaces import ICopyHook
+from zope.copy.interfaces import ResumeCopy
+from zope.interface import implementer
+from zope.location.pickling import LocationCopyHook
+
+from zope.copypastemove import progress
+from zope.copypastemove.instrumentation import phase
+from zope.copypastemove.interfaces import IShareable
+from zope.copypastemove.strategies import getCopyStrategy
+
+
+#: Pickles up to this many bytes are kept in memory by default.
+DEFAULT_MAX_MEMORY = 16 * 1024 * 1024
+
+
+@adapter(IShareable)
+@implementer(ICopyHook)
+def shareableCopyHook(obj):
+    """Share objects marked as shareable, unless they are copied themselves.
+
+      >>> from zope.interface import alsoProvides
+      >>> class Table(dict):
+      ...     pass
+      >>> table = Table(a=1)
+      >>> alsoProvides(table, IShareable)
+      >>> hook = shareableCopyHook(table)
+      >>> hook({'table': table}, None) is table
+      True
+      >>> hook(table, None)
+      Traceback (most recent call last):
+      ...
+      zope.copy.interfaces.ResumeCopy
+    """
+    def hook(toplevel, register):
+        if toplevel is obj:
+            raise ResumeCopy
+        return obj
+    return hook
+
+
+class Containment:
+    """Tests whether objects are inside a location, remembering the results.
+
+    This is `zope.location.location.inside` for one `root`, but every
+    location whose `__parent__` chain is walked is remembered, so in a
+    tree each location is only visited once.  The results are only valid
+    while the tree isn't changed.
+
+      >>> from zope.location.location import Location
+      >>> def located(parent):
+      ...     location = Location()
+      ...     location.__parent__ = parent
+      ...     return location
+      >>> outside = Location()
+      >>> root = located(outside)
+      >>> deep = located(located(located(root)))
+      >>> inRoot = Containment(root)
+      >>> inRoot(deep), inRoot(root), inRoot(outside), inRoot(None)
+      (True, True, False, False)
+      >>> inRoot(located(deep.__parent__)), inRoot(located(outside))
+      (True, False)
+    """
+
+    def __init__(self, root):
+        self.root = root
+        # Maps ids to the result and the object, keeping it alive.
+        self._known = {id(root): (True, root)}
+
+    def __call__(self, obj):
+        known = self._known
+        path = []
+        while obj is not None:
+            entry = known.get(id(obj))
+            if entry is not None:
+                result = entry[0]
+                break
+            path.append(obj)
+            obj = getattr(obj, '__parent__', None)
+        else:
+            result = False
+        for obj in path:
+            known[id(obj)] = (result, obj)
+        return result
+
+
+class _CopyPersistent(CopyPersistent):
+    # Copy hooks, then the copy strategies for objects the hooks don't share.
+    # The containment test of `LocationCopyHook` is cached.  Objects with
+    # copy hooks, sublocations among them, are the points where a copy can
+    # be cancelled.
+
+    def __init__(self, toplevel):
+        CopyPersistent.__init__(self, toplevel)
+        self.inside = Containment(toplevel)
+        self.operation = progress.currentOperation()
+
+    def id(self, obj):
+        hook = ICopyHook(obj, None)
+        if hook is not None:
+            if self.operation is not None:
+                self.operation.check()
+            oid = id(obj)
+            if oid in self.pids_by_id:
+                return self.pids_by_id[oid]
+            if type(hook) is LocationCopyHook:
+                if not self.inside(obj):
+                    return self._register(oid, obj)
+            else:
+                try:
+                    res = hook(self.toplevel, self.registered.append)
+                except ResumeCopy:
+                    pass
+                else:
+                    return self._register(oid, res)
+        return self._copyWithStrategy(obj)
+
+    def _copyWithStrategy(self, obj):
+        # Objects that are copied anyway may be copied by a strategy.
+        strategy = getCopyStrategy(type(obj))
+        if strategy is None or obj is self.toplevel:
+            return None
+        oid = id(obj)
+        if oid in self.pids_by_id:
+            return self.pids_by_id[oid]
+        try:
+            res = strategy(obj, self.toplevel, self.registered.append)
+        except ResumeCopy:
+            return None
+        return self._register(oid, res)
+
+    def _register(self, oid, res):
+        # Ids start at 1, pickle ignores false ids.
+        pid = len(self.others_by_pid) + 1
+        self.pids_by_id[oid] = pid
+        self.others_by_pid[pid] = res
+        return pid
+
+
+def _copyWithStrategy(strategy, obj):
+    registered = []
+    res = strategy(obj, obj, registered.append)
+
+    def convert(other):
+        if other is obj:
+            return res
+        raise KeyError(other)
+    for call in registered:
+        call(convert)
+    return res
+
+
+def _spool(maxMemory):
+    if maxMemory is None:
+        # No limit.
+        return tempfile.SpooledTemporaryFile()
+    if maxMemory <= 0:
+        return tempfile.TemporaryFile()
+    return tempfile.SpooledTemporaryFile(max_size=maxMemory)
+
+
+def _memo(pickler):
+    # The memo of a pickler or unpickler as a dict, the C implementations
+    # only have a proxy of it.
+    return pickler.memo.copy()
+
+
+def _pickle(obj, maxMemory, persistent):
+    tmp = _spool(maxMemory)
+    try:
+        with phase('clone', 'pickle'):
+            pickler = Pickler(tmp, protocol=-1)
+            pickler.persistent_id = persistent.id
+            pickler.dump(obj)
+    except BaseException:
+        tmp.close()
+        raise
+    progress.copied(tmp.tell(), lambda: _memo(pickler))
+    return tmp, pickler, persistent
+
+
+def _unpickle(tmp, pickler, persistent):
+    with phase('clone', 'unpickle'):
+        return _load(tmp, pickler, persistent)
+
+
+def _load(tmp, pickler, persistent):
+    tmp.seek(0)
+    unpickler = Unpickler(tmp)
+    unpickler.persistent_load = persistent.load
+    res = unpickler.load()
+
+    # Run the cleanups registered by copy hooks.  Unlike `zope.copy`, the
+    # memos are copied once, not for every call of `convert`.
+    memos = []
+
+    def convert(obj):
+        if not memos:
+            memos.append(_memo(pickler))
+            memos.append(_memo(unpickler))
+        pid = memos[0][id(obj)][0]
+        try:
+            return memos[1][pid]
+        except KeyError:  # pragma: no cover (PyPy)
+            return memos[1][str(pid)]
+    for call in persistent.registered:
+        call(convert)
+    return res
+
+
+def clone(obj, maxMemory=DEFAULT_MAX_MEMORY, cache=None):
+    """Clone an object by pickling and unpickling it.
+
+    Pickles of up to `maxMemory` bytes are kept in memory, larger ones are
+    spooled to a temporary file.  With a `maxMemory` of ``None`` the pickle
+    is always kept in memory, with ``0`` it is always written to a file.
+
+      >>> original = {'data': [1, 2, 3]}
+      >>> copied = clone(original, maxMemory=0)
+      >>> copied == original, copied is original
+      (True, False)
+
+    If a `cache` is given, a `zope.copypastemove.caching.CopyCache`, the
+    copy is made by it.  Objects with a copy strategy are copied by it.
+    """
+    strategy = getCopyStrategy(type(obj))
+    if strategy is not None:
+        try:
+            return _copyWithStrategy(strategy, obj)
+        except ResumeCopy:
+            pass
+    if cache is not None:
+        return cache.clone(obj, maxMemory)
+    tmp, pickler, persistent = _pickle(obj, maxMemory, _CopyPersistent(obj))
+    with tmp:
+        return _unpickle(tmp, pickler, persistent)
+
+
+def copy(obj, maxMemory=DEFAULT_MAX_MEMORY, cache=None):
+    """Clone an object, clearing the `__name__` and `__parent__` of the copy.
+
+      >>> from zope.container.contained import Contained
+      >>> original = Contained()
+      >>> original.__name__ = 'original'
+      >>> original.__parent__ = parent = Contained()
+      >>> copied = copy(original)
+      >>> copied.__name__, copied.__parent__
+      (None, None)
+    """
+    res = clone(obj, maxMemory, cache)
+    if getattr(res, '__parent__', None) is not None:
+        try:
+            res.__parent__ = None
+        except AttributeError:
+            pass
+    if getattr(res, '__name__', None) is not None:
+        try:
+            res.__name__ = None
+        except AttributeError:
+            pass
+    return res
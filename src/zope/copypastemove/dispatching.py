@@ -0,0 +1,96 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Dispatching events to their subscribers
+
+`handle` calls the subscribers of an event like ``zope.component.handle``
+does, but lets its caller decide how they are called and what becomes of
+the dispatchers sending the event on to the sublocations of its object:
+
+  >>> from zope.component import provideHandler
+  >>> from zope.component.event import objectEventNotify
+  >>> from zope.container.contained import Contained
+  >>> from zope.container.sample import SampleContainer
+  >>> from zope.lifecycleevent import ObjectMovedEvent
+  >>> from zope.lifecycleevent.interfaces import IObjectMovedEvent
+  >>> from zope.copypastemove import dispatchToSublocations
+  >>> def log(obj, event):
+  ...     print('moved', obj.__name__)
+  >>> folder = SampleContainer()
+  >>> folder.__name__ = 'folder'
+  >>> folder['a'] = Contained()
+  >>> provideHandler(objectEventNotify)
+  >>> provideHandler(log, (None, IObjectMovedEvent))
+  >>> provideHandler(dispatchToSublocations, (None, IObjectMovedEvent))
+
+  >>> event = ObjectMovedEvent(folder, None, None, None, 'folder')
+  >>> def call(subscriber, objects):
+  ...     subscriber(*objects)
+  >>> handle((event, ), call)
+  moved folder
+
+Sublocations are only reached through `sublocations`, if it is given:
+
+  >>> from zope.component import provideAdapter
+  >>> from zope.container.contained import ContainerSublocations
+  >>> from zope.container.interfaces import IReadContainer
+  >>> from zope.location.interfaces import ISublocations
+  >>> provideAdapter(ContainerSublocations, (IReadContainer, ),
+  ...                ISublocations)
+  >>> def sublocations(obj, event):
+  ...     subs = ISublocations(obj, None)
+  ...     if subs is not None:
+  ...         for sub in subs.sublocations():
+  ...             handle((sub, event), call, sublocations)
+  >>> handle((event, ), call, sublocations)
+  moved folder
+  moved a
+"""
+__docformat__ = 'restructuredtext'
+
+import zope.component.event
+import zope.container.contained
+from zope.component import getSiteManager
+from zope.interface import providedBy
+
+import zope.copypastemove
+
+
+#: Subscribers sending an event on to the sublocations of its object.
+sublocationDispatchers = (
+    zope.copypastemove.dispatchToSublocations,
+    zope.container.contained.dispatchToSublocations,
+)
+
+
+def handle(objects, call, sublocations=None,
+           dispatchers=sublocationDispatchers):
+    """Dispatch `objects`, an event and the objects it is about, to their
+    subscribers.
+
+    Object events are sent on to the subscribers for their object, the
+    other subscribers are called by ``call(subscriber, objects)``.  Instead
+    of calling the subscribers in `dispatchers`, ``sublocations(object,
+    event)`` is called, or they are skipped if `sublocations` is ``None``.
+    """
+    subscriptions = getSiteManager().adapters.subscriptions(
+        [providedBy(obj) for obj in objects], None)
+    event = objects[-1]
+    for subscriber in subscriptions:
+        if subscriber is zope.component.event.objectEventNotify:
+            handle((event.object, event), call, sublocations, dispatchers)
+        elif subscriber in dispatchers:
+            if sublocations is not None:
+                sublocations(objects[0], event)
+        else:
+            call(subscriber, objects)
@@ -0,0 +1,141 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Timing the phases of moves, copies and renames
+
+``ObjectMover.moveTo``, ``ObjectCopier.copyTo`` and
+``ContainerItemRenamer.renameItem`` time their phases, like checking the
+object, choosing the name, copying or adding the object, if phase hooks
+are registered.  Copies also time pickling and unpickling, as the
+``pickle`` and ``unpickle`` phases of ``clone``.  A hook is called with
+the operation, the phase and the seconds it took.  Without hooks nothing
+is timed.
+
+A `PhaseCollector` sums up the phases of the operations of one thread,
+for instance while handling a request:
+
+  >>> from zope.container.contained import Contained
+  >>> from zope.container.sample import SampleContainer
+  >>> from zope.copypastemove import ObjectMover
+  >>> container = SampleContainer()
+  >>> container['a'] = Contained()
+  >>> with PhaseCollector() as collector:
+  ...     ObjectMover(container['a']).moveTo(container, 'b')
+  'b'
+  >>> sorted(collector.totals)
+  [('moveTo', 'checkObject'), ('moveTo', 'chooseName'),
+   ('moveTo', 'delitem'), ('moveTo', 'setitem')]
+  >>> count, seconds = collector.totals['moveTo', 'setitem']
+  >>> count, seconds >= 0
+  (1, True)
+"""
+__docformat__ = 'restructuredtext'
+
+import threading
+from contextlib import nullcontext
+from time import perf_counter
+
+
+_hooks = ()
+_started = ()
+
+
+def addPhaseHook(hook, started=None):
+    """Call `hook` with the operation, phase and seconds of every phase.
+
+    If given, `started` is called with the operation and phase when a
+    phase starts.
+    """
+    global _hooks, _started
+    _hooks += (hook, )
+    if started is not None:
+        _started += ((hook, started), )
+
+
+def removePhaseHook(hook):
+    """Stop calling `hook`."""
+    global _hooks, _started
+    _hooks = tuple(other for other in _hooks if other is not hook)
+    _started = tuple(item for item in _started if item[0] is not hook)
+
+
+class _Timed:
+
+    __slots__ = ('operation', 'phase', 'started')
+
+    def __init__(self, operation, phase):
+        self.operation = operation
+        self.phase = phase
+
+    def __enter__(self):
+        for hook, started in _started:
+            started(self.operation, self.phase)
+        self.started = perf_counter()
+
+    def __exit__(self, *exc_info):
+        seconds = perf_counter() - self.started
+        for hook in _hooks:
+            hook(self.operation, self.phase, seconds)
+
+
+_untimed = nullcontext()
+
+
+def phase(operation, name):
+    """Return a context manager timing the phase `name` of `operation`."""
+    if not _hooks:
+        return _untimed
+    return _Timed(operation, name)
+
+
+class PhaseCollector:
+    """Sums up the phases of the operations of the thread using it.
+
+    Used as a context manager, the collector is registered as a hook while
+    the block runs.  `totals` maps ``(operation, phase)`` to the number of
+    times the phase ran and the seconds it took in total.
+    """
+
+    def __init__(self):
+        self.totals = {}
+        self._thread = None
+
+    def __call__(self, operation, phase, seconds):
+        if threading.get_ident() != self._thread:
+            return
+        key = operation, phase
+        count, total = self.totals.get(key, (0, 0.0))
+        self.totals[key] = count + 1, total + seconds
+
+    def __enter__(self):
+        self._thread = threading.get_ident()
+        addPhaseHook(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        removePhaseHook(self)
+        self._thread = None
+
+
+def _clear():
+    global _hooks, _started
+    _hooks = _started = ()
+
+
+try:
+    from zope.testing.cleanup import addCleanUp
+except ModuleNotFoundError:  # pragma: no cover
+    pass
+else:
+    addCleanUp(_clear)
+    del addCleanUp
@@ -60,6 +60,107 @@ class IObjectCopier(Interface):
         """
 
 
+class IOrderedObjectMover(IObjectMover):
+    """An object mover that can also place the object within the target."""
+
+    def moveToPosition(target, new_name=None, index=None, before=None,
+                       after=None):
+        """Move this object to the `target` given and position it there.
+
+        If `target` is an `IOrderedContainer` the object is placed at the
+        given `index` or `before` or `after` the item with the given
+        name, without a separate ``updateOrder`` call.  Other targets
+        ignore the position.
+
+        Returns the new name within the `target`.
+        """
+
+
+class IOrderedObjectCopier(IObjectCopier):
+    """An object copier that can also place the copy within the target."""
+
+    def copyToPosition(target, new_name=None, index=None, before=None,
+                       after=None):
+        """Copy this object to the `target` given and position the copy.
+
+        If `target` is an `IOrderedContainer` the copy is placed at the
+        given `index` or `before` or `after` the item with the given
+        name, without a separate ``updateOrder`` call.  Other targets
+        ignore the position.
+
+        Returns the new name within the `target`.
+        """
+
+
+class IObjectBatchMover(Interface):
+    """Move several objects into the adapted container at once."""
+
+    def moveObjects(objects, index=None, before=None, after=None,
+                    progress=None, token=None):
+        """Move the given `objects` into the adapted container.
+
+        Each object is moved using its `IObjectMover`.  If the container
+        is ordered and a position is given, all moved objects are placed
+        there, in the order given, with a single order update.
+
+        If given, `progress` is called with a
+        `zope.copypastemove.progress.Progress` after every object.  The
+        `zope.copypastemove.progress.CancellationToken` `token` is checked
+        before every object; `OperationCancelled` is raised if it was
+        cancelled.
+
+        Returns the list of names of the objects within the container.
+        """
+
+
+class IObjectBatchCopier(Interface):
+    """Copy several objects into the adapted container at once."""
+
+    def copyObjects(objects, index=None, before=None, after=None,
+                    progress=None, token=None):
+        """Copy the given `objects` into the adapted container.
+
+        Each object is copied using its `IObjectCopier`.  If the container
+        is ordered and a position is given, all copies are placed there,
+        in the order given, with a single order update.
+
+        If given, `progress` is called with a
+        `zope.copypastemove.progress.Progress` after every object and
+        every pickle made.  The
+        `zope.copypastemove.progress.CancellationToken` `token` is checked
+        before every object and between the sublocations of the copied
+        objects; `OperationCancelled` is raised if it was cancelled.
+
+        Returns the list of names of the copies within the container.
+        """
+
+
+class IAsyncObjectBatchMover(Interface):
+    """Move several objects into the adapted container without blocking
+    an event loop."""
+
+    async def moveObjects(objects, index=None, before=None, after=None,
+                          progress=None, token=None):
+        """Move the given `objects` into the adapted container.
+
+        This works like `IObjectBatchMover.moveObjects`, but the objects
+        are moved a slice at a time, waiting between the slices.
+        """
+
+
+class IAsyncObjectBatchCopier(Interface):
+    """Copy several objects into the adapted container without blocking
+    an event loop."""
+
+    async def copyObjects(objects, index=None, before=None, after=None,
+                          progress=None, token=None):
+        """Copy the given `objects` into the adapted container.
+
+        This works like `IObjectBatchCopier.copyObjects`, but the objects
+        are copied a slice at a time, waiting between the slices.
+        """
+
+
 class IContainerItemRenamer(Interface):
 
     def renameItem(oldName, newName):
@@ -71,6 +172,117 @@ class IContainerItemRenamer(Interface):
         """
 
 
+class IContainerItemPatternRenamer(Interface):
+    """Rename all items of a container whose names match a pattern."""
+
+    def renameMatching(pattern, replacement, chunkSize=1000, commit=None,
+                       skipCollisions=False, progress=None, token=None):
+        """Rename the items whose names match the regular expression
+        `pattern` at their beginning.
+
+        The matched part of a name is replaced by `replacement`, which is
+        a template as for ``re.sub`` or a callable taking the match.
+
+        Items are renamed in chunks of `chunkSize`.  Collisions of the new
+        names with existing items or each other are detected for a whole
+        chunk before it is renamed; they raise a `DuplicationError` unless
+        `skipCollisions` is true, in which case the colliding items keep
+        their names.  If given, `commit` is called without arguments
+        after every chunk.
+
+        If given, `progress` is called with a
+        `zope.copypastemove.progress.Progress` after every chunk.  The
+        `zope.copypastemove.progress.CancellationToken` `token` is checked
+        before every item; `OperationCancelled` is raised if it was
+        cancelled.
+
+        Returns the number of renamed items.
+        """
+
+
+class IContainerItemReorderer(Interface):
+    """Change the position of items within an ordered container.
+
+    All methods raise `ItemNotFoundError` for names that are not in the
+    container and return ``True`` if the order changed, otherwise
+    ``False``.  Only the part of the order between the old and the new
+    positions is rewritten.
+    """
+
+    def moveToIndex(name, index):
+        """Move the item `name` to position `index`.
+
+        Negative indexes count from the end.
+        """
+
+    def moveBefore(name, anchor):
+        """Move the item `name` in front of the item `anchor`."""
+
+    def moveAfter(name, anchor):
+        """Move the item `name` behind the item `anchor`."""
+
+    def moveUp(name, delta=1):
+        """Move the item `name` `delta` positions towards the top."""
+
+    def moveDown(name, delta=1):
+        """Move the item `name` `delta` positions towards the bottom."""
+
+    def moveToTop(name):
+        """Move the item `name` to the top."""
+
+    def moveToBottom(name):
+        """Move the item `name` to the bottom."""
+
+    def moveItemsToIndex(names, index):
+        """Move the items `names` to position `index`, in the order given.
+
+        `index` is the position among the items that are not moved.
+        """
+
+    def moveItemsBefore(names, anchor):
+        """Move the items `names` in front of the item `anchor`."""
+
+    def moveItemsAfter(names, anchor):
+        """Move the items `names` behind the item `anchor`."""
+
+
+class ICopyPolicy(Interface):
+    """Decides whether objects are copied right away or later."""
+
+    def defer(obj):
+        """Return whether copying `obj` should be deferred."""
+
+    def reserved(target, name):
+        """Return whether `name` is reserved in `target` for a copy still
+        to be added."""
+
+    def chooseName(target, name, obj):
+        """Choose a name for `obj` in `target` based on `name`.
+
+        The name is chosen by the `zope.container.interfaces.INameChooser`
+        of `target`, which also finds the reserved names taken.
+        """
+
+    def submit(copier, target, name, position):
+        """Have `copier` copy its object to `target` as `name` later.
+
+        `position` is ``None`` or the `index`, `before` and `after`
+        arguments of `IOrderedObjectCopier.copyToPosition`.  `name` is
+        reserved until the copy is added or failed, failures are reported
+        by the policy.  Returns a `concurrent.futures.Future` of the name.
+        """
+
+
+class IShareable(Interface):
+    """Marker for objects that are shared rather than copied.
+
+    Immutable objects, like frozen vocabularies or lookup tables, can be
+    referenced by the copies of the objects using them instead of being
+    copied along with them.  Objects that are copied themselves are still
+    copied.
+    """
+
+
 class IPrincipalClipboard(Interface):
     """Interface for adapters that store/retrieve clipboard information
     for a principal.
@@ -99,3 +311,11 @@ class IItemNotFoundError(Interface):
 @implementer(IItemNotFoundError)
 class ItemNotFoundError(LookupError):
     pass
+
+
+class OperationCancelled(Exception):
+    """A long operation was cancelled using its cancellation token.
+
+    The changes made until then are still there, the transaction has to
+    be aborted to undo them.
+    """
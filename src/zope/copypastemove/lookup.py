@@ -0,0 +1,146 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Cached lookup of object movers and copiers
+
+Bulk operations adapt many objects of only a few classes.  Instead of
+going through the component registry for every object, the adapter
+factory is looked up once per class and set of provided interfaces and
+then reused until the registry changes.
+"""
+__docformat__ = 'restructuredtext'
+
+import weakref
+
+from zope.component import getSiteManager
+from zope.interface import providedBy
+
+from zope.copypastemove.interfaces import IObjectCopier
+from zope.copypastemove.interfaces import IObjectMover
+
+
+_marker = object()
+
+
+class AdapterFactoryCache:
+    """Adapts objects to `interface`, caching the adapter factories.
+
+    The factories are cached per adapter registry.  A cache is dropped when
+    the registry or one of its bases changes.
+
+      >>> from zope.component import getGlobalSiteManager
+      >>> from zope.interface import Interface
+      >>> from zope.interface import implementer
+      >>> class IThing(Interface):
+      ...     pass
+      >>> class IFrob(Interface):
+      ...     pass
+      >>> @implementer(IThing)
+      ... class Thing(object):
+      ...     pass
+
+      >>> calls = []
+      >>> def frob(thing):
+      ...     calls.append(thing)
+      ...     return 'frobbed'
+
+      >>> cache = AdapterFactoryCache(IFrob)
+      >>> cache(Thing())
+      Traceback (most recent call last):
+      ...
+      TypeError: ('Could not adapt', ...)
+      >>> cache(Thing(), 'default')
+      'default'
+
+      >>> gsm = getGlobalSiteManager()
+      >>> gsm.registerAdapter(frob, (IThing, ), IFrob)
+      >>> cache(Thing())
+      'frobbed'
+      >>> cache(Thing())
+      'frobbed'
+      >>> len(calls)
+      2
+
+    Registering a different adapter invalidates the cache:
+
+      >>> gsm.registerAdapter(lambda thing: 'refrobbed', (IThing, ), IFrob)
+      >>> cache(Thing())
+      'refrobbed'
+
+    Objects that already provide the interface are returned as they are:
+
+      >>> frobbed = Thing()
+      >>> from zope.interface import alsoProvides
+      >>> alsoProvides(frobbed, IFrob)
+      >>> cache(frobbed) is frobbed
+      True
+
+    Unlike calling the interface, ``__conform__`` methods of the objects
+    are not consulted.
+    """
+
+    def __init__(self, interface):
+        self.interface = interface
+        self._caches = weakref.WeakKeyDictionary()
+
+    def __call__(self, obj, default=_marker):
+        interface = self.interface
+        if interface.providedBy(obj):
+            return obj
+        adapters = getSiteManager().adapters
+        generations = [registry._generation for registry in adapters.ro]
+        try:
+            cached, factories = self._caches[adapters]
+        except KeyError:
+            cached = None
+        if cached != generations:
+            factories = {}
+            self._caches[adapters] = (generations, factories)
+
+        spec = providedBy(obj)
+        key = (type(obj), spec)
+        try:
+            factory = factories[key]
+        except KeyError:
+            factory = factories[key] = adapters.lookup((spec, ), interface)
+
+        adapted = factory(obj) if factory is not None else None
+        if adapted is None:
+            if default is not _marker:
+                return default
+            raise TypeError('Could not adapt', obj, interface)
+        return adapted
+
+    def clear(self):
+        self._caches.clear()
+
+
+#: Returns the `IObjectMover` of an object.
+getObjectMover = AdapterFactoryCache(IObjectMover)
+
+#: Returns the `IObjectCopier` of an object.
+getObjectCopier = AdapterFactoryCache(IObjectCopier)
+
+
+def _clear():
+    getObjectMover.clear()
+    getObjectCopier.clear()
+
+
+try:
+    from zope.testing.cleanup import addCleanUp
+except ModuleNotFoundError:  # pragma: no cover
+    pass
+else:
+    addCleanUp(_clear)
+    del addCleanUp
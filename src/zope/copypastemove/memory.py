@@ -0,0 +1,144 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Measuring the memory used by copies
+
+A `MemoryProfiler` measures the memory allocated by the operations run
+within it, using `tracemalloc`.  It reports the peak, the memory allocated
+in every phase of the operations (see `zope.copypastemove.instrumentation`)
+and the number of objects copied:
+
+  >>> from zope.container.contained import Contained
+  >>> from zope.container.sample import SampleContainer
+  >>> from zope.copypastemove import ObjectCopier
+  >>> source = SampleContainer()
+  >>> source['data'] = data = Contained()
+  >>> data.values = [str(i) * 100 for i in range(1000)]
+  >>> with MemoryProfiler() as profiler:
+  ...     ObjectCopier(data).copyTo(SampleContainer())
+  'data'
+  >>> profiler.objects > 1000
+  True
+  >>> profiler.peak > 100 * 1000
+  True
+  >>> count, allocated, peak = profiler.phases['clone', 'unpickle']
+  >>> count, allocated > 100 * 1000, peak >= allocated
+  (1, True, True)
+
+The phases of interest for copies are ``('clone', 'pickle')`` and
+``('clone', 'unpickle')``, ``('copyTo', 'notify')`` for the events and
+``('copyTo', 'setitem')`` for adding the copy.
+
+Tracing memory allocations makes Python several times slower, the profiler
+is meant for finding out what copies need, not to be used all the time.
+The memory is that of the whole process, the phases are only recorded for
+the thread using the profiler.
+"""
+__docformat__ = 'restructuredtext'
+
+import threading
+import tracemalloc
+
+from zope.copypastemove.instrumentation import addPhaseHook
+from zope.copypastemove.instrumentation import removePhaseHook
+from zope.copypastemove.progress import Operation
+from zope.copypastemove.progress import currentOperation
+from zope.copypastemove.progress import running
+
+
+class _Frame:
+    # A running phase.
+
+    __slots__ = ('current', 'peak')
+
+    def __init__(self, current):
+        self.current = current
+        self.peak = current
+
+
+class MemoryProfiler:
+    """Measures the memory allocated by the operations run within it.
+
+    Used as a context manager, the profiler starts tracing memory
+    allocations, unless they are traced already.  When the block is done,
+
+    - `peak` is the largest amount of memory in bytes allocated since the
+      start,
+
+    - `allocated` the amount of memory allocated at the end,
+
+    - `phases` maps the ``(operation, phase)`` of every phase to the
+      number of times it ran, the memory it allocated in total and its
+      peak, in bytes above the memory allocated when the phase started,
+
+    - `objects` is the number of objects copied, as counted by the
+      picklers.
+    """
+
+    def __init__(self):
+        self.peak = self.allocated = self.objects = 0
+        self.phases = {}
+        self._stack = []
+        self._thread = None
+        self._operation = None
+
+    def __enter__(self):
+        self._tracing = tracemalloc.is_tracing()
+        if not self._tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._start = tracemalloc.get_traced_memory()[0]
+        self._frames = [_Frame(self._start)]
+        self._thread = threading.get_ident()
+        addPhaseHook(self._ended, self._started)
+        self._operation = Operation(parent=currentOperation())
+        self._operation.countObjects = True
+        self._running = running(self._operation)
+        self._running.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._running.__exit__(*exc_info)
+        removePhaseHook(self._ended)
+        current = self._measure()
+        if not self._tracing:
+            tracemalloc.stop()
+        self.peak = self._frames[0].peak - self._start
+        self.allocated = current - self._start
+        self.objects = self._operation.objects
+        self._thread = None
+
+    def _measure(self):
+        # Record the peak since the last measurement for all running
+        # phases and return the memory allocated now.
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for frame in self._frames:
+            frame.peak = max(frame.peak, peak)
+        return current
+
+    def _started(self, operation, phase):
+        if threading.get_ident() != self._thread:
+            return
+        self._frames.append(_Frame(self._measure()))
+
+    def _ended(self, operation, phase, seconds):
+        if threading.get_ident() != self._thread:
+            return
+        current = self._measure()
+        frame = self._frames.pop()
+        key = operation, phase
+        count, allocated, peak = self.phases.get(key, (0, 0, 0))
+        self.phases[key] = (count + 1,
+                            allocated + current - frame.current,
+                            max(peak, frame.peak - frame.current))
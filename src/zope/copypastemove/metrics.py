@@ -0,0 +1,254 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Metrics of moves, copies and renames
+
+The movers, copiers, renamers and the principal clipboard of this package
+report their operations to the `MetricsRegistry` set with
+`setMetricsRegistry`.  It counts the operations, their errors, the name
+collisions resolved by name choosers and the moves and copies refused by
+container constraints, and keeps histograms of the latencies of the
+operations and of the number of items of batch operations.  Without a
+registry, nothing is measured.
+
+  >>> from zope.container.contained import Contained
+  >>> from zope.container.sample import SampleContainer
+  >>> from zope.copypastemove import ObjectCopier
+  >>> container = SampleContainer()
+  >>> container['a'] = Contained()
+  >>> registry = MetricsRegistry()
+  >>> setMetricsRegistry(registry)
+  >>> ObjectCopier(container['a']).copyTo(container)
+  'a-2'
+  >>> registry.counters
+  {'chooseName': 1, 'chooseName.collisions': 1, 'copyTo': 1}
+  >>> registry.histograms['copyTo.seconds'].count
+  1
+  >>> setMetricsRegistry(None)
+
+Given a file name, the registry also writes a JSON object per operation
+to it, one per line, with the `time` it ended, the `operation`, the
+`seconds` it took, the number of `items` for batch operations and the
+class name of the `error` it raised.
+"""
+__docformat__ = 'restructuredtext'
+
+import bisect
+import functools
+import json
+import threading
+import time
+from time import perf_counter
+
+
+#: Histogram bounds for latencies, from 100 microseconds to 100 seconds.
+LATENCY_BOUNDS = tuple(0.0001 * 2 ** i for i in range(21))
+
+#: Histogram bounds for the number of items of batch operations.
+ITEMS_BOUNDS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000,
+                10000, 20000, 50000, 100000)
+
+
+class Histogram:
+    """Counts values in buckets.
+
+    ``counts[i]`` is the number of values not larger than ``bounds[i]``
+    and larger than the bound before, the last count is that of the values
+    larger than all bounds.
+
+      >>> histogram = Histogram((1, 10, 100))
+      >>> for value in (0.5, 3, 7, 50, 1000):
+      ...     histogram.observe(value)
+      >>> histogram.counts, histogram.count, histogram.sum
+      ([1, 2, 1, 1], 5, 1060.5)
+      >>> histogram.quantile(0.5)
+      10
+      >>> histogram.quantile(1) is None
+      True
+    """
+
+    def __init__(self, bounds):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Return the bound below which at least a fraction `q` of the
+        values are, or ``None`` if that's beyond all bounds."""
+        wanted = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= wanted:
+                return bound
+        return None
+
+    def asDict(self):
+        return {'bounds': list(self.bounds), 'counts': list(self.counts),
+                'count': self.count, 'sum': self.sum}
+
+
+class MetricsRegistry:
+    """Collects the metrics of operations.
+
+    If a `path` is given, a JSON object per operation is appended to the
+    file.  Writes are buffered, `close` the registry to be sure they are
+    written.
+    """
+
+    def __init__(self, path=None):
+        self.counters = {}
+        self.histograms = {}
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+        self._trace = None
+        if path is not None:
+            self._trace = open(path, 'a', encoding='utf-8')
+
+    def count(self, name, amount=1):
+        """Add `amount` to the counter `name`."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def _observe(self, name, bounds, value):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram(bounds)
+        histogram.observe(value)
+
+    def record(self, operation, seconds, items=None, error=None):
+        """Record an `operation` that took `seconds`."""
+        counters = self.counters
+        with self._lock:
+            counters[operation] = counters.get(operation, 0) + 1
+            if error is not None:
+                name = operation + '.errors'
+                counters[name] = counters.get(name, 0) + 1
+            self._observe(operation + '.seconds', LATENCY_BOUNDS, seconds)
+            if items is not None:
+                self._observe(operation + '.items', ITEMS_BOUNDS, items)
+            if self._trace is not None:
+                self._trace.write(json.dumps({
+                    'time': time.time(),
+                    'operation': operation,
+                    'seconds': seconds,
+                    'items': items,
+                    'error': None if error is None else type(error).__name__,
+                }) + '\n')
+
+    def rate(self, operation):
+        """Return the number of `operation` per second since the registry
+        was created."""
+        elapsed = time.monotonic() - self.started
+        return self.counters.get(operation, 0) / elapsed if elapsed else 0.0
+
+    def snapshot(self):
+        """Return all metrics as data that can be serialized as JSON."""
+        with self._lock:
+            return {
+                'seconds': time.monotonic() - self.started,
+                'counters': dict(self.counters),
+                'histograms': {name: histogram.asDict()
+                               for name, histogram
+                               in self.histograms.items()},
+            }
+
+    def flush(self):
+        """Write the buffered operations to the file."""
+        if self._trace is not None:
+            with self._lock:
+                self._trace.flush()
+
+    def close(self):
+        """Close the file."""
+        if self._trace is not None:
+            with self._lock:
+                self._trace.close()
+                self._trace = None
+
+
+_registry = None
+
+
+def setMetricsRegistry(registry):
+    """Report the operations to `registry`, or to none if ``None``."""
+    global _registry
+    _registry = registry
+
+
+def getMetricsRegistry():
+    """Return the registry operations are reported to, or ``None``."""
+    return _registry
+
+
+def metered(operation, items=None):
+    """Decorate a method to be recorded as `operation`.
+
+    `items`, if given, returns the number of items handled given the
+    result of the method.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kw):
+            registry = _registry
+            if registry is None:
+                return func(*args, **kw)
+            started = perf_counter()
+            try:
+                result = func(*args, **kw)
+            except BaseException as error:
+                registry.record(operation, perf_counter() - started,
+                                None if items is None else 0, error)
+                raise
+            registry.record(operation, perf_counter() - started,
+                            None if items is None else items(result))
+            return result
+        return wrapper
+    return decorator
+
+
+def nameChosen(name, chosen):
+    """Count a name chosen by a name chooser for the requested `name`."""
+    registry = _registry
+    if registry is not None:
+        registry.count('chooseName')
+        if chosen != name:
+            registry.count('chooseName.collisions')
+
+
+def constraintChecked(check, allowed):
+    """Count a `check` of container constraints and whether it failed."""
+    registry = _registry
+    if registry is not None:
+        registry.count(check)
+        if not allowed:
+            registry.count(check + '.rejections')
+
+
+def _clear():
+    setMetricsRegistry(None)
+
+
+try:
+    from zope.testing.cleanup import addCleanUp
+except ModuleNotFoundError:  # pragma: no cover
+    pass
+else:
+    addCleanUp(_clear)
+    del addCleanUp
@@ -0,0 +1,230 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Order manipulation for ordered containers
+
+`placeKeys` moves a group of keys of an `IOrderedContainer` to a new
+position.  Plain `OrderedContainer` instances get their order list edited
+in place, touching only the part of the order between the old and the new
+positions; other implementations fall back to ``updateOrder``.
+
+`insertionOrder` tells batch operations in which order to add objects to
+a container.
+"""
+__docformat__ = 'restructuredtext'
+
+import sys
+
+from zope.container.interfaces import IBTreeContainer
+from zope.container.interfaces import IOrderedContainer
+
+from zope.copypastemove.interfaces import ItemNotFoundError
+
+
+def _orderList(container):
+    # Only unproxied OrderedContainer instances, including subclasses not
+    # overriding ``updateOrder``, let us edit the order list directly.  The
+    # method is looked up on ``type`` so that security proxies take the
+    # ``updateOrder`` path.  There are no instances before
+    # `zope.container.ordered` is imported, which isn't done here as it
+    # takes long.
+    ordered = sys.modules.get('zope.container.ordered')
+    if ordered is not None and (
+            getattr(type(container), 'updateOrder', None)
+            is ordered.OrderedContainer.updateOrder):
+        return container._order
+    return None
+
+
+def _positions(container, order, names):
+    if len(names) == 1:
+        try:
+            return [order.index(names[0])]
+        except ValueError:
+            raise ItemNotFoundError(container, names[0])
+    lookup = {key: i for i, key in enumerate(order)}
+    positions = []
+    for name in names:
+        try:
+            positions.append(lookup[name])
+        except KeyError:
+            raise ItemNotFoundError(container, name)
+    return positions
+
+
+def _unique(names):
+    seen = set()
+    return [name for name in names
+            if not (name in seen or seen.add(name))]
+
+
+def keyPosition(container, name):
+    """Return the position of `name` in the order of `container`.
+
+    Raises an `ItemNotFoundError` if there is no such item.
+    """
+    data = _orderList(container)
+    order = data if data is not None else list(container.keys())
+    return _positions(container, order, [name])[0]
+
+
+def placeKeys(container, names, index=None, before=None, after=None):
+    """Move the keys `names` of the ordered `container` to a new position.
+
+    The keys end up next to each other, in the order given.  The position
+    is given by one of:
+
+    - `index`, the position among the keys that are *not* moved.  Negative
+      values count from the end, as with ``list.insert``.
+
+    - `before` or `after`, the name of a key that is not moved.
+
+    Without any of them the keys are moved to the end.
+
+    Returns ``True`` if the order changed, otherwise ``False``.
+
+      >>> from zope.container.ordered import OrderedContainer
+      >>> container = OrderedContainer()
+      >>> for name in 'abcdef':
+      ...     container[name] = name.upper()
+
+      >>> placeKeys(container, ['e', 'b'], index=1)
+      True
+      >>> ''.join(container.keys())
+      'aebcdf'
+      >>> placeKeys(container, ['a'], after='f')
+      True
+      >>> ''.join(container.keys())
+      'ebcdfa'
+      >>> placeKeys(container, ['c', 'd'], before='e')
+      True
+      >>> ''.join(container.keys())
+      'cdebfa'
+      >>> placeKeys(container, ['c', 'd'], index=0)
+      False
+
+    Unknown names raise an `ItemNotFoundError`:
+
+      >>> placeKeys(container, ['x'])  # doctest: +ELLIPSIS
+      Traceback (most recent call last):
+      ItemNotFoundError: (<...OrderedContainer...>, 'x')
+
+    and the anchor may not be one of the moved keys:
+
+      >>> placeKeys(container, ['c', 'd'], before='d')
+      Traceback (most recent call last):
+      ValueError: Cannot place items relative to a moved item: 'd'
+
+    """
+    names = _unique(names)
+    if not names:
+        return False
+    if (index is not None) + (before is not None) + (after is not None) > 1:
+        raise TypeError("Only one of index, before and after may be given.")
+    anchor = before if before is not None else after
+    if anchor is not None and anchor in names:
+        raise ValueError(
+            "Cannot place items relative to a moved item: %r" % (anchor,))
+
+    data = _orderList(container)
+    order = data if data is not None else list(container.keys())
+    moved = sorted(_positions(container, order, names))
+    remaining = len(order) - len(moved)
+
+    # Find `q`, the position in the current order in front of which the
+    # keys are to be inserted.
+    if anchor is not None:
+        q = _positions(container, order, [anchor])[0]
+        if after is not None:
+            q += 1
+    else:
+        if index is None:
+            index = remaining
+        elif index < 0:
+            index = max(remaining + index, 0)
+        index = min(index, remaining)
+        if index == remaining:
+            q = len(order)
+        else:
+            # Skip over the moved keys to find the `index`-th remaining key.
+            q = index
+            for position in moved:
+                if position > q:
+                    break
+                q += 1
+
+    lo = min(moved[0], q)
+    hi = max(moved[-1] + 1, q)
+    segment = order[lo:hi]
+    moving = set(names)
+    kept = [key for key in segment if key not in moving]
+    insert = (q - lo) - len([p for p in moved if p < q])
+    new = kept[:insert] + names + kept[insert:]
+    if new == segment:
+        return False
+
+    if data is not None:
+        data[lo:hi] = new
+        from zope.container.contained import notifyContainerModified
+        notifyContainerModified(container)
+    else:
+        order[lo:hi] = new
+        container.updateOrder(order)
+    return True
+
+
+def placeInTarget(target, names, index=None, before=None, after=None):
+    """Place `names` in `target` if it is an ordered container.
+
+    This is a no-op for unordered targets and when no position is given.
+    Returns ``True`` if the order changed.
+    """
+    if index is None and before is None and after is None:
+        return False
+    if not IOrderedContainer.providedBy(target):
+        return False
+    return placeKeys(target, names, index, before, after)
+
+
+def _name(item):
+    return item[1].__name__ or ''
+
+
+def insertionOrder(target, objects):
+    """Return the ``(index, object)`` pairs of `objects` in the order they
+    are best added to `target`.
+
+    BTree containers get the objects sorted by name, so that consecutive
+    insertions go to the same bucket instead of splitting and dirtying
+    buckets all over the tree.  As objects usually keep their names, they
+    are removed from their BTree sources in key order as well:
+
+      >>> from zope.container.btree import BTreeContainer
+      >>> from zope.location.location import Location
+      >>> objects = [Location(), Location(), Location()]
+      >>> for obj, name in zip(objects, ('b', 'c', 'a')):
+      ...     obj.__name__ = name
+      >>> [(i, obj.__name__)
+      ...  for i, obj in insertionOrder(BTreeContainer(), objects)]
+      [(2, 'a'), (0, 'b'), (1, 'c')]
+
+    Other containers get the objects in the order given:
+
+      >>> from zope.container.ordered import OrderedContainer
+      >>> [(i, obj.__name__)
+      ...  for i, obj in insertionOrder(OrderedContainer(), objects)]
+      [(0, 'b'), (1, 'c'), (2, 'a')]
+    """
+    if IBTreeContainer.providedBy(target):
+        return sorted(enumerate(objects), key=_name)
+    return enumerate(objects)
@@ -0,0 +1,171 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Attributing the time spent in event subscribers
+
+Events sent when copying or moving objects reach their subscribers through
+``zope.component``, and through the dispatchers sending them on to the
+sublocations of the objects.  A profiler shows all of this as a single
+call.  A `SubscriberProfiler` takes over the dispatch of events in its
+thread and records the calls and time of every subscriber, per event type
+and per sublocation depth:
+
+  >>> from zope.component import provideHandler
+  >>> from zope.container.contained import Contained
+  >>> from zope.container.sample import SampleContainer
+  >>> from zope.event import notify
+  >>> from zope.lifecycleevent import ObjectCopiedEvent
+  >>> from zope.lifecycleevent.interfaces import IObjectCopiedEvent
+  >>> from zope.copypastemove import dispatchToSublocations
+  >>> def indexCopy(obj, event):
+  ...     pass
+  >>> provideHandler(indexCopy, (None, IObjectCopiedEvent))
+  >>> provideHandler(dispatchToSublocations, (None, IObjectCopiedEvent))
+
+  >>> folder = SampleContainer()
+  >>> folder['a'] = Contained()
+  >>> folder['b'] = Contained()
+  >>> with SubscriberProfiler() as profiler:
+  ...     notify(ObjectCopiedEvent(folder, None))
+  >>> for key, (calls, seconds) in sorted(profiler.stats.items(),
+  ...                                     key=lambda item: item[0].depth):
+  ...     print(key.subscriber.__name__, key.event.__name__, key.depth, calls)
+  indexCopy ObjectCopiedEvent 0 1
+  indexCopy ObjectCopiedEvent 1 2
+
+`report` ranks the subscribers by the time spent in them.
+"""
+__docformat__ = 'restructuredtext'
+
+import threading
+from collections import namedtuple
+from time import perf_counter
+
+import zope.component.event
+import zope.event
+from zope.location.interfaces import ISublocations
+
+from zope.copypastemove import dispatching
+from zope.copypastemove.progress import checkpoint
+
+
+#: The subscribers of a profile are recorded by these keys.
+SubscriberKey = namedtuple('SubscriberKey', ['subscriber', 'event', 'depth'])
+
+
+def _name(obj):
+    module = getattr(obj, '__module__', None)
+    name = getattr(obj, '__qualname__', None) or repr(obj)
+    if module:
+        return '{}.{}'.format(module, name)
+    return name
+
+
+class SubscriberProfiler:
+    """Records the calls and time of event subscribers.
+
+    Used as a context manager, the profiler dispatches the events notified
+    in its thread while the block runs.  `stats` maps a `SubscriberKey` to
+    the number of calls and the total seconds of the subscriber.  The
+    subscribers dispatching object events and the events of locations to
+    their sublocations are not recorded themselves, the subscribers they
+    call are recorded instead, one level deeper for sublocations.
+
+    Only one profiler can be used at a time.
+    """
+
+    #: Subscribers sending an event on to the sublocations of its object.
+    sublocationDispatchers = dispatching.sublocationDispatchers
+
+    def __init__(self):
+        self.stats = {}
+        self._thread = None
+        self._depth = 0
+
+    def __enter__(self):
+        subscribers = zope.event.subscribers
+        if zope.component.event.dispatch not in subscribers:
+            raise ValueError(
+                'Events are not dispatched by zope.component.')
+        self._thread = threading.get_ident()
+        subscribers[subscribers.index(zope.component.event.dispatch)] = (
+            self._dispatch)
+        return self
+
+    def __exit__(self, *exc_info):
+        subscribers = zope.event.subscribers
+        subscribers[subscribers.index(self._dispatch)] = (
+            zope.component.event.dispatch)
+        self._thread = None
+
+    def _dispatch(self, *event):
+        if threading.get_ident() != self._thread:
+            return zope.component.event.dispatch(*event)
+        self._handle(event)
+
+    def _handle(self, objects):
+        # Like ``zope.component.handle``, expanding the dispatchers.
+        dispatching.handle(objects, self._call, self._sublocations,
+                           self.sublocationDispatchers)
+
+    def _sublocations(self, obj, event):
+        subs = ISublocations(obj, None)
+        if subs is None:
+            return
+        self._depth += 1
+        try:
+            for sub in subs.sublocations():
+                checkpoint()
+                self._handle((sub, event))
+        finally:
+            self._depth -= 1
+
+    def _call(self, subscriber, objects):
+        started = perf_counter()
+        try:
+            subscriber(*objects)
+        finally:
+            seconds = perf_counter() - started
+            key = SubscriberKey(subscriber, type(objects[-1]), self._depth)
+            calls, total = self.stats.get(key, (0, 0.0))
+            self.stats[key] = calls + 1, total + seconds
+
+    def totals(self, *fields):
+        """Return the calls and seconds summed up by some of the `fields`
+        of `SubscriberKey`.
+
+        The result maps tuples of the values of the fields to the number
+        of calls and the seconds.
+        """
+        result = {}
+        for key, (calls, seconds) in self.stats.items():
+            group = tuple(getattr(key, field) for field in fields)
+            groupCalls, groupSeconds = result.get(group, (0, 0.0))
+            result[group] = groupCalls + calls, groupSeconds + seconds
+        return result
+
+    def report(self, limit=None, by=('subscriber', )):
+        """Return a report ranking the subscribers by their time.
+
+        The time is summed up by the `fields` of `SubscriberKey` given as
+        `by`, and only the `limit` most expensive entries are listed.
+        """
+        ranked = sorted(self.totals(*by).items(),
+                        key=lambda item: item[1][1], reverse=True)
+        lines = ['{:>10} {:>8}  {}'.format('seconds', 'calls', ' '.join(by))]
+        for group, (calls, seconds) in ranked[:limit]:
+            names = [value if field == 'depth' else _name(value)
+                     for field, value in zip(by, group)]
+            lines.append('{:10.6f} {:8d}  {}'.format(
+                seconds, calls, ' '.join(map(str, names))))
+        return '\n'.join(lines)
@@ -0,0 +1,193 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Progress reports and cancellation of long operations
+
+Moving, copying and renaming many objects runs within an `operation`.
+The operation reports its progress to a callback and checks a
+`CancellationToken` between items, and while copying, between the
+sublocations of the copied objects.  A cancelled token raises
+`zope.copypastemove.interfaces.OperationCancelled` at the next of these
+points; the transaction has to be aborted then.
+
+The current operation is kept per thread, so copies made by the adapters
+of this package within an operation take part in it:
+
+  >>> reports = []
+  >>> token = CancellationToken()
+  >>> with operation(reports.append, token) as op:
+  ...     op.copied(100)
+  ...     op.done()
+  ...     token.cancel()
+  ...     checkpoint()
+  Traceback (most recent call last):
+  ...
+  zope.copypastemove.interfaces.OperationCancelled
+  >>> [(report.items, report.bytes) for report in reports]
+  [(0, 100), (1, 100)]
+  >>> currentOperation() is None
+  True
+"""
+__docformat__ = 'restructuredtext'
+
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+from zope.copypastemove.interfaces import OperationCancelled
+
+
+#: The progress of an operation: the number of `items` done, the `bytes`
+#: pickled for copies and the seconds `elapsed` since it started.
+Progress = namedtuple('Progress', ['items', 'bytes', 'elapsed'])
+
+
+class CancellationToken:
+    """Cancels the operations it is passed to, from any thread.
+
+      >>> token = CancellationToken()
+      >>> token.cancelled
+      False
+      >>> token.check()
+      >>> token.cancel()
+      >>> token.cancelled
+      True
+      >>> token.check()
+      Traceback (most recent call last):
+      ...
+      zope.copypastemove.interfaces.OperationCancelled
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        """Cancel the operations at their next check."""
+        self._event.set()
+
+    def check(self):
+        """Raise `OperationCancelled` if cancelled."""
+        if self._event.is_set():
+            raise OperationCancelled
+
+
+class Operation:
+    """The state of a running operation.
+
+    An operation started within another one is checked and counts the
+    bytes copied for both.
+    """
+
+    #: Whether the objects copied are counted, which takes extra time.
+    countObjects = False
+
+    def __init__(self, progress=None, token=None, parent=None):
+        self.progress = progress
+        self.token = token
+        self.parent = parent
+        self.items = 0
+        self.bytes = 0
+        self.objects = 0
+        self.started = time.monotonic()
+
+    def check(self):
+        """Raise `OperationCancelled` if the operation was cancelled."""
+        if self.token is not None:
+            self.token.check()
+        if self.parent is not None:
+            self.parent.check()
+
+    def done(self, items=1):
+        """Count `items` as done and report the progress."""
+        self.items += items
+        self.report()
+
+    def copied(self, size, objects=0):
+        """Count `size` bytes and `objects` as copied and report the
+        progress."""
+        self.bytes += size
+        self.objects += objects
+        self.report()
+        if self.parent is not None:
+            self.parent.copied(size, objects)
+
+    def countsObjects(self):
+        """Return whether this operation or one it is part of counts the
+        objects copied."""
+        op = self
+        while op is not None:
+            if op.countObjects:
+                return True
+            op = op.parent
+        return False
+
+    def report(self):
+        if self.progress is not None:
+            self.progress(Progress(self.items, self.bytes,
+                                   time.monotonic() - self.started))
+
+
+_local = threading.local()
+
+
+def currentOperation():
+    """Return the operation running in this thread, or ``None``."""
+    return getattr(_local, 'operation', None)
+
+
+@contextmanager
+def running(op):
+    """Make `op` the current operation of this thread, for instance of a
+    thread working for it.
+    """
+    previous = currentOperation()
+    _local.operation = op
+    try:
+        yield op
+    finally:
+        _local.operation = previous
+
+
+def operation(progress=None, token=None):
+    """Run an operation reporting to `progress` and cancelled by `token`.
+
+    This is a context manager returning the `Operation`.  `progress` is
+    called with a `Progress` whenever items are done or data is copied.
+    """
+    return running(Operation(progress, token, currentOperation()))
+
+
+def checkpoint():
+    """Raise `OperationCancelled` if the current operation was cancelled."""
+    op = currentOperation()
+    if op is not None:
+        op.check()
+
+
+def copied(size, memo=None):
+    """Count `size` bytes as copied by the current operation.
+
+    If the operation counts objects, they are counted by `memo`, a
+    function returning the memo of the pickler or unpickler.
+    """
+    op = currentOperation()
+    if op is not None:
+        objects = 0
+        if memo is not None and op.countsObjects():
+            objects = len(memo())
+        op.copied(size, objects)
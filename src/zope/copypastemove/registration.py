@@ -0,0 +1,79 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Registration without ZCML
+
+`register` registers the adapters and the subscriber of
+``configure.zcml`` in a site manager, without loading the ZCML machinery
+or the security declarations:
+
+  >>> from zope.component import getGlobalSiteManager
+  >>> from zope.container.contained import Contained
+  >>> from zope.copypastemove.interfaces import IObjectMover
+  >>> register(getGlobalSiteManager())
+  >>> IObjectMover(Contained())
+  <zope.copypastemove.ObjectMover object at ...>
+
+Unlike those of ``configure.zcml``, the adapters aren't protected by the
+``zope.ManageContent`` permission and the batch movers and copiers are
+those of `zope.copypastemove`, not the trusted ones: this is meant for
+code that doesn't use security proxies, like scripts and tests.
+"""
+__docformat__ = 'restructuredtext'
+
+from zope.component import getSiteManager
+from zope.lifecycleevent.interfaces import IObjectCopiedEvent
+from zope.location.interfaces import ILocation
+
+from zope.copypastemove import ContainerItemRenamer
+from zope.copypastemove import ObjectBatchCopier
+from zope.copypastemove import ObjectBatchMover
+from zope.copypastemove import ObjectCopier
+from zope.copypastemove import ObjectMover
+from zope.copypastemove import OrderedContainerItemRenamer
+from zope.copypastemove import OrderedContainerItemReorderer
+from zope.copypastemove import PrincipalClipboard
+from zope.copypastemove import dispatchToSublocations
+from zope.copypastemove.cloning import shareableCopyHook
+from zope.copypastemove.renaming import ContainerItemPatternRenamer
+
+
+ADAPTERS = (
+    ObjectMover,
+    ObjectCopier,
+    ObjectBatchMover,
+    ObjectBatchCopier,
+    ContainerItemRenamer,
+    OrderedContainerItemRenamer,
+    ContainerItemPatternRenamer,
+    OrderedContainerItemReorderer,
+    shareableCopyHook,
+    PrincipalClipboard,
+)
+
+
+def register(site_manager=None):
+    """Register the adapters and the subscriber of this package in
+    `site_manager`, by default the current one."""
+    if site_manager is None:
+        site_manager = getSiteManager()
+    for factory in ADAPTERS:
+        site_manager.registerAdapter(factory)
+    try:
+        from zope.copypastemove.blobs import BlobCopyHook
+    except ModuleNotFoundError:  # pragma: no cover
+        pass
+    else:
+        site_manager.registerAdapter(BlobCopyHook)
+    site_manager.registerHandler(
+        dispatchToSublocations, (ILocation, IObjectCopiedEvent))
@@ -0,0 +1,145 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Moves that don't load the contents of the moved objects
+
+`IObjectMover` sends the `IObjectMovedEvent` of an object on to all its
+sublocations, which loads every object of a moved subtree from the
+database.  `moveItems` moves items given by their container and name,
+changes only their ``__parent__`` and ``__name__`` and notifies their
+move without sending it on to sublocations:
+
+  >>> from zope.component.eventtesting import clearEvents
+  >>> from zope.component.eventtesting import getEvents
+  >>> from zope.container.btree import BTreeContainer
+  >>> from zope.container.contained import Contained
+  >>> from zope.lifecycleevent.interfaces import IObjectMovedEvent
+  >>> source, target = BTreeContainer(), BTreeContainer()
+  >>> source['a'] = BTreeContainer()
+  >>> source['a']['x'] = Contained()
+  >>> source['b'] = Contained()
+  >>> target['b'] = Contained()
+  >>> clearEvents()
+  >>> moveItems([(source, 'b'), (source, 'a')], target)
+  ['b-2', 'a']
+  >>> list(source), list(target)
+  ([], ['a', 'b', 'b-2'])
+  >>> [(event.oldName, event.newName)
+  ...  for event in getEvents(IObjectMovedEvent)]
+  [('a', 'a'), ('b', 'b-2')]
+
+Only the moved objects themselves are loaded, as their ``__parent__``
+and ``__name__`` are part of their state, so the cost of a move is
+proportional to the number of items, not to the size of their contents.
+This is meant for trusted code, no permission is checked, and for
+subscribers that don't need to see the move of every object of a
+subtree.  Use `IObjectBatchMover` otherwise.
+"""
+__docformat__ = 'restructuredtext'
+
+import zope.component.event
+import zope.event
+from zope.container.constraints import checkObject
+from zope.container.contained import notifyContainerModified
+from zope.container.interfaces import IBTreeContainer
+from zope.container.interfaces import INameChooser
+from zope.lifecycleevent import ObjectMovedEvent
+
+from zope.copypastemove import _database
+from zope.copypastemove.dispatching import handle
+from zope.copypastemove.lookup import getObjectMover
+from zope.copypastemove.metrics import metered
+from zope.copypastemove.metrics import nameChosen
+from zope.copypastemove.ordering import placeInTarget
+from zope.copypastemove.progress import operation
+
+
+def notifyShallow(event):
+    """Notify `event` like ``zope.event.notify`` does, without sending it
+    on to the sublocations of its object."""
+    for subscriber in zope.event.subscribers:
+        if subscriber is zope.component.event.dispatch:
+            handle((event, ), _call)
+        else:
+            subscriber(event)
+
+
+def _call(subscriber, objects):
+    subscriber(*objects)
+
+
+def _items(target, items):
+    # BTree targets get the items sorted by name, see `insertionOrder`.
+    # The names are those of the sources, reading ``__name__`` would load
+    # the objects.
+    if IBTreeContainer.providedBy(target):
+        return sorted(enumerate(items), key=lambda item: item[1][1])
+    return enumerate(items)
+
+
+def _move(container, name, target):
+    # Return the new name of the item, or ``None`` if it stays.
+    obj = container[name]
+    checkObject(target, name, obj)
+    if target is container:
+        return None
+    new_name = INameChooser(target).chooseName(name, obj)
+    nameChosen(name, new_name)
+    source, destination = _database(container), _database(target)
+    if source is not None and destination not in (None, source):
+        # The object has to be copied to the other database anyway.
+        return getObjectMover(obj).moveTo(target, new_name)
+
+    # With ``__parent__`` and ``__name__`` already set, the container
+    # only stores the object, and removing it from its source only
+    # notifies the source as modified.
+    obj.__parent__ = target
+    obj.__name__ = new_name
+    try:
+        target[new_name] = obj
+    except BaseException:
+        obj.__parent__ = container
+        obj.__name__ = name
+        raise
+    del container[name]
+    notifyShallow(ObjectMovedEvent(obj, container, name, target, new_name))
+    return new_name
+
+
+@metered('moveItems', len)
+def moveItems(items, target, index=None, before=None, after=None,
+              progress=None, token=None):
+    """Move `items`, ``(container, name)`` pairs, to `target`.
+
+    Returns the names of the items in `target`, in the order given.
+    Items already in `target` stay there under their name.  The other
+    arguments are those of `IObjectBatchMover.moveObjects`.
+    """
+    # Moving changes the source containers, which `items` may be
+    # computed from.
+    items = list(items)
+    names = {}
+    moved = False
+    with operation(progress, token) as op:
+        for i, (container, name) in _items(target, items):
+            op.check()
+            new_name = _move(container, name, target)
+            if new_name is not None:
+                moved = True
+            names[i] = name if new_name is None else new_name
+            op.done()
+    if moved:
+        notifyContainerModified(target)
+    names = [name for i, name in sorted(names.items())]
+    placeInTarget(target, names, index, before, after)
+    return names
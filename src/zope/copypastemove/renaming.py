@@ -0,0 +1,275 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Pattern based renaming of many container items
+"""
+__docformat__ = 'restructuredtext'
+
+import re
+
+from zope.component import adapter
+from zope.container.interfaces import IBTreeContainer
+from zope.container.interfaces import IContainer
+from zope.container.interfaces import IOrderedContainer
+from zope.interface import implementer
+
+from zope.copypastemove.interfaces import IContainerItemPatternRenamer
+from zope.copypastemove.interfaces import IObjectMover
+from zope.copypastemove.lookup import getObjectMover
+from zope.copypastemove.metrics import metered
+from zope.copypastemove.progress import operation
+
+
+_META = frozenset('.^$*+?{}[]\\|()')
+
+
+def _literalPrefix(pattern):
+    """Return the literal text every match of `pattern` starts with.
+
+      >>> _literalPrefix(re.compile('legacy-(.*)'))
+      'legacy-'
+      >>> _literalPrefix(re.compile(r'^a\\.b+c'))
+      'a.b'
+      >>> _literalPrefix(re.compile('abc?'))
+      'ab'
+      >>> _literalPrefix(re.compile(r'ab\\d'))
+      'ab'
+      >>> _literalPrefix(re.compile('a|b'))
+      ''
+      >>> _literalPrefix(re.compile('abc', re.IGNORECASE))
+      ''
+
+    """
+    if pattern.flags & (re.IGNORECASE | re.VERBOSE):
+        return ''
+    source = pattern.pattern
+    if not isinstance(source, str) or '|' in source:
+        return ''
+    prefix = []
+    i = 0
+    if source.startswith('^'):
+        i = 1
+    while i < len(source):
+        char = source[i]
+        if char == '\\':
+            if i + 1 >= len(source) or source[i + 1].isalnum():
+                break
+            char = source[i + 1]
+            step = 2
+        elif char in _META:
+            break
+        else:
+            step = 1
+        following = source[i + step:i + step + 1]
+        if following in ('*', '?', '{'):
+            break
+        prefix.append(char)
+        if following == '+':
+            break
+        i += step
+    return ''.join(prefix)
+
+
+@adapter(IContainer)
+@implementer(IContainerItemPatternRenamer)
+class ContainerItemPatternRenamer:
+    """Renames all items of a container whose names match a pattern.
+
+    The renamer works in chunks: it collects up to `chunkSize` matching
+    names, checks all of their new names for collisions at once and then
+    renames them using their `IObjectMover`.  It needs an `IObjectMover`
+    adapter:
+
+      >>> from zope.component import getGlobalSiteManager
+      >>> from zope.location.interfaces import IContained
+      >>> from zope.copypastemove import ObjectMover
+      >>> gsm = getGlobalSiteManager()
+      >>> gsm.registerAdapter(ObjectMover, (IContained, ), IObjectMover)
+
+    For BTree containers the keys are scanned lazily, starting at the
+    literal prefix of the pattern if it has one, so memory use doesn't
+    depend on the size of the container:
+
+      >>> from zope.container.btree import BTreeContainer
+      >>> from zope.container.contained import Contained
+      >>> container = BTreeContainer()
+      >>> for name in ('legacy-a', 'legacy-b', 'legacy-legacy-x', 'z'):
+      ...     container[name] = Contained()
+      >>> renamer = ContainerItemPatternRenamer(container)
+
+    The replacement is expanded like with ``re.sub``.  Only the matched
+    beginning of the name is replaced:
+
+      >>> renamer.renameMatching('legacy-', '', chunkSize=1)
+      3
+      >>> sorted(container)
+      ['a', 'b', 'legacy-x', 'z']
+
+    Note that 'legacy-x' wasn't renamed a second time although the scan
+    came across it after renaming 'legacy-legacy-x'.
+
+    A callable to be run after every chunk can be passed, for example to
+    commit the transaction:
+
+      >>> chunks = []
+      >>> renamer.renameMatching(r'(\\w+)$', r'item-\\1',
+      ...                        commit=lambda: chunks.append(1))
+      3
+      >>> sorted(container)
+      ['item-a', 'item-b', 'item-z', 'legacy-x']
+      >>> chunks
+      [1]
+
+    If new names collide with existing items or with each other, a
+    `DuplicationError` is raised before the chunk is renamed:
+
+      >>> renamer.renameMatching('item-.', 'item-z')
+      Traceback (most recent call last):
+      DuplicationError: item-z is already in use
+      >>> sorted(container)
+      ['item-a', 'item-b', 'item-z', 'legacy-x']
+
+    unless colliding items are to be skipped:
+
+      >>> renamer.renameMatching('item-(a|z)', 'item-b', skipCollisions=True)
+      0
+
+    The progress is reported after every chunk, and a cancellation token
+    is checked before every item.  Cancelling stops between two items,
+    the chunk is then left partly renamed and the transaction has to be
+    aborted:
+
+      >>> from zope.copypastemove.progress import CancellationToken
+      >>> token = CancellationToken()
+      >>> def progress(report):
+      ...     token.cancel()
+      >>> renamer.renameMatching('item-', 'new-', chunkSize=2,
+      ...                        progress=progress, token=token)
+      Traceback (most recent call last):
+      ...
+      zope.copypastemove.interfaces.OperationCancelled
+      >>> sorted(container)
+      ['item-z', 'legacy-x', 'new-a', 'new-b']
+
+    """
+
+    def __init__(self, container):
+        self.container = container
+
+    @metered('renameMatching', int)
+    def renameMatching(self, pattern, replacement, chunkSize=1000,
+                       commit=None, skipCollisions=False, progress=None,
+                       token=None):
+        if not isinstance(pattern, re.Pattern):
+            pattern = re.compile(pattern)
+        container = self.container
+        ordered = IOrderedContainer.providedBy(container)
+        renamed = 0
+        # New names of the last chunk, for the scan to skip.
+        produced = []
+        with operation(progress, token) as op:
+            for chunk in self._chunks(pattern, replacement, chunkSize,
+                                      produced):
+                chunk = self._checkCollisions(chunk, skipCollisions)
+                if not chunk:
+                    continue
+                if ordered:
+                    order = list(container.keys())
+                names = {}
+                for oldName, newName in chunk:
+                    op.check()
+                    mover = getObjectMover(container[oldName])
+                    name = mover.moveTo(container, newName)
+                    if name is not None:
+                        names[oldName] = name
+                        produced.append(name)
+                if ordered:
+                    container.updateOrder(
+                        [names.get(key, key) for key in order])
+                renamed += len(names)
+                if commit is not None:
+                    commit()
+                op.done(len(names))
+        return renamed
+
+    def _checkCollisions(self, chunk, skipCollisions):
+        container = self.container
+        oldNames = {oldName for oldName, newName in chunk}
+        seen = set()
+        result = []
+        for oldName, newName in chunk:
+            if newName == oldName:
+                continue
+            if (newName in seen or newName in oldNames
+                    or newName in container):
+                if skipCollisions:
+                    continue
+                from zope.exceptions import DuplicationError
+                raise DuplicationError("%s is already in use" % newName)
+            seen.add(newName)
+            result.append((oldName, newName))
+        return result
+
+    def _chunks(self, pattern, replacement, chunkSize, produced):
+        if callable(replacement):
+            expand = replacement
+        else:
+            def expand(match):
+                return match.expand(replacement)
+
+        def renamed(match):
+            return expand(match) + match.string[match.end():]
+
+        if not IBTreeContainer.providedBy(self.container):
+            # Other containers can't be iterated while they change, so
+            # collect the matching names first.
+            matches = [(key, renamed(match))
+                       for key, match in ((key, pattern.match(key))
+                                          for key in self.container.keys())
+                       if match is not None]
+            for start in range(0, len(matches), chunkSize):
+                yield matches[start:start + chunkSize]
+                del produced[:]
+            return
+
+        prefix = _literalPrefix(pattern)
+        # New names the scan has yet to pass, so that they are not renamed
+        # a second time.  Names without the prefix are never scanned.
+        ahead = set()
+        cursor = None
+        while True:
+            chunk = []
+            exhausted = True
+            start = cursor if cursor is not None else prefix
+            for key in self.container.keys(start or None):
+                if key == cursor:
+                    continue
+                if not key.startswith(prefix):
+                    break
+                cursor = key
+                if key in ahead:
+                    ahead.discard(key)
+                    continue
+                match = pattern.match(key)
+                if match is not None:
+                    chunk.append((key, renamed(match)))
+                    if len(chunk) >= chunkSize:
+                        exhausted = False
+                        break
+            if chunk:
+                yield chunk
+                ahead.update(name for name in produced
+                             if name > cursor and name.startswith(prefix))
+                del produced[:]
+            if exhausted:
+                return
@@ -0,0 +1,131 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Per class copy strategies
+
+Copying an object by pickling it is general, but slow for simple objects.
+A copy strategy copies the instances of one class directly.  Strategies
+are registered per class, subclasses don't inherit them, and are tried
+before pickling, both for the copied object and for the objects it
+contains.  Objects that copy hooks share, like locations outside of the
+copied object or `zope.copypastemove.interfaces.IShareable` objects, are
+shared and not copied by a strategy.
+
+A strategy is called like a `zope.copy.interfaces.ICopyHook`, with the
+object, the object being copied and a function registering cleanups.  It
+returns the copy, or raises `zope.copy.interfaces.ResumeCopy` to have the
+object pickled.
+"""
+__docformat__ = 'restructuredtext'
+
+import datetime
+
+from zope.copy.interfaces import ResumeCopy
+from zope.location.location import inside
+
+
+_strategies = {}
+
+
+def registerCopyStrategy(class_, strategy):
+    """Copy the instances of `class_` using `strategy`."""
+    _strategies[class_] = strategy
+
+
+def unregisterCopyStrategy(class_):
+    """Copy the instances of `class_` by pickling them again."""
+    _strategies.pop(class_, None)
+
+
+def getCopyStrategy(class_):
+    """Return the copy strategy of `class_`, or ``None``."""
+    return _strategies.get(class_)
+
+
+_IMMUTABLE = (type(None), bool, int, float, complex, str, bytes, frozenset,
+              datetime.date, datetime.time, datetime.timedelta)
+
+
+def _immutable(value):
+    if isinstance(value, tuple):
+        return all(_immutable(item) for item in value)
+    return isinstance(value, _IMMUTABLE)
+
+
+def copyAttributes(obj, toplevel, register):
+    """Copy an object whose attributes are all immutable.
+
+    The attributes are copied into a new instance, without pickling.  A
+    `__parent__` within the copied object is replaced by its copy.  Other
+    objects are pickled.
+
+      >>> from zope.container.contained import Contained
+      >>> record = Contained()
+      >>> record.__name__ = 'record'
+      >>> record.title = 'A record'
+      >>> record.tags = ('a', 'b')
+      >>> copy = copyAttributes(record, record, None)
+      >>> copy is record, copy.__name__, copy.title, copy.tags
+      (False, 'record', 'A record', ('a', 'b'))
+
+      >>> record.data = []
+      >>> copyAttributes(record, record, None)
+      Traceback (most recent call last):
+      ...
+      zope.copy.interfaces.ResumeCopy
+    """
+    cls = type(obj)
+    getstate = getattr(obj, '__getstate__', None)
+    if getstate is not None:
+        # This also loads persistent objects.
+        state = getstate()
+    elif any('__slots__' in vars(base)
+             for base in cls.__mro__):  # pragma: no cover (Python < 3.11)
+        raise ResumeCopy
+    else:  # pragma: no cover (Python < 3.11)
+        state = obj.__dict__
+    if state is None:
+        state = {}
+    if not isinstance(state, dict):
+        raise ResumeCopy
+    parent = state.get('__parent__')
+    for name, value in state.items():
+        if value is not parent and not _immutable(value):
+            raise ResumeCopy
+
+    new = cls.__new__(cls)
+    setstate = getattr(new, '__setstate__', None)
+    if setstate is not None:
+        setstate(dict(state))
+    else:
+        new.__dict__.update(state)
+
+    if (parent is not None and not _immutable(parent)
+            and inside(parent, toplevel)):
+        def setParent(convert):
+            new.__parent__ = convert(parent)
+        register(setParent)
+    return new
+
+
+def _clear():
+    _strategies.clear()
+
+
+try:
+    from zope.testing.cleanup import addCleanUp
+except ModuleNotFoundError:  # pragma: no cover
+    pass
+else:
+    addCleanUp(_clear)
+    del addCleanUp
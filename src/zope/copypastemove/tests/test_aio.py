@@ -0,0 +1,211 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Asyncio batch move and copy tests
+"""
+import asyncio
+import doctest
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import transaction
+from ZODB.DB import DB
+from ZODB.MappingStorage import MappingStorage
+from zope.component import getGlobalSiteManager
+from zope.component import provideAdapter
+from zope.component import testing
+from zope.component.hooks import getSite
+from zope.component.hooks import setSite
+from zope.container.btree import BTreeContainer
+from zope.container.contained import Contained
+from zope.container.ordered import OrderedContainer
+from zope.container.testing import PlacelessSetup
+from zope.copy.interfaces import ICopyHook
+from zope.interface.verify import verifyObject
+from zope.location.interfaces import IContained
+from zope.location.interfaces import ILocation
+from zope.location.pickling import LocationCopyHook
+
+from zope.copypastemove import ObjectCopier
+from zope.copypastemove import ObjectMover
+from zope.copypastemove.aio import AsyncObjectBatchCopier
+from zope.copypastemove.aio import AsyncObjectBatchMover
+from zope.copypastemove.interfaces import IAsyncObjectBatchCopier
+from zope.copypastemove.interfaces import IAsyncObjectBatchMover
+from zope.copypastemove.interfaces import IObjectCopier
+from zope.copypastemove.interfaces import IObjectMover
+from zope.copypastemove.interfaces import OperationCancelled
+from zope.copypastemove.progress import CancellationToken
+
+
+def setUp(test=None):
+    testing.setUp()
+    PlacelessSetup().setUp()
+    provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+    provideAdapter(ObjectMover, (IContained, ), IObjectMover)
+    provideAdapter(ObjectCopier, (IContained, ), IObjectCopier)
+
+
+class Site:
+
+    def getSiteManager(self):
+        return getGlobalSiteManager()
+
+
+def folder(items):
+    folder = BTreeContainer()
+    for i in range(items):
+        folder['item%03d' % i] = Contained()
+    return folder
+
+
+class AsyncBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        setUp()
+        self.source = folder(10)
+        self.target = OrderedContainer()
+
+    def tearDown(self):
+        setSite(None)
+        testing.tearDown()
+
+    def test_interfaces(self):
+        verifyObject(IAsyncObjectBatchMover,
+                     AsyncObjectBatchMover(self.target))
+        verifyObject(IAsyncObjectBatchCopier,
+                     AsyncObjectBatchCopier(self.target))
+
+    def test_other_tasks_run_between_slices(self):
+        events = []
+
+        class Recording(ObjectCopier):
+            def copyTo(self, target, new_name=None):
+                events.append('copy')
+                return super().copyTo(target, new_name)
+        provideAdapter(Recording, (IContained, ), IObjectCopier)
+
+        async def other():
+            for i in range(3):
+                events.append('other')
+                await asyncio.sleep(0)
+
+        async def main():
+            copier = AsyncObjectBatchCopier(self.target)
+            copier.sliceSize = 4
+            await asyncio.gather(
+                copier.copyObjects(self.source.values()), other())
+        asyncio.run(main())
+        self.assertEqual(len(self.target), 10)
+        self.assertEqual(
+            events,
+            ['other'] + ['copy'] * 4 + ['other'] + ['copy'] * 4 + ['other']
+            + ['copy'] * 2)
+
+    def test_executor(self):
+        threads = []
+        site = Site()
+        setSite(site)
+
+        class Recording(ObjectMover):
+            def moveTo(self, target, new_name=None):
+                threads.append((threading.current_thread(), getSite()))
+                return super().moveTo(target, new_name)
+        provideAdapter(Recording, (IContained, ), IObjectMover)
+
+        with ThreadPoolExecutor(1) as executor:
+            mover = AsyncObjectBatchMover(self.target, executor)
+            mover.sliceSize = 3
+            names = asyncio.run(mover.moveObjects(
+                self.source.values(), index=0))
+        self.assertEqual(names, ['item%03d' % i for i in range(10)])
+        self.assertEqual(list(self.target.keys()), names)
+        self.assertEqual(len(self.source), 0)
+        self.assertEqual(len({thread for thread, site in threads}), 1)
+        self.assertNotEqual(threads[0][0], threading.current_thread())
+        self.assertEqual({site for thread, site in threads}, {site})
+
+    def test_objects_read_in_executor(self):
+        threads = []
+
+        def objects():
+            for obj in self.source.values():
+                threads.append(threading.current_thread())
+                yield obj
+        with ThreadPoolExecutor(1) as executor:
+            copier = AsyncObjectBatchCopier(self.target, executor)
+            names = asyncio.run(copier.copyObjects(objects()))
+        self.assertEqual(len(names), 10)
+        self.assertEqual(len(set(threads)), 1)
+        self.assertNotEqual(threads[0], threading.current_thread())
+
+    def test_progress_and_cancel(self):
+        token = CancellationToken()
+        reports = []
+
+        def progress(report):
+            reports.append(report.items)
+            if report.items == 5:
+                token.cancel()
+        copier = AsyncObjectBatchCopier(self.target)
+        copier.sliceSize = 2
+        with self.assertRaises(OperationCancelled):
+            asyncio.run(copier.copyObjects(
+                self.source.values(), progress=progress, token=token))
+        self.assertEqual(len(self.target), 5)
+        self.assertEqual(max(reports), 5)
+
+
+class ZODBTest(unittest.TestCase):
+
+    def setUp(self):
+        setUp()
+        self.db = DB(MappingStorage())
+        self.executor = ThreadPoolExecutor(1)
+        self.conn = self.executor.submit(self.db.open).result()
+
+    def tearDown(self):
+        self.executor.submit(transaction.abort).result()
+        self.executor.submit(self.conn.close).result()
+        self.executor.shutdown()
+        self.db.close()
+        testing.tearDown()
+
+    def test_connection_thread(self):
+        def prepare():
+            root = self.conn.root()
+            root['source'] = folder(25)
+            root['target'] = BTreeContainer()
+            transaction.commit()
+            return root['source'], root['target']
+        source, target = self.executor.submit(prepare).result()
+
+        mover = AsyncObjectBatchMover(target, self.executor)
+        mover.sliceSize = 10
+        names = asyncio.run(mover.moveObjects(source.values()))
+        self.assertEqual(len(names), 25)
+        self.executor.submit(transaction.commit).result()
+        self.assertEqual(
+            self.executor.submit(lambda: (len(source), len(target))).result(),
+            (0, 25))
+
+
+def test_suite():
+    return unittest.TestSuite((
+        unittest.defaultTestLoader.loadTestsFromName(__name__),
+        doctest.DocTestSuite(
+            'zope.copypastemove.aio',
+            setUp=setUp,
+            tearDown=testing.tearDown),
+    ))
@@ -0,0 +1,442 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Copy estimation and background copy tests
+"""
+import doctest
+import threading
+import unittest
+
+import transaction
+from persistent import Persistent
+from ZODB.DB import DB
+from ZODB.MappingStorage import MappingStorage
+from zope.component import getGlobalSiteManager
+from zope.component import provideAdapter
+from zope.component import provideHandler
+from zope.component import testing
+from zope.component.hooks import getSite
+from zope.component.hooks import setSite
+from zope.container.btree import BTreeContainer
+from zope.container.contained import Contained
+from zope.container.contained import ContainerSublocations
+from zope.container.interfaces import INameChooser
+from zope.container.interfaces import IReadContainer
+from zope.container.ordered import OrderedContainer
+from zope.container.sample import SampleContainer
+from zope.container.testing import PlacelessSetup
+from zope.copy.interfaces import ICopyHook
+from zope.exceptions import DuplicationError
+from zope.interface import implementer
+from zope.lifecycleevent.interfaces import IObjectCopiedEvent
+from zope.location.interfaces import ILocation
+from zope.location.interfaces import ISublocations
+from zope.location.location import Location
+from zope.location.pickling import LocationCopyHook
+
+from zope.copypastemove import ObjectCopier
+from zope.copypastemove._example import ExampleContainer
+from zope.copypastemove.background import BackgroundCopyPolicy
+from zope.copypastemove.background import ConnectionCopyPolicy
+from zope.copypastemove.background import estimateCopy
+from zope.copypastemove.interfaces import OperationCancelled
+from zope.copypastemove.progress import CancellationToken
+from zope.copypastemove.progress import operation
+
+
+class Node(Location):
+
+    def __init__(self, parent=None):
+        self.__parent__ = parent
+        self.children = []
+        if parent is not None:
+            parent.children.append(self)
+
+
+@implementer(ISublocations)
+class NodeSublocations:
+
+    def __init__(self, node):
+        self.node = node
+
+    def sublocations(self):
+        return iter(self.node.children)
+
+
+def setUp(test=None):
+    testing.setUp()
+    PlacelessSetup().setUp()
+    provideAdapter(ContainerSublocations, (IReadContainer, ), ISublocations)
+    provideAdapter(NodeSublocations, (Node, ))
+
+
+class Site:
+
+    def getSiteManager(self):
+        return getGlobalSiteManager()
+
+
+def folder(items, size=10):
+    folder = BTreeContainer()
+    for i in range(items):
+        folder['item%04d' % i] = item = Contained()
+        item.data = b'x' * size
+    return folder
+
+
+class EstimateTest(unittest.TestCase):
+
+    def setUp(self):
+        setUp()
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def test_exact(self):
+        root = SampleContainer()
+        root['a'] = folder(3)
+        root['b'] = folder(2)
+        root['c'] = Contained()
+        estimate = estimateCopy(root)
+        self.assertEqual(estimate.locations, 9)
+        self.assertTrue(estimate.exact)
+
+    def test_sampled(self):
+        estimate = estimateCopy(folder(1000, size=1000), width=10)
+        self.assertEqual(estimate.locations, 1001)
+        self.assertFalse(estimate.exact)
+        self.assertGreater(estimate.size, 1000 * 1000)
+        self.assertLess(estimate.size, 1000 * 1200)
+
+    def test_nested_samples(self):
+        root = SampleContainer()
+        for i in range(20):
+            root['folder%d' % i] = folder(50)
+        estimate = estimateCopy(root, width=5, budget=1000)
+        self.assertEqual(estimate.locations, 1 + 20 + 20 * 50)
+        self.assertFalse(estimate.exact)
+
+    def test_budget(self):
+        root = SampleContainer()
+        for i in range(5):
+            root['folder%d' % i] = folder(50)
+        estimate = estimateCopy(root, width=5, budget=8)
+        self.assertEqual(estimate.locations, 1 + 5 + 5 * 50)
+        self.assertFalse(estimate.exact)
+
+    def test_budget_spent_on_nested_folders(self):
+        root = SampleContainer()
+        for i in range(10):
+            root['folder%d' % i] = sub = SampleContainer()
+            for j in range(10):
+                sub['folder%d' % j] = folder(20, size=100)
+        estimate = estimateCopy(root, width=5, budget=30)
+        self.assertEqual(estimate.locations, 1 + 10 + 100 + 2000)
+        self.assertFalse(estimate.exact)
+        self.assertGreater(estimate.size, 2000 * 100)
+        # Even without visiting any sublocation.
+        estimate = estimateCopy(root, budget=1)
+        self.assertEqual(estimate.locations, 11)
+        self.assertTrue(BackgroundCopyPolicy().defer(root))
+
+    def test_without_length(self):
+        root = Node()
+        for i in range(30):
+            Node(Node(root))
+        estimate = estimateCopy(root, width=3)
+        self.assertEqual(estimate.locations, 61)
+        self.assertFalse(estimate.exact)
+
+    def test_external_references(self):
+        outside = Node()
+        outside.data = b'x' * 10000
+        node = Node(outside)
+        self.assertLess(estimateCopy(node).size, 1000)
+
+    def test_unpicklable(self):
+        node = Node()
+        node.function = lambda: None
+        self.assertEqual(estimateCopy(node), (1, 0, True))
+
+
+class BackgroundCopyTest(unittest.TestCase):
+
+    def setUp(self):
+        setUp()
+        provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+        self.source = SampleContainer()
+        self.source['large'] = folder(50)
+        self.source['small'] = folder(1)
+        self.policy = BackgroundCopyPolicy(maxLocations=10)
+
+    def tearDown(self):
+        if self.policy.executor is not None:
+            self.policy.executor.shutdown()
+        setSite(None)
+        testing.tearDown()
+
+    def copier(self, name):
+        copier = ObjectCopier(self.source[name])
+        copier.policy = self.policy
+        return copier
+
+    def test_small_copies_are_made_right_away(self):
+        target = SampleContainer()
+        copier = self.copier('small')
+        self.assertEqual(copier.copyTo(target), 'small')
+        self.assertIn('small', target)
+        self.assertIsNone(copier.future)
+        self.assertIsNone(self.policy.executor)
+
+    def test_large_copies_are_deferred(self):
+        target = SampleContainer()
+        copier = self.copier('large')
+        self.assertEqual(copier.copyTo(target, 'copy'), 'copy')
+        copier.future.result()
+        self.assertEqual(len(target['copy']), 50)
+
+    def test_large_pickles_are_deferred(self):
+        self.policy.maxLocations = 1000
+        self.policy.maxSize = 100
+        copier = self.copier('large')
+        copier.copyTo(SampleContainer())
+        self.assertIsNotNone(copier.future)
+
+    def test_position(self):
+        target = OrderedContainer()
+        target['a'] = Contained()
+        copier = self.copier('large')
+        copier.copyToPosition(target, index=0)
+        copier.future.result()
+        self.assertEqual(list(target.keys()), ['large', 'a'])
+
+    def test_names_are_reserved(self):
+        target = SampleContainer()
+        started = threading.Event()
+        self.policy.execute(started.wait)
+        first, second = self.copier('large'), self.copier('large')
+        self.assertEqual(first.copyTo(target), 'large')
+        self.assertTrue(self.policy.reserved(target, 'large'))
+        self.assertFalse(self.policy.reserved(SampleContainer(), 'large'))
+        self.assertEqual(second.copyTo(target), 'large-2')
+        started.set()
+        self.assertEqual(first.future.result(), 'large')
+        self.assertEqual(second.future.result(), 'large-2')
+        self.assertEqual(sorted(target), ['large', 'large-2'])
+        self.assertFalse(self.policy.reserved(target, 'large'))
+
+    def test_chooser_names_reserved(self):
+        # The chooser of the target names copies in its own format.
+
+        class CopyOfChooser:
+
+            def __init__(self, context):
+                self.context = context
+
+            def chooseName(self, name, obj):
+                while name in self.context:
+                    name = 'copy_of_' + name
+                return name
+
+        provideAdapter(CopyOfChooser, (OrderedContainer, ), INameChooser)
+        target = OrderedContainer()
+        started = threading.Event()
+        self.policy.execute(started.wait)
+        first, second = self.copier('large'), self.copier('large')
+        self.assertEqual(first.copyTo(target), 'large')
+        self.assertEqual(second.copyTo(target), 'copy_of_large')
+        started.set()
+        second.future.result()
+        self.assertEqual(list(target), ['large', 'copy_of_large'])
+
+    def test_reserved_name_chosen(self):
+        # Targets choosing names themselves don't see the reserved names.
+        target = ExampleContainer()
+        started = threading.Event()
+        self.policy.execute(started.wait)
+        copier = self.copier('large')
+        copier.copyTo(target)
+        with self.assertRaises(DuplicationError):
+            self.copier('large').copyTo(target)
+        started.set()
+        copier.future.result()
+        self.assertEqual(list(target), ['large'])
+
+    def test_errors(self):
+        target = SampleContainer()
+        copier = self.copier('large')
+        copier.copyTo(target, 'copy')
+        copier.future.result()
+        started = threading.Event()
+        self.policy.execute(started.wait)
+        copier.copyTo(target, 'copy2')
+        target['copy2'] = Contained()
+        # The name is taken by the time the copy is added.
+        with self.assertLogs('zope.copypastemove.background') as logs:
+            started.set()
+            with self.assertRaises(KeyError):
+                copier.future.result()
+        self.assertIn("as 'copy2' failed", logs.output[0])
+        self.assertFalse(self.policy.reserved(target, 'copy2'))
+
+    def test_site(self):
+        site = Site()
+        setSite(site)
+        sites = []
+        self.policy.execute(lambda: sites.append(getSite())).result()
+        self.assertEqual(sites, [site])
+
+    def test_cancel(self):
+        token = CancellationToken()
+        target = SampleContainer()
+        started = threading.Event()
+        self.policy.execute(started.wait)
+        with operation(token=token):
+            copier = self.copier('large')
+            copier.copyTo(target, 'copy')
+        token.cancel()
+        started.set()
+        with self.assertRaises(OperationCancelled):
+            copier.future.result()
+        self.assertNotIn('copy', target)
+
+
+class StoredSite(Persistent, Site):
+    pass
+
+
+class ConnectionCopyTest(unittest.TestCase):
+
+    def setUp(self):
+        setUp()
+        provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+        self.db = DB(MappingStorage())
+        self.tm = transaction.TransactionManager()
+        self.conn = self.db.open(self.tm)
+        root = self.conn.root()
+        root['source'] = self.source = BTreeContainer()
+        self.source['large'] = folder(20)
+        root['target'] = self.target = BTreeContainer()
+        self.tm.commit()
+        self.policy = ConnectionCopyPolicy(self.db, maxLocations=10)
+
+    def tearDown(self):
+        if self.policy.executor is not None:
+            self.policy.executor.shutdown()
+        setSite(None)
+        self.tm.abort()
+        self.conn.close()
+        self.db.close()
+        testing.tearDown()
+
+    def copyTo(self, obj, target, name=None):
+        copier = ObjectCopier(obj)
+        copier.policy = self.policy
+        return copier.copyTo(target, name), copier.future
+
+    def test_copied_after_commit(self):
+        name, future = self.copyTo(self.source['large'], self.target)
+        self.assertEqual(name, 'large')
+        self.assertFalse(future.running() or future.done())
+        self.assertNotIn('large', self.target)
+        self.tm.commit()
+        self.assertEqual(future.result(), 'large')
+        self.tm.begin()
+        copy = self.target['large']
+        self.assertIsNot(copy, self.source['large'])
+        self.assertEqual(len(copy), 20)
+        self.assertIs(copy.__parent__, self.target)
+
+    def test_reserved_until_copied(self):
+        started = threading.Event()
+        self.policy.execute(started.wait)
+        first = self.copyTo(self.source['large'], self.target)
+        second = self.copyTo(self.source['large'], self.target)
+        self.assertEqual([first[0], second[0]], ['large', 'large-2'])
+        self.tm.commit()
+        started.set()
+        self.assertEqual(second[1].result(), 'large-2')
+        self.assertEqual(first[1].result(), 'large')
+        self.tm.begin()
+        self.assertEqual(sorted(self.target), ['large', 'large-2'])
+        self.assertFalse(self.policy.reserved(self.target, 'large'))
+
+    def test_aborted(self):
+        name, future = self.copyTo(self.source['large'], self.target)
+        self.tm.abort()
+        self.assertTrue(future.cancelled())
+        self.assertFalse(self.policy.reserved(self.target, name))
+
+    def test_cancelled_before_commit(self):
+        name, future = self.copyTo(self.source['large'], self.target)
+        self.assertTrue(future.cancel())
+        self.tm.commit()
+        self.assertIsNone(self.policy.executor)
+        self.assertFalse(self.policy.reserved(self.target, name))
+
+    def test_objects_added_in_the_same_transaction(self):
+        self.target['new'] = target = BTreeContainer()
+        name, future = self.copyTo(self.source['large'], target)
+        self.tm.commit()
+        self.assertEqual(future.result(), 'large')
+        self.tm.begin()
+        self.assertIn('large', self.target['new'])
+
+    def test_site(self):
+        self.conn.root()['site'] = site = StoredSite()
+        setSite(site)
+        sites = []
+        provideHandler(lambda event: sites.append(getSite()),
+                       (IObjectCopiedEvent, ))
+        name, future = self.copyTo(self.source['large'], self.target)
+        self.tm.commit()
+        future.result()
+        self.assertEqual(len(sites), 1)
+        self.assertIsNot(sites[0], site)
+        self.assertEqual(sites[0]._p_oid, site._p_oid)
+
+    def test_target_not_stored(self):
+        target = BTreeContainer()
+        name, future = self.copyTo(self.source['large'], target)
+        with self.assertLogs('zope.copypastemove.background') as logs:
+            self.tm.commit()
+        with self.assertRaises(ValueError):
+            future.result()
+        self.assertIn('failed', logs.output[0])
+        self.assertFalse(self.policy.reserved(target, name))
+
+    def test_conflicting_name(self):
+        name, future = self.copyTo(self.source['large'], self.target)
+        self.target['large'] = Contained()
+        with self.assertLogs('zope.copypastemove.background'):
+            self.tm.commit()
+            with self.assertRaises(KeyError):
+                future.result()
+
+    def test_source_not_stored(self):
+        copier = ObjectCopier(folder(20))
+        copier.policy = self.policy
+        with self.assertRaises(ValueError):
+            copier.copyTo(self.target, 'copy')
+        self.assertFalse(self.policy.reserved(self.target, 'copy'))
+
+
+def test_suite():
+    return unittest.TestSuite((
+        unittest.defaultTestLoader.loadTestsFromName(__name__),
+        doctest.DocTestSuite(
+            'zope.copypastemove.background',
+            setUp=setUp,
+            tearDown=testing.tearDown,
+            optionflags=doctest.ELLIPSIS),
+    ))
@@ -0,0 +1,200 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Blob copying tests
+"""
+import gc
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import transaction
+from ZODB.blob import Blob
+from ZODB.DB import DB
+from ZODB.FileStorage import FileStorage
+from zope.component import provideAdapter
+from zope.component import testing
+from zope.container.btree import BTreeContainer
+from zope.container.contained import Contained
+from zope.container.testing import PlacelessSetup
+from zope.copy.interfaces import ICopyHook
+from zope.location.interfaces import ILocation
+from zope.location.pickling import LocationCopyHook
+
+from zope.copypastemove import ObjectCopier
+from zope.copypastemove import blobs
+from zope.copypastemove.caching import CopyCache
+from zope.copypastemove.cloning import clone
+
+
+class Media(Contained):
+
+    def __init__(self, data):
+        self.blob = Blob(data)
+
+
+def link(source, target):
+    os.link(source, target)
+    return True
+
+
+class LinkingCopyHook(blobs.BlobCopyHook):
+
+    share = (link, )
+
+
+class BlobCopyTest(unittest.TestCase):
+
+    hook = blobs.BlobCopyHook
+
+    def setUp(self):
+        testing.setUp()
+        PlacelessSetup().setUp()
+        provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+        provideAdapter(self.hook)
+        self.dir = tempfile.mkdtemp()
+        self.db = DB(FileStorage(os.path.join(self.dir, 'Data.fs'),
+                                 blob_dir=os.path.join(self.dir, 'blobs')))
+        self.conn = self.db.open()
+        self.root = self.conn.root()
+        self.root['folder'] = self.folder = BTreeContainer()
+        self.folder['media'] = Media(b'data' * 1000)
+        transaction.commit()
+
+    def tearDown(self):
+        transaction.abort()
+        self.db.close()
+        shutil.rmtree(self.dir)
+        testing.tearDown()
+
+    def read(self, blob):
+        with blob.open('r') as f:
+            return f.read()
+
+    def test_copy_committed(self):
+        name = ObjectCopier(self.folder['media']).copyTo(self.folder)
+        copied = self.folder[name]
+        self.assertIsNot(copied.blob, self.folder['media'].blob)
+        self.assertEqual(self.read(copied.blob), b'data' * 1000)
+        transaction.commit()
+        with copied.blob.open('w') as f:
+            f.write(b'changed')
+        transaction.commit()
+        self.assertEqual(self.read(copied.blob), b'changed')
+        self.assertEqual(self.read(self.folder['media'].blob),
+                         b'data' * 1000)
+
+    def test_copy_uncommitted(self):
+        with self.folder['media'].blob.open('w') as f:
+            f.write(b'uncommitted')
+        copied = clone(self.folder['media'])
+        self.assertEqual(self.read(copied.blob), b'uncommitted')
+
+    def test_copy_outside_database(self):
+        copied = clone(Media(b'new'))
+        self.assertEqual(self.read(copied.blob), b'new')
+
+    def test_aborted_copies_are_removed(self):
+        copied = clone(self.folder['media'])
+        filename = copied.blob._p_blob_uncommitted
+        self.assertTrue(os.path.exists(filename))
+        del copied
+        gc.collect()
+        self.assertFalse(os.path.exists(filename))
+
+    def test_removed_uncommitted_file(self):
+        copied = clone(self.folder['media'])
+        ref = copied.blob._p_blob_ref
+        os.remove(copied.blob._p_blob_uncommitted)
+        del copied
+        gc.collect()
+        self.assertNotIn(ref, blobs._blob_close_refs)
+
+    def test_handed_to_connection(self):
+        # What a connection does when the copy is committed.
+        copied = clone(self.folder['media'])
+        ref = copied.blob._p_blob_ref
+        filename = copied.blob._p_blob_uncommitted
+        self.assertIn(ref, blobs._blob_close_refs)
+        self.assertEqual(copied.blob._uncommitted(), filename)
+        self.assertNotIn(ref, blobs._blob_close_refs)
+        del ref, copied
+        gc.collect()
+        self.assertTrue(os.path.exists(filename))
+        os.remove(filename)
+
+    def test_without_close_refs(self):
+        with mock.patch.object(blobs, '_blob_close_refs', None):
+            copied = clone(self.folder['media'])
+        self.assertEqual(self.read(copied.blob), b'data' * 1000)
+        self.assertIsNot(copied.blob._p_blob_uncommitted, None)
+
+    def test_not_cached(self):
+        cache = CopyCache()
+        media = self.folder['media']
+        first = clone(media, cache=cache)
+        second = clone(media, cache=cache)
+        self.assertIsNot(first.blob, second.blob)
+        self.assertEqual(len(cache), 0)
+
+
+class SharedBlobCopyTest(BlobCopyTest):
+
+    hook = LinkingCopyHook
+
+    def test_data_is_shared(self):
+        committed = self.folder['media'].blob.committed()
+        copied = clone(self.folder['media'])
+        self.assertTrue(os.path.samefile(
+            copied.blob._p_blob_uncommitted, committed))
+        self.folder['copy'] = copied
+        transaction.commit()
+        self.assertTrue(os.path.samefile(
+            copied.blob.committed(), committed))
+
+
+class SharingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.source = os.path.join(self.dir, 'source')
+        self.target = os.path.join(self.dir, 'target')
+        with open(self.source, 'wb') as f:
+            f.write(b'data')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_hardlink_writable(self):
+        with mock.patch('os.access', return_value=True):
+            self.assertFalse(blobs.hardlink(self.source, self.target))
+        self.assertFalse(os.path.exists(self.target))
+
+    def test_hardlink_read_only(self):
+        with mock.patch('os.access', return_value=False):
+            self.assertTrue(blobs.hardlink(self.source, self.target))
+        self.assertTrue(os.path.samefile(self.source, self.target))
+        with mock.patch('os.access', return_value=False):
+            self.assertFalse(blobs.hardlink(self.source, self.target))
+
+    def test_reflink(self):
+        with mock.patch('fcntl.ioctl', side_effect=OSError):
+            self.assertFalse(blobs.reflink(self.source, self.target))
+        with mock.patch('fcntl.ioctl'):
+            self.assertTrue(blobs.reflink(self.source, self.target))
+
+
+def test_suite():
+    return unittest.defaultTestLoader.loadTestsFromName(__name__)
@@ -0,0 +1,254 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Copy cache tests
+"""
+import doctest
+import unittest
+
+import transaction
+from persistent import Persistent
+from ZODB.DB import DB
+from ZODB.MappingStorage import MappingStorage
+from zope.component import provideAdapter
+from zope.component import testing
+from zope.copy.interfaces import ICopyHook
+from zope.interface import implementer
+
+from zope.copypastemove.caching import CopyCache
+from zope.copypastemove.cloning import clone
+
+
+class Item(Persistent):
+
+    def __init__(self, title, child=None):
+        self.title = title
+        self.child = child
+
+
+class Shared(Persistent):
+    pass
+
+
+class Versioned:
+
+    version = 1
+
+    def __init__(self, data=b''):
+        self.data = data
+
+
+class PersistentCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        testing.setUp()
+        self.db = DB(MappingStorage())
+        self.conn = self.db.open()
+        self.root = self.conn.root()
+        self.root['item'] = Item('parent', Item('child'))
+        transaction.commit()
+        self.cache = CopyCache()
+
+    def tearDown(self):
+        transaction.abort()
+        self.db.close()
+        testing.tearDown()
+
+    def copy(self):
+        copied = clone(self.root['item'], cache=self.cache)
+        self.assertIsNone(copied._p_oid)
+        self.assertIsNone(copied.child._p_oid)
+        return copied
+
+    def test_hit(self):
+        first = self.copy()
+        second = self.copy()
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(second.child.title, 'child')
+        self.assertIsNot(second.child, first.child)
+
+    def test_changed_child(self):
+        self.copy()
+        self.root['item'].child.title = 'changed'
+        self.assertEqual(self.copy().child.title, 'changed')
+        self.assertEqual(len(self.cache), 0)
+        transaction.commit()
+        self.assertEqual(self.copy().child.title, 'changed')
+        self.assertEqual(self.copy().child.title, 'changed')
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 3))
+
+    def test_changed_in_other_connection(self):
+        self.copy()
+        conn = self.db.open()
+        conn.root()['item'].child.title = 'elsewhere'
+        transaction.commit()
+        conn.close()
+        # The child is a ghost with its old serial now.
+        self.assertEqual(self.copy().child.title, 'elsewhere')
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_new_objects_are_not_cached(self):
+        self.root['item'].child = Item('new')
+        transaction.commit()
+        self.root['item'].child.child = Item('unsaved')
+        self.copy()
+        self.assertEqual(len(self.cache), 0)
+        self.copy()
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_other_connection(self):
+        self.copy()
+        entry, = self.cache._entries.values()
+        self.assertIsNone(entry.source)
+        conn = self.db.open()
+        try:
+            copied = clone(conn.root()['item'], cache=self.cache)
+            self.assertEqual(self.cache.hits, 1)
+            self.assertEqual(copied.child.title, 'child')
+            conn.root()['item'].child.title = 'changed'
+            copied = clone(conn.root()['item'], cache=self.cache)
+            self.assertEqual(copied.child.title, 'changed')
+            self.assertEqual(self.cache.hits, 1)
+        finally:
+            transaction.abort()
+            conn.close()
+        self.cache.invalidate(self.root['item'])
+        self.assertEqual(len(self.cache), 0)
+
+    def test_shared_objects(self):
+        @implementer(ICopyHook)
+        def share(obj):
+            return lambda toplevel, register: obj
+
+        provideAdapter(share, (Shared, ))
+        self.root['item'].shared = Shared()
+        self.copy()
+        self.assertEqual(len(self.cache), 0)
+        transaction.commit()
+        self.copy()
+        conn = self.db.open()
+        try:
+            item = conn.root()['item']
+            copied = clone(item, cache=self.cache)
+            self.assertEqual(self.cache.hits, 1)
+            self.assertIs(copied.shared, item.shared)
+        finally:
+            conn.close()
+
+    def test_registry_changes(self):
+        self.copy()
+        provideAdapter(lambda obj: None, (Versioned, ), ICopyHook)
+        self.copy()
+        self.assertEqual(self.cache.hits, 0)
+
+
+class CacheTest(unittest.TestCase):
+
+    def setUp(self):
+        testing.setUp()
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def test_lru(self):
+        cache = CopyCache(maxSize=2500, versionOf=lambda obj: obj.version)
+        objects = [Versioned(b'x' * 1000) for i in range(3)]
+        for obj in objects[:2]:
+            cache.clone(obj)
+        self.assertEqual(len(cache), 2)
+        cache.clone(objects[0])
+        cache.clone(objects[2])
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(cache.size, 2500)
+        cache.clone(objects[0])
+        self.assertEqual(cache.hits, 2)
+        cache.clone(objects[1])
+        self.assertEqual(cache.hits, 2)
+
+    def test_unversioned(self):
+        cache = CopyCache()
+        obj = Versioned(b'data')
+        self.assertEqual(cache.clone(obj).data, b'data')
+        self.assertEqual(len(cache), 0)
+
+    def test_too_large(self):
+        cache = CopyCache(maxSize=100, versionOf=lambda obj: obj.version)
+        self.assertEqual(cache.clone(Versioned(b'x' * 1000)).data,
+                         b'x' * 1000)
+        self.assertEqual((len(cache), cache.size), (0, 0))
+
+    def test_same_id(self):
+        cache = CopyCache(versionOf=lambda obj: obj.version)
+        obj = Versioned()
+        cache.clone(obj)
+        entry = cache._entries[id(obj)]
+        entry.source = Versioned()
+        cache.clone(obj)
+        self.assertEqual((cache.hits, len(cache)), (0, 1))
+
+    def test_shared_objects(self):
+        shared = Versioned()
+
+        @implementer(ICopyHook)
+        def share(obj):
+            return lambda toplevel, register: obj
+
+        provideAdapter(share, (Versioned, ))
+        cache = CopyCache(versionOf=lambda obj: 1)
+        obj = {'shared': shared, 'data': [1]}
+        cache.clone(obj)
+        copied = cache.clone(obj)
+        self.assertEqual(cache.hits, 1)
+        self.assertIs(copied['shared'], shared)
+        self.assertIsNot(copied['data'], obj['data'])
+
+    def test_cleanups_are_not_cached(self):
+        converted = []
+
+        @implementer(ICopyHook)
+        def hook(obj):
+            def hook(toplevel, register):
+                register(lambda convert: converted.append(convert(toplevel)))
+                return obj
+            return hook
+
+        provideAdapter(hook, (Versioned, ))
+        cache = CopyCache(versionOf=lambda obj: 1)
+        obj = {'shared': Versioned()}
+        copied = cache.clone(obj)
+        self.assertEqual((converted, len(cache)), ([copied], 0))
+
+    def test_invalidate(self):
+        cache = CopyCache(versionOf=lambda obj: obj.version)
+        obj = Versioned(b'data')
+        cache.clone(obj)
+        cache.invalidate(Versioned())
+        self.assertEqual(len(cache), 1)
+        cache.invalidate(obj)
+        self.assertEqual((len(cache), cache.size), (0, 0))
+        cache.clone(obj)
+        cache.clone(Versioned())
+        cache.clone(obj)
+        self.assertEqual((len(cache), cache.hits), (2, 1))
+        cache.clear()
+        self.assertEqual((len(cache), cache.size), (0, 0))
+
+
+def test_suite():
+    return unittest.TestSuite((
+        unittest.defaultTestLoader.loadTestsFromName(__name__),
+        doctest.DocTestSuite(
+            'zope.copypastemove.caching',
+            setUp=lambda test: testing.setUp(),
+            tearDown=testing.tearDown),
+    ))
@@ -0,0 +1,215 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Cloning tests
+"""
+import doctest
+import tempfile
+import unittest
+
+from zope.component import provideAdapter
+from zope.component import testing
+from zope.copy.interfaces import ICopyHook
+from zope.interface import alsoProvides
+from zope.interface import implementer
+from zope.location.location import Location
+from zope.location.pickling import LocationCopyHook
+
+from zope.copypastemove import cloning
+from zope.copypastemove.interfaces import IShareable
+
+
+class Node(Location):
+
+    def __init__(self, name=None, parent=None):
+        self.__name__ = name
+        self.__parent__ = parent
+        self.children = []
+        if parent is not None:
+            parent.children.append(self)
+
+
+def tree():
+    outside = Node('outside')
+    root = Node('root', outside)
+    a = Node('a', root)
+    b = Node('b', root)
+    a.sibling = b
+    b.external = outside
+    return outside, root
+
+
+class CountingNode(Node):
+    # Counts the reads of `__parent__`.
+
+    reads = 0
+
+    @property
+    def __parent__(self):
+        CountingNode.reads += 1
+        return self._parent
+
+    @__parent__.setter
+    def __parent__(self, parent):
+        self._parent = parent
+
+
+class Fixed:
+
+    __name__ = property(lambda self: 'fixed')
+    __parent__ = property(lambda self: 'parent')
+
+
+class RecordingSpool:
+    # Records the spool files used.
+
+    def __init__(self):
+        self.spools = []
+        self._orig = cloning._spool
+
+    def __call__(self, maxMemory):
+        spool = self._orig(maxMemory)
+        self.spools.append(spool)
+        return spool
+
+
+class CloneTest(unittest.TestCase):
+
+    def setUp(self):
+        testing.setUp()
+        provideAdapter(LocationCopyHook, (Location, ), ICopyHook)
+        self.spool = cloning._spool = RecordingSpool()
+
+    def tearDown(self):
+        cloning._spool = self.spool._orig
+        testing.tearDown()
+
+    def test_locations_outside_are_shared(self):
+        outside, root = tree()
+        copied = cloning.copy(root)
+        self.assertIsNone(copied.__parent__)
+        a, b = copied.children
+        self.assertIsNot(a, root.children[0])
+        self.assertIs(a.__parent__, copied)
+        self.assertIs(a.sibling, b)
+        self.assertIs(b.external, outside)
+
+    def test_small_pickles_stay_in_memory(self):
+        cloning.clone(tree()[1])
+        spool, = self.spool.spools
+        self.assertFalse(spool._rolled)
+
+    def test_large_pickles_are_spooled(self):
+        outside, root = tree()
+        root.data = b'x' * 10000
+        copied = cloning.clone(root, maxMemory=1000)
+        self.assertEqual(copied.data, root.data)
+        spool, = self.spool.spools
+        self.assertTrue(spool._rolled)
+
+    def test_unlimited_memory(self):
+        outside, root = tree()
+        root.data = b'x' * (cloning.DEFAULT_MAX_MEMORY + 1)
+        cloning.clone(root, maxMemory=None)
+        spool, = self.spool.spools
+        self.assertFalse(spool._rolled)
+
+    def test_always_spooled(self):
+        cloning.clone(tree()[1], maxMemory=0)
+        spool, = self.spool.spools
+        self.assertNotIsInstance(spool, tempfile.SpooledTemporaryFile)
+
+    def test_hook_cleanups(self):
+        converted = []
+
+        @implementer(ICopyHook)
+        class Hook:
+            def __init__(self, context):
+                self.context = context
+
+            def __call__(self, toplevel, register):
+                register(lambda convert: converted.append(
+                    convert(toplevel.children[0])))
+                return self.context
+
+        class Shared:
+            pass
+
+        provideAdapter(Hook, (Shared, ))
+        outside, root = tree()
+        root.shared = Shared()
+        root.again = root.shared
+        copied = cloning.copy(root)
+        self.assertIs(copied.shared, root.shared)
+        self.assertIs(copied.again, root.shared)
+        self.assertEqual(converted, [copied.children[0]])
+
+    def test_shareable(self):
+        provideAdapter(cloning.shareableCopyHook)
+        outside, root = tree()
+        root.table = Node('table', root)
+        root.children[1].table = root.table
+        alsoProvides(root.table, IShareable)
+        copied = cloning.copy(root)
+        self.assertIs(copied.table, root.table)
+        self.assertIs(copied.children[1].table, root.table)
+        self.assertIsNot(copied.children[1], root.children[1])
+        table = cloning.copy(root.table)
+        self.assertIsNot(table, root.table)
+        self.assertEqual(table.__name__, None)
+
+    def test_containment_is_cached(self):
+        outside = CountingNode('outside')
+        root = CountingNode('root', outside)
+        node = root
+        nodes = []
+        for i in range(100):
+            node = CountingNode(str(i), node)
+            nodes.append(node)
+        # References from the top to every node, and to the outside.
+        root.nodes = nodes
+        root.outside = [outside] * 100
+        CountingNode.reads = 0
+        copied = cloning.clone(root)
+        self.assertLess(CountingNode.reads, 300)
+        self.assertIs(copied.nodes[-1].__parent__, copied.nodes[-2])
+        self.assertIs(copied.outside[-1], outside)
+
+    def test_subclassed_location_hook(self):
+        calls = []
+
+        class Hook(LocationCopyHook):
+            def __call__(self, toplevel, register):
+                calls.append(self.context)
+                return LocationCopyHook.__call__(self, toplevel, register)
+
+        provideAdapter(Hook, (Node, ), ICopyHook)
+        outside, root = tree()
+        copied = cloning.clone(root)
+        self.assertIs(copied.children[1].external, outside)
+        self.assertIn(outside, calls)
+
+    def test_read_only_location(self):
+        copied = cloning.copy(Fixed())
+        self.assertEqual(copied.__name__, 'fixed')
+        self.assertEqual(copied.__parent__, 'parent')
+
+
+def test_suite():
+    return unittest.TestSuite((
+        unittest.defaultTestLoader.loadTestsFromName(__name__),
+        doctest.DocTestSuite(
+            'zope.copypastemove.cloning',
+            setUp=lambda test: testing.setUp(),
+            tearDown=testing.tearDown),
+    ))
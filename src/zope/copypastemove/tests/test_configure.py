@@ -34,8 +34,8 @@ class ZCMLTest(unittest.TestCase):
         h_count = len(list(gsm.registeredHandlers()))
         zope.configuration.xmlconfig.XMLConfig(
             'configure.zcml', zope.copypastemove)()
-        self.assertEqual(u_count + 17, len(list(gsm.registeredUtilities())))
-        self.assertEqual(a_count + 5, len(list(gsm.registeredAdapters())))
+        self.assertEqual(u_count + 23, len(list(gsm.registeredUtilities())))
+        self.assertEqual(a_count + 11, len(list(gsm.registeredAdapters())))
         self.assertEqual(
             s_count, len(list(gsm.registeredSubscriptionAdapters())))
         self.assertEqual(h_count + 1, len(list(gsm.registeredHandlers())))
@@ -0,0 +1,137 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Moves between the databases of a multi-database
+"""
+import unittest
+
+import transaction
+from persistent import Persistent
+from ZODB.DB import DB
+from ZODB.MappingStorage import MappingStorage
+from zope.component import provideAdapter
+from zope.component import testing
+from zope.component.eventtesting import clearEvents
+from zope.component.eventtesting import getEvents
+from zope.component.eventtesting import setUp as eventSetUp
+from zope.container.btree import BTreeContainer
+from zope.container.contained import Contained
+from zope.container.testing import PlacelessSetup
+from zope.copy.interfaces import ICopyHook
+from zope.lifecycleevent.interfaces import IObjectAddedEvent
+from zope.lifecycleevent.interfaces import IObjectMovedEvent
+from zope.lifecycleevent.interfaces import IObjectRemovedEvent
+from zope.location.interfaces import IContained
+from zope.location.interfaces import ILocation
+from zope.location.pickling import LocationCopyHook
+
+from zope.copypastemove import ObjectBatchMover
+from zope.copypastemove import ObjectMover
+from zope.copypastemove.interfaces import IObjectMover
+
+
+class Item(Persistent, Contained):
+
+    def __init__(self, other=None):
+        self.other = other
+
+
+class MultiDatabaseTest(unittest.TestCase):
+
+    def setUp(self):
+        testing.setUp()
+        PlacelessSetup().setUp()
+        eventSetUp()
+        provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+        provideAdapter(ObjectMover, (IContained, ), IObjectMover)
+        databases = {}
+        self.one = DB(MappingStorage(), databases=databases,
+                      database_name='one')
+        self.two = DB(MappingStorage(), databases=databases,
+                      database_name='two')
+        self.conn = self.one.open()
+        root = self.conn.root()
+        root['shared'] = self.shared = Item()
+        root['folder'] = self.folder = BTreeContainer()
+        self.folder['a'] = BTreeContainer()
+        self.folder['a']['x'] = Item(self.shared)
+        self.folder['a']['y'] = Item()
+        self.folder['a']['x'].sibling = self.folder['a']['y']
+        self.folder['b'] = Item()
+        root2 = self.conn.get_connection('two').root()
+        root2['archive'] = self.archive = BTreeContainer()
+        transaction.commit()
+        clearEvents()
+
+    def tearDown(self):
+        transaction.abort()
+        self.conn.close()
+        self.one.close()
+        self.two.close()
+        testing.tearDown()
+
+    def assertStoredIn(self, db, *objects):
+        for obj in objects:
+            self.assertIs(obj._p_jar.db(), db)
+
+    def test_move_to_other_database(self):
+        original = self.folder['a']
+        self.assertEqual(ObjectMover(original).moveTo(self.archive), 'a')
+        transaction.commit()
+        moved = self.archive['a']
+        self.assertIsNot(moved, original)
+        self.assertNotIn('a', self.folder)
+        self.assertEqual(sorted(moved), ['x', 'y'])
+        self.assertStoredIn(self.two, moved, moved['x'], moved['y'])
+        self.assertIs(moved.__parent__, self.archive)
+        self.assertIs(moved['x'].__parent__, moved)
+        self.assertIs(moved['x'].sibling, moved['y'])
+        # Objects outside of the moved one aren't copied.
+        self.assertIs(moved['x'].other, self.shared)
+        self.assertStoredIn(self.one, self.shared)
+
+    def test_events(self):
+        original = self.folder['a']
+        ObjectMover(original).moveTo(self.archive, 'c')
+        self.assertEqual(getEvents(IObjectMovedEvent, lambda event: not (
+            IObjectAddedEvent.providedBy(event)
+            or IObjectRemovedEvent.providedBy(event))), [])
+        added, = getEvents(IObjectAddedEvent)
+        self.assertIs(added.object, self.archive['c'])
+        self.assertEqual(added.newName, 'c')
+        removed, = getEvents(IObjectRemovedEvent)
+        self.assertIs(removed.object, original)
+        self.assertEqual(removed.oldName, 'a')
+
+    def test_new_target(self):
+        # The target isn't stored yet, but its container is.
+        self.archive['new'] = target = BTreeContainer()
+        ObjectMover(self.folder['b']).moveTo(target)
+        transaction.commit()
+        self.assertStoredIn(self.two, target, target['b'])
+
+    def test_batch(self):
+        names = ObjectBatchMover(self.archive).moveObjects(
+            [self.folder['b'], self.folder['a']])
+        transaction.commit()
+        self.assertEqual(names, ['b', 'a'])
+        self.assertEqual(len(self.folder), 0)
+        self.assertStoredIn(self.two, self.archive['a'], self.archive['b'])
+
+    def test_same_database(self):
+        original = self.folder['b']
+        self.conn.root()['other'] = other = BTreeContainer()
+        ObjectMover(original).moveTo(other)
+        transaction.commit()
+        self.assertIs(other['b'], original)
+        self.assertEqual(len(getEvents(IObjectMovedEvent)), 1)
@@ -0,0 +1,62 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Event dispatching tests
+"""
+import doctest
+import unittest
+
+from zope.component import provideHandler
+from zope.component import testing
+from zope.component.event import objectEventNotify
+from zope.container.contained import dispatchToSublocations
+from zope.lifecycleevent import ObjectModifiedEvent
+from zope.lifecycleevent.interfaces import IObjectModifiedEvent
+from zope.location.location import Location
+
+from zope.copypastemove.dispatching import handle
+from zope.copypastemove.dispatching import sublocationDispatchers
+from zope.copypastemove.profiling import SubscriberProfiler
+
+
+class HandleTest(unittest.TestCase):
+
+    def setUp(self):
+        testing.setUp()
+        provideHandler(objectEventNotify)
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def test_dispatchers_shared(self):
+        self.assertIs(SubscriberProfiler.sublocationDispatchers,
+                      sublocationDispatchers)
+
+    def test_other_dispatchers(self):
+        calls = []
+        provideHandler(dispatchToSublocations,
+                       (None, IObjectModifiedEvent))
+        event = ObjectModifiedEvent(Location())
+        handle((event, ), lambda subscriber, objects: calls.append(
+            subscriber), dispatchers=())
+        self.assertEqual(calls, [dispatchToSublocations])
+
+
+def test_suite():
+    return unittest.TestSuite((
+        unittest.defaultTestLoader.loadTestsFromName(__name__),
+        doctest.DocTestSuite(
+            'zope.copypastemove.dispatching',
+            setUp=lambda test: testing.setUp(),
+            tearDown=testing.tearDown),
+    ))
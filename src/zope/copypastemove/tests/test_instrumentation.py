@@ -0,0 +1,131 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Phase timing tests
+"""
+import doctest
+import threading
+import unittest
+
+from zope.component import provideAdapter
+from zope.component import testing
+from zope.container.contained import Contained
+from zope.container.ordered import OrderedContainer
+from zope.container.sample import SampleContainer
+from zope.container.testing import PlacelessSetup
+from zope.copy.interfaces import ICopyHook
+from zope.location.interfaces import IContained
+from zope.location.interfaces import ILocation
+from zope.location.pickling import LocationCopyHook
+
+from zope.copypastemove import ContainerItemRenamer
+from zope.copypastemove import ObjectCopier
+from zope.copypastemove import ObjectMover
+from zope.copypastemove import OrderedContainerItemRenamer
+from zope.copypastemove import instrumentation
+from zope.copypastemove.instrumentation import PhaseCollector
+from zope.copypastemove.instrumentation import addPhaseHook
+from zope.copypastemove.instrumentation import phase
+from zope.copypastemove.instrumentation import removePhaseHook
+from zope.copypastemove.interfaces import IObjectMover
+
+
+def setUp(test=None):
+    testing.setUp()
+    PlacelessSetup().setUp()
+    provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+    provideAdapter(ObjectMover, (IContained, ), IObjectMover)
+
+
+class PhaseTest(unittest.TestCase):
+
+    setUp = setUp
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def test_disabled(self):
+        self.assertEqual(instrumentation._hooks, ())
+        self.assertIs(phase('copyTo', 'copy'), phase('moveTo', 'setitem'))
+
+    def test_hooks(self):
+        calls = []
+
+        def hook(operation, name, seconds):
+            calls.append((operation, name))
+
+        def started(operation, name):
+            calls.append(('started', operation, name))
+        addPhaseHook(hook, started)
+        with self.assertRaises(ValueError):
+            with phase('op', 'failing'):
+                raise ValueError
+        removePhaseHook(hook)
+        with phase('op', 'untimed'):
+            pass
+        self.assertEqual(calls,
+                         [('started', 'op', 'failing'), ('op', 'failing')])
+        self.assertEqual(instrumentation._started, ())
+
+    def test_copy(self):
+        source = SampleContainer()
+        source['a'] = Contained()
+        target = OrderedContainer()
+        target['b'] = Contained()
+        with PhaseCollector() as collector:
+            ObjectCopier(source['a']).copyToPosition(target, index=0)
+        self.assertEqual(
+            sorted(name for operation, name in collector.totals
+                   if operation == 'copyTo'),
+            ['checkObject', 'chooseName', 'copy', 'notify', 'position',
+             'setitem'])
+        self.assertEqual(
+            sorted(name for operation, name in collector.totals
+                   if operation == 'clone'),
+            ['pickle', 'unpickle'])
+        self.assertEqual(instrumentation._hooks, ())
+
+    def test_rename(self):
+        container = OrderedContainer()
+        container['a'] = Contained()
+        with PhaseCollector() as collector:
+            OrderedContainerItemRenamer(container).renameItem('a', 'b')
+            ContainerItemRenamer(container).renameItem('b', 'c')
+        self.assertEqual(collector.totals['renameItem', 'lookup'][0], 2)
+        self.assertEqual(collector.totals['renameItem', 'moveTo'][0], 2)
+        self.assertEqual(collector.totals['renameItem', 'updateOrder'][0], 1)
+        self.assertEqual(collector.totals['moveTo', 'setitem'][0], 2)
+
+    def test_other_threads_are_ignored(self):
+        container = SampleContainer()
+        container['a'] = Contained()
+
+        def move():
+            ObjectMover(container['a']).moveTo(container, 'b')
+        with PhaseCollector() as collector:
+            thread = threading.Thread(target=move)
+            thread.start()
+            thread.join()
+        self.assertEqual(collector.totals, {})
+        self.assertIn('b', container)
+
+
+def test_suite():
+    return unittest.TestSuite((
+        unittest.defaultTestLoader.loadTestsFromName(__name__),
+        doctest.DocTestSuite(
+            'zope.copypastemove.instrumentation',
+            setUp=setUp,
+            tearDown=testing.tearDown,
+            optionflags=doctest.NORMALIZE_WHITESPACE),
+    ))
@@ -0,0 +1,95 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Adapter lookup cache tests
+"""
+import doctest
+import unittest
+
+from zope.component import getGlobalSiteManager
+from zope.component import testing
+from zope.component.hooks import setHooks
+from zope.component.hooks import setSite
+from zope.container.contained import Contained
+from zope.interface.registry import Components
+
+from zope.copypastemove import ObjectMover
+from zope.copypastemove.interfaces import IObjectMover
+from zope.copypastemove.lookup import getObjectMover
+
+
+class OtherMover(ObjectMover):
+    pass
+
+
+class Site:
+
+    def __init__(self, sm):
+        self.sm = sm
+
+    def getSiteManager(self):
+        return self.sm
+
+
+class LookupTest(unittest.TestCase):
+
+    def setUp(self):
+        testing.setUp()
+        setHooks()
+
+    def tearDown(self):
+        setSite()
+        testing.tearDown()
+
+    def test_local_registries_are_cached_separately(self):
+        gsm = getGlobalSiteManager()
+        gsm.registerAdapter(ObjectMover, (None, ), IObjectMover)
+        local = Components('local', bases=(gsm, ))
+        local.registerAdapter(OtherMover, (None, ), IObjectMover)
+
+        ob = Contained()
+        self.assertEqual(type(getObjectMover(ob)), ObjectMover)
+        setSite(Site(local))
+        self.assertEqual(type(getObjectMover(ob)), OtherMover)
+        setSite()
+        self.assertEqual(type(getObjectMover(ob)), ObjectMover)
+
+    def test_base_registry_changes_invalidate(self):
+        gsm = getGlobalSiteManager()
+        local = Components('local', bases=(gsm, ))
+        setSite(Site(local))
+        ob = Contained()
+        self.assertIsNone(getObjectMover(ob, None))
+        gsm.registerAdapter(ObjectMover, (None, ), IObjectMover)
+        self.assertEqual(type(getObjectMover(ob)), ObjectMover)
+
+    def test_cleanup(self):
+        from zope.testing.cleanup import cleanUp
+        gsm = getGlobalSiteManager()
+        gsm.registerAdapter(ObjectMover, (None, ), IObjectMover)
+        getObjectMover(Contained())
+        self.assertTrue(getObjectMover._caches)
+        cleanUp()
+        self.assertFalse(getObjectMover._caches)
+
+
+def test_suite():
+    return unittest.TestSuite((
+        unittest.defaultTestLoader.loadTestsFromName(__name__),
+        doctest.DocTestSuite(
+            'zope.copypastemove.lookup',
+            setUp=lambda test: testing.setUp(),
+            tearDown=testing.tearDown,
+            optionflags=(doctest.ELLIPSIS
+                         | doctest.IGNORE_EXCEPTION_DETAIL)),
+    ))
@@ -0,0 +1,144 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Copy memory measurement tests
+"""
+import doctest
+import threading
+import tracemalloc
+import unittest
+
+from zope.component import provideAdapter
+from zope.component import testing
+from zope.container.contained import Contained
+from zope.container.sample import SampleContainer
+from zope.container.testing import PlacelessSetup
+from zope.copy.interfaces import ICopyHook
+from zope.location.interfaces import IContained
+from zope.location.interfaces import ILocation
+from zope.location.pickling import LocationCopyHook
+
+from zope.copypastemove import ObjectBatchCopier
+from zope.copypastemove import ObjectCopier
+from zope.copypastemove.caching import CopyCache
+from zope.copypastemove.instrumentation import phase
+from zope.copypastemove.interfaces import IObjectCopier
+from zope.copypastemove.memory import MemoryProfiler
+from zope.copypastemove.progress import operation
+
+
+def setUp(test=None):
+    testing.setUp()
+    PlacelessSetup().setUp()
+    provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+    provideAdapter(ObjectCopier, (IContained, ), IObjectCopier)
+
+
+class Data(Contained):
+
+    version = 1
+
+    def __init__(self, items):
+        self.values = [bytes(1000) + str(i).encode() for i in range(items)]
+
+
+class MemoryProfilerTest(unittest.TestCase):
+
+    setUp = setUp
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def test_batch(self):
+        source = SampleContainer()
+        source['a'] = Data(100)
+        source['b'] = Data(200)
+        target = SampleContainer()
+        with MemoryProfiler() as profiler:
+            ObjectBatchCopier(target).copyObjects(source.values())
+        self.assertFalse(tracemalloc.is_tracing())
+        # The list of values, their bytes and the object.
+        self.assertGreaterEqual(profiler.objects, 300 + 2 * 2)
+        self.assertGreater(profiler.peak, 300 * 1000)
+        self.assertGreater(profiler.allocated, 300 * 1000)
+        self.assertGreaterEqual(profiler.peak, profiler.allocated)
+        count, allocated, peak = profiler.phases['copyTo', 'copy']
+        self.assertEqual(count, 2)
+        self.assertGreater(allocated, 300 * 1000)
+        self.assertIn(('clone', 'pickle'), profiler.phases)
+        self.assertIn(('copyTo', 'notify'), profiler.phases)
+        self.assertIn(('copyTo', 'setitem'), profiler.phases)
+
+    def test_nested_peaks(self):
+        with MemoryProfiler() as profiler:
+            with phase('test', 'outer'):
+                with phase('test', 'inner'):
+                    garbage = bytes(1000000)
+                    del garbage
+        count, allocated, peak = profiler.phases['test', 'inner']
+        self.assertLess(allocated, 1000000)
+        self.assertGreaterEqual(peak, 900000)
+        count, allocated, peak = profiler.phases['test', 'outer']
+        self.assertGreaterEqual(peak, 900000)
+        self.assertGreaterEqual(profiler.peak, 900000)
+
+    def test_already_tracing(self):
+        tracemalloc.start()
+        try:
+            with MemoryProfiler():
+                pass
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+
+    def test_other_threads(self):
+        def run():
+            with phase('test', 'thread'):
+                pass
+        with MemoryProfiler() as profiler:
+            thread = threading.Thread(target=run)
+            thread.start()
+            thread.join()
+        self.assertEqual(profiler.phases, {})
+
+    def test_cached_copies(self):
+        data = Data(10)
+        cache = CopyCache(versionOf=lambda obj: obj.version)
+        cache.clone(data)
+        with MemoryProfiler() as profiler:
+            cache.clone(data)
+        self.assertEqual(cache.hits, 1)
+        self.assertGreaterEqual(profiler.objects, 10)
+
+    def test_objects_not_counted_by_default(self):
+        with operation() as op:
+            ObjectCopier(Data(10)).copyTo(SampleContainer(), 'data')
+        self.assertGreater(op.bytes, 0)
+        self.assertEqual(op.objects, 0)
+
+    def test_outer_operation(self):
+        with operation() as op:
+            with MemoryProfiler() as profiler:
+                ObjectCopier(Data(10)).copyTo(SampleContainer(), 'data')
+        self.assertEqual(op.objects, profiler.objects)
+        self.assertGreater(op.bytes, 0)
+
+
+def test_suite():
+    return unittest.TestSuite((
+        unittest.defaultTestLoader.loadTestsFromName(__name__),
+        doctest.DocTestSuite(
+            'zope.copypastemove.memory',
+            setUp=setUp,
+            tearDown=testing.tearDown),
+    ))
@@ -0,0 +1,213 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Operation metrics tests
+"""
+import doctest
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from zope.component import provideAdapter
+from zope.component import testing
+from zope.container.contained import Contained
+from zope.container.ordered import OrderedContainer
+from zope.container.sample import SampleContainer
+from zope.container.testing import PlacelessSetup
+from zope.copy.interfaces import ICopyHook
+from zope.interface import Interface
+from zope.interface import implementer
+from zope.location.interfaces import IContained
+from zope.location.interfaces import ILocation
+from zope.location.pickling import LocationCopyHook
+
+from zope.copypastemove import ContainerItemRenamer
+from zope.copypastemove import ObjectBatchCopier
+from zope.copypastemove import ObjectBatchMover
+from zope.copypastemove import ObjectCopier
+from zope.copypastemove import ObjectMover
+from zope.copypastemove import OrderedContainerItemRenamer
+from zope.copypastemove import PrincipalClipboard
+from zope.copypastemove.interfaces import IObjectCopier
+from zope.copypastemove.interfaces import IObjectMover
+from zope.copypastemove.interfaces import ItemNotFoundError
+from zope.copypastemove.metrics import ITEMS_BOUNDS
+from zope.copypastemove.metrics import MetricsRegistry
+from zope.copypastemove.metrics import getMetricsRegistry
+from zope.copypastemove.metrics import setMetricsRegistry
+from zope.copypastemove.renaming import ContainerItemPatternRenamer
+
+
+def setUp(test=None):
+    testing.setUp()
+    PlacelessSetup().setUp()
+    provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+    provideAdapter(ObjectMover, (IContained, ), IObjectMover)
+    provideAdapter(ObjectCopier, (IContained, ), IObjectCopier)
+
+
+class IOnlyItems(Interface):
+    """Items accepted by the restricted container of the tests."""
+
+
+class MetricsTest(unittest.TestCase):
+
+    def setUp(self):
+        setUp()
+        self.registry = MetricsRegistry()
+        setMetricsRegistry(self.registry)
+        self.source = SampleContainer()
+        for name in ('a', 'b', 'c'):
+            self.source[name] = Contained()
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def test_disabled(self):
+        setMetricsRegistry(None)
+        ObjectCopier(self.source['a']).copyTo(self.source)
+        self.assertEqual(self.registry.counters, {})
+        self.assertIsNone(getMetricsRegistry())
+
+    def test_batches(self):
+        target = SampleContainer()
+        ObjectBatchCopier(target).copyObjects(self.source.values())
+        ObjectBatchMover(target).moveObjects(
+            [self.source['a'], self.source['b']])
+        counters = self.registry.counters
+        self.assertEqual(counters['copyObjects'], 1)
+        self.assertEqual(counters['copyTo'], 3)
+        self.assertEqual(counters['moveObjects'], 1)
+        self.assertEqual(counters['moveTo'], 2)
+        self.assertEqual(counters['chooseName.collisions'], 2)
+        items = self.registry.histograms['copyObjects.items']
+        self.assertEqual(items.bounds, ITEMS_BOUNDS)
+        self.assertEqual(items.sum, 3)
+        self.assertEqual(self.registry.histograms['moveObjects.items'].sum,
+                         2)
+        self.assertGreater(self.registry.rate('copyTo'), 0)
+        self.assertEqual(self.registry.rate('unknown'), 0)
+
+    def test_renames(self):
+        ContainerItemRenamer(self.source).renameItem('a', 'x')
+        ordered = OrderedContainer()
+        ordered['a'] = Contained()
+        OrderedContainerItemRenamer(ordered).renameItem('a', 'y')
+        ContainerItemPatternRenamer(self.source).renameMatching(
+            '([bc])', r'z\1')
+        counters = self.registry.counters
+        self.assertEqual(counters['renameItem'], 2)
+        self.assertEqual(counters['renameMatching'], 1)
+        self.assertEqual(
+            self.registry.histograms['renameMatching.items'].sum, 2)
+
+    def test_errors(self):
+        renamer = ContainerItemRenamer(self.source)
+        with self.assertRaises(ItemNotFoundError):
+            renamer.renameItem('missing', 'x')
+        self.assertEqual(self.registry.counters['renameItem.errors'], 1)
+        with self.assertRaises(TypeError):
+            # An object without a container to be moved from.
+            ObjectBatchMover(self.source).moveObjects([Contained()])
+        self.assertEqual(self.registry.counters['moveObjects.errors'], 1)
+        self.assertEqual(
+            self.registry.histograms['moveObjects.items'].counts[0], 1)
+
+    def test_constraints(self):
+        from zope.container.constraints import contains
+
+        class IRestricted(Interface):
+            contains(IOnlyItems)
+
+        @implementer(IRestricted)
+        class Restricted(SampleContainer):
+            pass
+
+        restricted = Restricted()
+        self.assertFalse(ObjectMover(self.source['a']).moveableTo(restricted))
+        self.assertTrue(ObjectMover(self.source['a']).moveableTo(
+            SampleContainer()))
+        self.assertFalse(
+            ObjectCopier(self.source['a']).copyableTo(restricted))
+        counters = self.registry.counters
+        self.assertEqual(counters['moveableTo'], 2)
+        self.assertEqual(counters['moveableTo.rejections'], 1)
+        self.assertEqual(counters['copyableTo'], 1)
+        self.assertEqual(counters['copyableTo.rejections'], 1)
+
+    def test_clipboard(self):
+        clipboard = PrincipalClipboard({})
+        clipboard.addItems('copy', ['/a', '/b'])
+        clipboard.setContents(())
+        clipboard.clearContents()
+        counters = self.registry.counters
+        self.assertEqual(counters['clipboard.addItems'], 1)
+        self.assertEqual(counters['clipboard.setContents'], 1)
+        self.assertEqual(counters['clipboard.clearContents'], 1)
+
+    def test_snapshot(self):
+        ObjectCopier(self.source['a']).copyTo(self.source)
+        snapshot = json.loads(json.dumps(self.registry.snapshot()))
+        self.assertEqual(snapshot['counters']['copyTo'], 1)
+        self.assertEqual(snapshot['histograms']['copyTo.seconds']['count'],
+                         1)
+
+
+class TraceTest(unittest.TestCase):
+
+    def setUp(self):
+        setUp()
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'trace.jsonl')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+        testing.tearDown()
+
+    def test_trace(self):
+        registry = MetricsRegistry(self.path)
+        setMetricsRegistry(registry)
+        source = SampleContainer()
+        source['a'] = Contained()
+        ObjectBatchCopier(SampleContainer()).copyObjects([source['a']])
+        with self.assertRaises(ItemNotFoundError):
+            ContainerItemRenamer(source).renameItem('missing', 'x')
+        registry.flush()
+        with open(self.path) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([record['operation'] for record in records],
+                         ['copyTo', 'copyObjects', 'renameItem'])
+        self.assertEqual(records[1]['items'], 1)
+        self.assertEqual(records[2]['error'], 'ItemNotFoundError')
+        self.assertIsNone(records[0]['error'])
+        registry.close()
+        registry.close()
+        registry.flush()
+        # Appended to.
+        registry = MetricsRegistry(self.path)
+        registry.record('test', 1.0)
+        registry.close()
+        with open(self.path) as f:
+            self.assertEqual(len(f.readlines()), 4)
+
+
+def test_suite():
+    return unittest.TestSuite((
+        unittest.defaultTestLoader.loadTestsFromName(__name__),
+        doctest.DocTestSuite(
+            'zope.copypastemove.metrics',
+            setUp=setUp,
+            tearDown=testing.tearDown),
+    ))
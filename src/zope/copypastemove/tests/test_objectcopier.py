@@ -105,6 +105,21 @@ class ObjectCopierTest(testing.ContainerPlacefulSetup, unittest.TestCase):
         self.assertIn('file1', container)
         self.assertIn('file2', container)
 
+    def test_copytoposition(self):
+        from zope.container.ordered import OrderedContainer
+        root = self.rootFolder
+        container = traverse(root, 'folder1')
+        container['file1'] = File()
+        target = OrderedContainer()
+        root['ordered'] = target
+        target['a'] = File()
+        target['b'] = File()
+        file = traverse(root, 'folder1/file1')
+        copier = IObjectCopier(file)
+        self.assertEqual(copier.copyToPosition(target, index=1), 'file1')
+        self.assertIn('file1', container)
+        self.assertEqual(list(target.keys()), ['a', 'file1', 'b'])
+
     def test_copytoother(self):
         root = self.rootFolder
         container = traverse(root, 'folder1')
@@ -155,6 +155,32 @@ class ObjectMoverTest(testing.ContainerPlacefulSetup, unittest.TestCase):
         self.assertIn('file1', target)
         self.assertIn('file1-2', target)
 
+    def test_movetoposition(self):
+        from zope.container.ordered import OrderedContainer
+        root = self.rootFolder
+        container = traverse(root, 'folder1')
+        container['file1'] = File()
+        target = OrderedContainer()
+        root['ordered'] = target
+        target['a'] = File()
+        target['b'] = File()
+        file = traverse(root, 'folder1/file1')
+        mover = IObjectMover(file)
+        self.assertEqual(mover.moveToPosition(target, before='b'), 'file1')
+        self.assertNotIn('file1', container)
+        self.assertEqual(list(target.keys()), ['a', 'file1', 'b'])
+
+    def test_movetopositionsame(self):
+        from zope.container.ordered import OrderedContainer
+        root = self.rootFolder
+        target = OrderedContainer()
+        root['ordered'] = target
+        target['a'] = File()
+        target['b'] = File()
+        mover = IObjectMover(traverse(root, 'ordered/b'))
+        self.assertEqual(mover.moveToPosition(target, index=0), 'b')
+        self.assertEqual(list(target.keys()), ['b', 'a'])
+
     def test_moveable(self):
         root = self.rootFolder
         container = traverse(root, 'folder1')
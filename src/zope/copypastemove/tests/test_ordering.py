@@ -0,0 +1,284 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Ordering tests
+"""
+import doctest
+import unittest
+
+from zope.component import testing
+from zope.component.eventtesting import clearEvents
+from zope.component.eventtesting import getEvents
+from zope.component.eventtesting import setUp as eventSetUp
+from zope.container.btree import BTreeContainer
+from zope.container.contained import Contained
+from zope.container.interfaces import IContainerModifiedEvent
+from zope.container.ordered import OrderedContainer
+from zope.container.sample import SampleContainer
+from zope.location.interfaces import IContained
+
+from zope.copypastemove.interfaces import ItemNotFoundError
+from zope.copypastemove.ordering import placeInTarget
+from zope.copypastemove.ordering import placeKeys
+
+
+class UpdatingContainer(OrderedContainer):
+    # An ordered container whose order can only be changed through
+    # ``updateOrder``, like third-party implementations.
+
+    updates = 0
+
+    def updateOrder(self, order):
+        self.updates += 1
+        OrderedContainer.updateOrder(self, order)
+
+
+def _fill(container, names):
+    for name in names:
+        container[name] = name.upper()
+    return container
+
+
+class PlaceKeysTest(unittest.TestCase):
+
+    def setUp(self):
+        testing.setUp()
+        eventSetUp()
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def _keys(self, container):
+        return ''.join(container.keys())
+
+    def test_index_counts_remaining_keys(self):
+        container = _fill(OrderedContainer(), 'abcdef')
+        placeKeys(container, ['a', 'b'], index=2)
+        self.assertEqual(self._keys(container), 'cdabef')
+
+    def test_negative_index(self):
+        container = _fill(OrderedContainer(), 'abcdef')
+        placeKeys(container, ['a'], index=-1)
+        self.assertEqual(self._keys(container), 'bcdeaf')
+        placeKeys(container, ['f'], index=-100)
+        self.assertEqual(self._keys(container), 'fbcdea')
+
+    def test_index_past_end(self):
+        container = _fill(OrderedContainer(), 'abc')
+        placeKeys(container, ['a'], index=100)
+        self.assertEqual(self._keys(container), 'bca')
+
+    def test_default_is_end(self):
+        container = _fill(OrderedContainer(), 'abc')
+        placeKeys(container, ['b', 'a'])
+        self.assertEqual(self._keys(container), 'cba')
+
+    def test_duplicate_and_empty_names(self):
+        container = _fill(OrderedContainer(), 'abc')
+        self.assertFalse(placeKeys(container, []))
+        placeKeys(container, ['c', 'c'], index=0)
+        self.assertEqual(self._keys(container), 'cab')
+
+    def test_only_one_position(self):
+        container = _fill(OrderedContainer(), 'abc')
+        with self.assertRaises(TypeError):
+            placeKeys(container, ['a'], index=1, before='b')
+
+    def test_unknown_anchor(self):
+        container = _fill(OrderedContainer(), 'abc')
+        with self.assertRaises(ItemNotFoundError):
+            placeKeys(container, ['a'], before='x')
+        with self.assertRaises(ItemNotFoundError):
+            placeKeys(container, ['a', 'x'], index=0)
+
+    def test_notifies_only_on_change(self):
+        container = _fill(OrderedContainer(), 'abc')
+        clearEvents()
+        self.assertFalse(placeKeys(container, ['a'], index=0))
+        self.assertEqual(getEvents(IContainerModifiedEvent), [])
+        self.assertTrue(placeKeys(container, ['a'], after='b'))
+        self.assertEqual(
+            [e.object for e in getEvents(IContainerModifiedEvent)],
+            [container])
+
+    def test_subclasses_edit_order_in_place(self):
+        container = _fill(type('Sub', (OrderedContainer, ), {})(), 'abcdef')
+        order = container._order
+        placeKeys(container, ['f'], index=0)
+        self.assertIs(container._order, order)
+        self.assertEqual(self._keys(container), 'fabcde')
+
+    def test_overridden_update_order(self):
+        container = _fill(UpdatingContainer(), 'abcdef')
+        placeKeys(container, ['f'], index=0)
+        self.assertEqual(container.updates, 1)
+        self.assertEqual(self._keys(container), 'fabcde')
+
+    def test_update_order_for_proxies(self):
+        from zope.proxy import ProxyBase
+        container = _fill(UpdatingContainer(), 'abcdef')
+        placeKeys(ProxyBase(container), ['a', 'b'], after='e')
+        self.assertEqual(container.updates, 1)
+        self.assertEqual(self._keys(container), 'cdeabf')
+
+    def test_placeInTarget(self):
+        container = _fill(OrderedContainer(), 'abc')
+        self.assertFalse(placeInTarget(container, ['c']))
+        self.assertTrue(placeInTarget(container, ['c'], 0))
+        self.assertEqual(self._keys(container), 'cab')
+        unordered = _fill(SampleContainer(), 'abc')
+        self.assertFalse(placeInTarget(unordered, ['c'], 0))
+
+
+class ReordererTest(unittest.TestCase):
+
+    def setUp(self):
+        testing.setUp()
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def test_adapter(self):
+        from zope.component import provideAdapter
+
+        from zope.copypastemove import OrderedContainerItemReorderer
+        from zope.copypastemove.interfaces import IContainerItemReorderer
+        provideAdapter(OrderedContainerItemReorderer)
+        container = _fill(OrderedContainer(), 'abc')
+        reorderer = IContainerItemReorderer(container)
+        self.assertIsInstance(reorderer, OrderedContainerItemReorderer)
+        self.assertFalse(reorderer.moveUp('a'))
+        self.assertTrue(reorderer.moveDown('a', 100))
+        self.assertEqual(container.keys(), ['b', 'c', 'a'])
+
+    def test_proxied_container(self):
+        from zope.proxy import ProxyBase
+
+        from zope.copypastemove import OrderedContainerItemReorderer
+        container = _fill(UpdatingContainer(), 'abc')
+        reorderer = OrderedContainerItemReorderer(ProxyBase(container))
+        self.assertTrue(reorderer.moveUp('c', 2))
+        self.assertEqual(container.keys(), ['c', 'a', 'b'])
+        self.assertEqual(container.updates, 1)
+
+
+class RecordingContainer(BTreeContainer):
+
+    def __init__(self, log):
+        super().__init__()
+        self.log = log
+
+    def __setitem__(self, key, value):
+        self.log.append(('set', key))
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self.log.append(('del', key))
+        super().__delitem__(key)
+
+
+class InsertionOrderTest(unittest.TestCase):
+
+    def setUp(self):
+        from zope.component import provideAdapter
+        from zope.container.testing import PlacelessSetup
+        from zope.copy.interfaces import ICopyHook
+        from zope.location.interfaces import ILocation
+        from zope.location.pickling import LocationCopyHook
+
+        from zope.copypastemove import ObjectCopier
+        from zope.copypastemove import ObjectMover
+        from zope.copypastemove.interfaces import IObjectCopier
+        from zope.copypastemove.interfaces import IObjectMover
+        testing.setUp()
+        PlacelessSetup().setUp()
+        provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+        provideAdapter(ObjectMover, (IContained, ), IObjectMover)
+        provideAdapter(ObjectCopier, (IContained, ), IObjectCopier)
+        self.log = []
+        self.source = RecordingContainer(self.log)
+        for name in 'dbeac':
+            self.source[name] = Contained()
+        self.target = RecordingContainer(self.log)
+        del self.log[:]
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def _objects(self):
+        return [self.source[name] for name in 'ebdc']
+
+    def test_move_into_btree(self):
+        from zope.copypastemove import ObjectBatchMover
+        names = ObjectBatchMover(self.target).moveObjects(self._objects())
+        self.assertEqual(names, list('ebdc'))
+        self.assertEqual(self.log, [(op, name) for name in 'bcde'
+                                    for op in ('set', 'del')])
+
+    def test_move_values_of_source(self):
+        from zope.copypastemove import ObjectBatchMover
+
+        # From a BTree source, then back from a dict based one.
+        middle = SampleContainer()
+        for source, target in ((self.source, middle), (middle, self.target)):
+            names = ObjectBatchMover(target).moveObjects(source.values())
+            self.assertEqual(sorted(names), list('abcde'))
+            self.assertEqual(len(source), 0)
+
+    def test_duplicate_values_of_target(self):
+        from zope.copypastemove import ObjectBatchCopier
+        folder = SampleContainer()
+        for name in 'ab':
+            folder[name] = Contained()
+        names = ObjectBatchCopier(folder).copyObjects(folder.values())
+        self.assertEqual(len(names), 2)
+        self.assertEqual(len(folder), 4)
+
+    def test_copy_into_btree(self):
+        from zope.copypastemove import ObjectBatchCopier
+        names = ObjectBatchCopier(self.target).copyObjects(self._objects())
+        self.assertEqual(names, list('ebdc'))
+        self.assertEqual(self.log, [('set', name) for name in 'bcde'])
+
+    def test_async_move_into_btree(self):
+        import asyncio
+
+        from zope.copypastemove.aio import AsyncObjectBatchMover
+        mover = AsyncObjectBatchMover(self.target)
+        mover.sliceSize = 3
+        names = asyncio.run(mover.moveObjects(self._objects()))
+        self.assertEqual(names, list('ebdc'))
+        self.assertEqual(self.log, [(op, name) for name in 'bcde'
+                                    for op in ('set', 'del')])
+
+    def test_given_order_for_other_containers(self):
+        from zope.copypastemove import ObjectBatchMover
+        target = OrderedContainer()
+        names = ObjectBatchMover(target).moveObjects(self._objects())
+        self.assertEqual(names, list('ebdc'))
+        self.assertEqual(list(target.keys()), list('ebdc'))
+        self.assertEqual(self.log, [('del', name) for name in 'ebdc'])
+
+
+def test_suite():
+    flags = (doctest.NORMALIZE_WHITESPACE
+             | doctest.ELLIPSIS
+             | doctest.IGNORE_EXCEPTION_DETAIL)
+    return unittest.TestSuite((
+        unittest.defaultTestLoader.loadTestsFromName(__name__),
+        doctest.DocTestSuite(
+            'zope.copypastemove.ordering',
+            setUp=lambda test: testing.setUp(),
+            tearDown=testing.tearDown,
+            optionflags=flags),
+    ))
@@ -0,0 +1,184 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Subscriber profiling tests
+"""
+import doctest
+import threading
+import time
+import unittest
+from unittest.mock import ANY
+
+import zope.component.event
+import zope.container.contained
+import zope.event
+from zope.component import provideAdapter
+from zope.component import provideHandler
+from zope.component import testing
+from zope.container.contained import Contained
+from zope.container.contained import ContainerSublocations
+from zope.container.interfaces import IReadContainer
+from zope.container.sample import SampleContainer
+from zope.container.testing import PlacelessSetup
+from zope.copy.interfaces import ICopyHook
+from zope.lifecycleevent import ObjectCopiedEvent
+from zope.lifecycleevent import ObjectMovedEvent
+from zope.lifecycleevent.interfaces import IObjectCopiedEvent
+from zope.lifecycleevent.interfaces import IObjectMovedEvent
+from zope.location.interfaces import IContained
+from zope.location.interfaces import ILocation
+from zope.location.interfaces import ISublocations
+from zope.location.pickling import LocationCopyHook
+
+import zope.copypastemove
+from zope.copypastemove import ObjectCopier
+from zope.copypastemove import ObjectMover
+from zope.copypastemove.interfaces import IObjectMover
+from zope.copypastemove.profiling import SubscriberKey
+from zope.copypastemove.profiling import SubscriberProfiler
+
+
+def setUp(test=None):
+    testing.setUp()
+    PlacelessSetup().setUp()
+    provideAdapter(ContainerSublocations, (IReadContainer, ), ISublocations)
+    provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+    provideAdapter(ObjectMover, (IContained, ), IObjectMover)
+    provideHandler(zope.component.event.objectEventNotify)
+
+
+def slowHandler(obj, event):
+    time.sleep(0.01)
+
+
+def fastHandler(obj, event):
+    pass
+
+
+class ProfilerTest(unittest.TestCase):
+
+    setUp = setUp
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def tree(self):
+        source = SampleContainer()
+        source['folder'] = folder = SampleContainer()
+        folder['sub'] = sub = SampleContainer()
+        sub['leaf'] = Contained()
+        return source
+
+    def test_copy(self):
+        provideHandler(slowHandler, (IContained, IObjectCopiedEvent))
+        provideHandler(fastHandler, (IContained, IObjectCopiedEvent))
+        provideHandler(zope.copypastemove.dispatchToSublocations,
+                       (ILocation, IObjectCopiedEvent))
+        source = self.tree()
+        with SubscriberProfiler() as profiler:
+            ObjectCopier(source['folder']).copyTo(SampleContainer())
+        self.assertEqual(
+            profiler.totals('subscriber', 'depth'),
+            {(slowHandler, 0): (1, ANY),
+             (slowHandler, 1): (1, ANY),
+             (slowHandler, 2): (1, ANY),
+             (fastHandler, 0): (1, ANY),
+             (fastHandler, 1): (1, ANY),
+             (fastHandler, 2): (1, ANY)})
+        self.assertEqual(list(profiler.totals('event')),
+                         [(ObjectCopiedEvent, )])
+
+        report = profiler.report().splitlines()
+        self.assertEqual(report[0].split(), ['seconds', 'calls', 'subscriber'])
+        self.assertEqual(report[1].split()[1:], [
+            '3', 'zope.copypastemove.tests.test_profiling.slowHandler'])
+        self.assertEqual(len(report), 3)
+        self.assertEqual(len(profiler.report(limit=1).splitlines()), 2)
+        byDepth = profiler.report(by=('subscriber', 'depth')).splitlines()
+        self.assertEqual(byDepth[0].split()[2:], ['subscriber', 'depth'])
+        self.assertEqual(
+            sorted(line.split()[-2:] for line in byDepth[1:4]),
+            [[slowHandler.__module__ + '.slowHandler', depth]
+             for depth in '012'])
+
+    def test_move(self):
+        # zope.container's dispatcher for moves is expanded too.
+        provideHandler(fastHandler, (IContained, IObjectMovedEvent))
+        provideHandler(zope.container.contained.dispatchToSublocations,
+                       (ILocation, IObjectMovedEvent))
+        source = self.tree()
+        target = SampleContainer()
+        with SubscriberProfiler() as profiler:
+            ObjectMover(source['folder']).moveTo(target)
+        self.assertEqual(
+            profiler.totals('depth'),
+            {(0, ): (1, ANY),
+             (1, ): (1, ANY),
+             (2, ): (1, ANY)})
+        self.assertEqual(list(profiler.totals('event')),
+                         [(ObjectMovedEvent, )])
+
+    def test_other_threads(self):
+        calls = []
+        provideHandler(lambda obj, event: calls.append(obj),
+                       (None, IObjectCopiedEvent))
+        with SubscriberProfiler() as profiler:
+            thread = threading.Thread(
+                target=zope.event.notify,
+                args=(ObjectCopiedEvent(Contained(), None), ))
+            thread.start()
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(profiler.stats, {})
+        self.assertIn(zope.component.event.dispatch, zope.event.subscribers)
+
+    def test_errors_are_recorded(self):
+        def failing(obj, event):
+            raise ValueError
+        provideHandler(failing, (None, IObjectCopiedEvent))
+        with self.assertRaises(ValueError):
+            with SubscriberProfiler() as profiler:
+                zope.event.notify(ObjectCopiedEvent(Contained(), None))
+        self.assertEqual(list(profiler.totals('subscriber').values())[0][0],
+                         1)
+        self.assertIn(zope.component.event.dispatch, zope.event.subscribers)
+
+    def test_one_at_a_time(self):
+        with SubscriberProfiler():
+            with self.assertRaises(ValueError):
+                SubscriberProfiler().__enter__()
+
+    def test_names(self):
+        profiler = SubscriberProfiler()
+        profiler.stats[SubscriberKey(
+            Handler(), ObjectCopiedEvent, 0)] = (1, 1.0)
+        self.assertIn('<a handler>', profiler.report())
+
+
+class Handler:
+    # A subscriber without a module or name.
+
+    __module__ = None
+
+    def __repr__(self):
+        return '<a handler>'
+
+
+def test_suite():
+    return unittest.TestSuite((
+        unittest.defaultTestLoader.loadTestsFromName(__name__),
+        doctest.DocTestSuite(
+            'zope.copypastemove.profiling',
+            setUp=setUp,
+            tearDown=testing.tearDown),
+    ))
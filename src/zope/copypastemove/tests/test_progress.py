@@ -0,0 +1,167 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Progress and cancellation tests
+"""
+import doctest
+import threading
+import unittest
+
+from zope.component import provideAdapter
+from zope.component import provideHandler
+from zope.component import testing
+from zope.component.event import objectEventNotify
+from zope.container.contained import Contained
+from zope.container.contained import ContainerSublocations
+from zope.container.interfaces import IReadContainer
+from zope.container.sample import SampleContainer
+from zope.container.testing import PlacelessSetup
+from zope.copy.interfaces import ICopyHook
+from zope.lifecycleevent.interfaces import IObjectCopiedEvent
+from zope.location.interfaces import ILocation
+from zope.location.interfaces import ISublocations
+from zope.location.pickling import LocationCopyHook
+
+from zope.copypastemove import ObjectBatchCopier
+from zope.copypastemove import ObjectCopier
+from zope.copypastemove import dispatchToSublocations
+from zope.copypastemove.caching import CopyCache
+from zope.copypastemove.interfaces import IObjectCopier
+from zope.copypastemove.interfaces import OperationCancelled
+from zope.copypastemove.progress import CancellationToken
+from zope.copypastemove.progress import currentOperation
+from zope.copypastemove.progress import operation
+
+
+class Versioned(Contained):
+
+    version = 1
+
+
+def setUp(test=None):
+    testing.setUp()
+    PlacelessSetup().setUp()
+    provideAdapter(ContainerSublocations, (IReadContainer, ), ISublocations)
+    provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+    provideAdapter(ObjectCopier, (ILocation, ), IObjectCopier)
+
+
+def folder(items):
+    folder = SampleContainer()
+    for i in range(items):
+        folder['item%d' % i] = Contained()
+    return folder
+
+
+class OperationTest(unittest.TestCase):
+
+    setUp = setUp
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def test_nested(self):
+        outer, inner = [], []
+        token = CancellationToken()
+        with operation(outer.append, token) as op:
+            with operation(inner.append) as nested:
+                self.assertIs(nested.parent, op)
+                nested.copied(10)
+                nested.done()
+                token.cancel()
+                with self.assertRaises(OperationCancelled):
+                    nested.check()
+            self.assertIs(currentOperation(), op)
+        self.assertEqual([(p.items, p.bytes) for p in inner],
+                         [(0, 10), (1, 10)])
+        self.assertEqual([(p.items, p.bytes) for p in outer], [(0, 10)])
+        self.assertGreaterEqual(outer[0].elapsed, 0)
+
+    def test_threads(self):
+        seen = []
+        with operation():
+            thread = threading.Thread(
+                target=lambda: seen.append(currentOperation()))
+            thread.start()
+            thread.join()
+        self.assertEqual(seen, [None])
+
+
+class CancelCopyTest(unittest.TestCase):
+
+    setUp = setUp
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def test_cancel_between_sublocations(self):
+        source = SampleContainer()
+        source['folder'] = folder(10)
+        token = CancellationToken()
+        checked = []
+
+        class Hook(LocationCopyHook):
+            def __call__(self, toplevel, register):
+                checked.append(self.context)
+                if len(checked) == 3:
+                    token.cancel()
+                return LocationCopyHook.__call__(self, toplevel, register)
+        provideAdapter(Hook, (Contained, ), ICopyHook)
+
+        target = SampleContainer()
+        with self.assertRaises(OperationCancelled):
+            ObjectBatchCopier(target).copyObjects(
+                [source['folder']], token=token)
+        self.assertEqual(len(checked), 3)
+        self.assertEqual(list(target), [])
+
+    def test_cancel_event_dispatch(self):
+        token = CancellationToken()
+        seen = []
+
+        def handler(obj, event):
+            seen.append(obj)
+            token.cancel()
+        provideHandler(objectEventNotify)
+        provideHandler(handler, (None, IObjectCopiedEvent))
+        provideHandler(dispatchToSublocations, (None, IObjectCopiedEvent))
+
+        source = SampleContainer()
+        source['folder'] = folder(3)
+        target = SampleContainer()
+        with self.assertRaises(OperationCancelled):
+            ObjectBatchCopier(target).copyObjects(
+                [source['folder']], token=token)
+        # The copied folder, then the cancelled dispatch to its items.
+        self.assertEqual(len(seen), 1)
+
+    def test_cached_copies_count(self):
+        source = SampleContainer()
+        source['item'] = item = Versioned()
+        cache = CopyCache(versionOf=lambda obj: obj.version)
+        copier = ObjectCopier(item)
+        copier.cache = cache
+        reports = []
+        with operation(reports.append):
+            copier.copyTo(SampleContainer())
+            copier.copyTo(SampleContainer())
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(len(reports), 2)
+        self.assertEqual(reports[1].bytes, 2 * reports[0].bytes)
+
+
+def test_suite():
+    return unittest.TestSuite((
+        unittest.defaultTestLoader.loadTestsFromName(__name__),
+        doctest.DocTestSuite('zope.copypastemove.progress'),
+    ))
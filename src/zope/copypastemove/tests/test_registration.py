@@ -0,0 +1,99 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Registration without ZCML and import tests
+"""
+import doctest
+import subprocess
+import sys
+import unittest
+
+import zope.configuration.xmlconfig
+from zope.component import getGlobalSiteManager
+from zope.component import testing
+from zope.interface.registry import Components
+
+import zope.copypastemove
+from zope.copypastemove.registration import register
+
+
+def registrations(components):
+    adapters = {(reg.required, reg.provided, reg.name)
+                for reg in components.registeredAdapters()}
+    handlers = {reg.required for reg in components.registeredHandlers()}
+    return adapters, handlers
+
+
+class RegistrationTest(unittest.TestCase):
+
+    def setUp(self):
+        testing.setUp()
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def test_same_as_zcml(self):
+        components = Components()
+        register(components)
+        zope.configuration.xmlconfig.XMLConfig(
+            'configure.zcml', zope.copypastemove)()
+        self.assertEqual(registrations(components),
+                         registrations(getGlobalSiteManager()))
+
+    def test_current_site_manager(self):
+        register()
+        adapters, handlers = registrations(getGlobalSiteManager())
+        self.assertEqual(len(adapters), 11)
+        self.assertEqual(len(handlers), 1)
+
+
+class ImportTest(unittest.TestCase):
+
+    def test_no_security_or_sample_container(self):
+        # Run in a new process, as other tests import these modules.
+        modules = subprocess.check_output([sys.executable, '-c', (
+            'import sys, zope.copypastemove\n'
+            'print(sorted(name for name in sys.modules'
+            ' if name.startswith(("zope.security", "zope.exceptions",'
+            ' "zope.container.sample", "concurrent.futures.process"))))'
+        )])
+        self.assertEqual(modules.strip(), b'[]')
+
+    def test_example_container(self):
+        from zope.container.interfaces import INameChooser
+        container = zope.copypastemove.ExampleContainer()
+        container['a'] = 1
+        self.assertEqual(INameChooser(container).chooseName('a', 2), 'a_')
+
+    def test_example_container_pickles(self):
+        import pickle
+        container = zope.copypastemove.ExampleContainer()
+        container['a'] = 1
+        copied = pickle.loads(pickle.dumps(container))
+        self.assertIs(type(copied), zope.copypastemove.ExampleContainer)
+        self.assertEqual(copied['a'], 1)
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            zope.copypastemove.Unknown
+
+
+def test_suite():
+    return unittest.TestSuite((
+        unittest.defaultTestLoader.loadTestsFromName(__name__),
+        doctest.DocTestSuite(
+            'zope.copypastemove.registration',
+            setUp=testing.setUp,
+            tearDown=testing.tearDown,
+            optionflags=doctest.ELLIPSIS),
+    ))
@@ -0,0 +1,238 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Moves that don't load the contents of the moved objects
+"""
+import doctest
+import unittest
+
+import transaction
+import zope.container.contained
+import zope.event
+from persistent import Persistent
+from ZODB.DB import DB
+from ZODB.MappingStorage import MappingStorage
+from zope.component import provideAdapter
+from zope.component import provideHandler
+from zope.component import testing
+from zope.component.eventtesting import clearEvents
+from zope.component.eventtesting import getEvents
+from zope.component.eventtesting import setUp as eventSetUp
+from zope.container.btree import BTreeContainer
+from zope.container.contained import Contained
+from zope.container.contained import ContainerSublocations
+from zope.container.interfaces import IContainerModifiedEvent
+from zope.container.interfaces import IReadContainer
+from zope.container.ordered import OrderedContainer
+from zope.container.testing import PlacelessSetup
+from zope.copy.interfaces import ICopyHook
+from zope.lifecycleevent.interfaces import IObjectAddedEvent
+from zope.lifecycleevent.interfaces import IObjectMovedEvent
+from zope.location.interfaces import IContained
+from zope.location.interfaces import ILocation
+from zope.location.interfaces import ISublocations
+from zope.location.pickling import LocationCopyHook
+
+from zope.copypastemove import ObjectMover
+from zope.copypastemove import dispatchToSublocations
+from zope.copypastemove.interfaces import IObjectMover
+from zope.copypastemove.interfaces import OperationCancelled
+from zope.copypastemove.progress import CancellationToken
+from zope.copypastemove.relocation import moveItems
+
+
+class Item(Persistent, Contained):
+
+    def __init__(self, data=b''):
+        self.data = data
+
+
+class FailingContainer(BTreeContainer):
+
+    def __setitem__(self, name, obj):
+        raise ValueError(name)
+
+
+def setUp(test=None):
+    testing.setUp()
+    PlacelessSetup().setUp()
+    eventSetUp()
+
+
+class MoveItemsTest(unittest.TestCase):
+
+    def setUp(self):
+        setUp()
+        self.db = DB(MappingStorage())
+        self.conn = self.db.open()
+        root = self.conn.root()
+        root['source'] = source = BTreeContainer()
+        root['target'] = BTreeContainer()
+        for name in ('a', 'b'):
+            source[name] = folder = BTreeContainer()
+            folder['x'] = Item(b'x' * 1000)
+            folder['y'] = sub = BTreeContainer()
+            sub['z'] = Item()
+        source['c'] = Item()
+        transaction.commit()
+        self.conn.cacheMinimize()
+        self.source = root['source']
+        self.target = root['target']
+        clearEvents()
+
+    def tearDown(self):
+        transaction.abort()
+        self.conn.close()
+        self.db.close()
+        testing.tearDown()
+
+    def test_descendants_stay_ghosts(self):
+        provideAdapter(ContainerSublocations, (IReadContainer, ),
+                       ISublocations)
+        provideHandler(zope.container.contained.dispatchToSublocations,
+                       (ILocation, IObjectMovedEvent))
+        a, b = self.source['a'], self.source['b']
+        self.assertEqual(moveItems([(self.source, 'a')], self.target), ['a'])
+        transaction.commit()
+        self.assertIs(self.target['a'], a)
+        self.assertIs(a.__parent__, self.target)
+        data = a._SampleContainer__data
+        self.assertIsNone(data._p_changed)
+        for obj in data.values():
+            self.assertIsNone(obj._p_changed)
+        self.assertIs(a['y'].__parent__, a)
+        # Unlike moving it with its IObjectMover.
+        ObjectMover(b).moveTo(self.target)
+        self.assertFalse(b._SampleContainer__data._p_changed)
+
+    def test_events(self):
+        moveItems([(self.source, 'a'), (self.source, 'c')], self.target)
+        moved = getEvents(IObjectMovedEvent)
+        self.assertEqual(
+            [(event.object.__name__, event.oldParent, event.newParent)
+             for event in moved],
+            [('a', self.source, self.target), ('c', self.source, self.target)])
+        self.assertEqual(getEvents(IObjectAddedEvent), [])
+        self.assertEqual(
+            [event.object for event in getEvents(IContainerModifiedEvent)],
+            [self.source, self.source, self.target])
+
+    def test_sublocation_dispatchers_skipped(self):
+        provideHandler(dispatchToSublocations, (ILocation, IObjectMovedEvent))
+        log = []
+        provideHandler(lambda obj, event: log.append(obj.__name__),
+                       (ILocation, IObjectMovedEvent))
+        provideHandler(lambda event: log.append(event.newName),
+                       (IObjectMovedEvent, ))
+        moveItems([(self.source, 'a')], self.target)
+        self.assertEqual(sorted(log), ['a', 'a'])
+
+    def test_event_subscribers(self):
+        log = []
+        zope.event.subscribers.append(log.append)
+        try:
+            moveItems([(self.source, 'c')], self.target)
+        finally:
+            zope.event.subscribers.remove(log.append)
+        self.assertEqual([type(event).__name__ for event in log],
+                         ['ContainerModifiedEvent', 'ObjectMovedEvent',
+                          'ContainerModifiedEvent'])
+
+    def test_names_in_order_given(self):
+        self.target['c'] = Item()
+        names = moveItems([(self.source, 'c'), (self.source, 'a')],
+                          self.target)
+        self.assertEqual(names, ['c-2', 'a'])
+        self.assertEqual(list(self.source), ['b'])
+        self.assertEqual(self.target['c-2'].__name__, 'c-2')
+
+    def test_items_computed_from_source(self):
+        target = self.conn.root()['ordered'] = OrderedContainer()
+        names = moveItems(((self.source, name) for name in self.source),
+                          target)
+        self.assertEqual(names, ['a', 'b', 'c'])
+        self.assertEqual(len(self.source), 0)
+
+    def test_failed_insert(self):
+        target = self.conn.root()['failing'] = FailingContainer()
+        a = self.source['a']
+        with self.assertRaises(ValueError):
+            moveItems([(self.source, 'a')], target)
+        self.assertIs(a.__parent__, self.source)
+        self.assertEqual(a.__name__, 'a')
+        self.assertIs(self.source['a'], a)
+
+    def test_same_container(self):
+        names = moveItems([(self.source, 'a')], self.source)
+        self.assertEqual(names, ['a'])
+        self.assertEqual(list(self.source), ['a', 'b', 'c'])
+        self.assertEqual(getEvents(), [])
+
+    def test_ordered_target(self):
+        target = self.conn.root()['ordered'] = OrderedContainer()
+        target['first'] = Item()
+        names = moveItems([(self.source, 'c'), (self.source, 'a')], target,
+                          index=0)
+        self.assertEqual(names, ['c', 'a'])
+        self.assertEqual(list(target.keys()), ['c', 'a', 'first'])
+
+    def test_cancelled(self):
+        token = CancellationToken()
+        with self.assertRaises(OperationCancelled):
+            moveItems([(self.source, 'a'), (self.source, 'b')], self.target,
+                      progress=lambda report: token.cancel(), token=token)
+        self.assertEqual(list(self.target), ['a'])
+
+
+class OtherDatabaseTest(unittest.TestCase):
+
+    def setUp(self):
+        setUp()
+        provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+        provideAdapter(ObjectMover, (IContained, ), IObjectMover)
+        databases = {}
+        self.one = DB(MappingStorage(), databases=databases,
+                      database_name='one')
+        self.two = DB(MappingStorage(), databases=databases,
+                      database_name='two')
+        self.conn = self.one.open()
+        self.conn.root()['source'] = self.source = BTreeContainer()
+        self.source['a'] = Item()
+        root2 = self.conn.get_connection('two').root()
+        root2['target'] = self.target = BTreeContainer()
+        transaction.commit()
+
+    def tearDown(self):
+        transaction.abort()
+        self.conn.close()
+        self.one.close()
+        self.two.close()
+        testing.tearDown()
+
+    def test_copied(self):
+        original = self.source['a']
+        self.assertEqual(moveItems([(self.source, 'a')], self.target), ['a'])
+        transaction.commit()
+        self.assertIsNot(self.target['a'], original)
+        self.assertIs(self.target['a']._p_jar.db(), self.two)
+        self.assertEqual(len(self.source), 0)
+
+
+def test_suite():
+    return unittest.TestSuite((
+        unittest.defaultTestLoader.loadTestsFromName(__name__),
+        doctest.DocTestSuite(
+            'zope.copypastemove.relocation',
+            setUp=setUp,
+            tearDown=testing.tearDown),
+    ))
@@ -29,6 +29,7 @@ from zope.container.testing import PlacelessSetup
 from zope.copypastemove import ContainerItemRenamer
 from zope.copypastemove import ObjectMover
 from zope.copypastemove.interfaces import IContainerItemRenamer
+from zope.copypastemove.renaming import ContainerItemPatternRenamer
 
 
 class TestContainer(SampleContainer):
@@ -59,6 +60,91 @@ class RenamerTest(ContainerPlacefulSetup, unittest.TestCase):
         self.assertEqual(list(container), ['foobar'])
 
 
+class PatternRenamerTest(ContainerPlacefulSetup, unittest.TestCase):
+
+    def setUp(self):
+        ContainerPlacefulSetup.setUp(self)
+        provideAdapter(ObjectMover)
+
+    def _fill(self, container, names):
+        for name in names:
+            container[name] = Contained()
+        return container
+
+    def test_unordered_container_in_chunks(self):
+        container = self._fill(SampleContainer(), ['old-%d' % i
+                                                   for i in range(5)])
+        commits = []
+        renamer = ContainerItemPatternRenamer(container)
+        self.assertEqual(
+            renamer.renameMatching('old-', 'new-', chunkSize=2,
+                                   commit=lambda: commits.append(1)),
+            5)
+        self.assertEqual(sorted(container),
+                         ['new-%d' % i for i in range(5)])
+        self.assertEqual(len(commits), 3)
+
+    def test_ordered_container_keeps_order(self):
+        from zope.container.ordered import OrderedContainer
+        container = self._fill(OrderedContainer(), ['b', 'x-a', 'c', 'x-d'])
+        renamer = ContainerItemPatternRenamer(container)
+        self.assertEqual(renamer.renameMatching('x-', ''), 2)
+        self.assertEqual(container.keys(), ['b', 'a', 'c', 'd'])
+
+    def test_callable_replacement_and_compiled_pattern(self):
+        import re
+
+        from zope.container.btree import BTreeContainer
+        container = self._fill(BTreeContainer(), ['a1', 'a2', 'b1'])
+        renamer = ContainerItemPatternRenamer(container)
+        count = renamer.renameMatching(
+            re.compile(r'a(\d)'), lambda m: 'z' + m.group(1) * 2)
+        self.assertEqual(count, 2)
+        self.assertEqual(sorted(container), ['b1', 'z11', 'z22'])
+
+    def test_prefix_scan_skips_produced_names(self):
+        from zope.container.btree import BTreeContainer
+        container = self._fill(BTreeContainer(), ['p-a', 'p-b', 'q'])
+        renamer = ContainerItemPatternRenamer(container)
+        # The new names sort after the old ones and match the pattern
+        # again, but they are renamed only once.
+        self.assertEqual(renamer.renameMatching('p-', 'p-p-', chunkSize=1),
+                         2)
+        self.assertEqual(sorted(container), ['p-p-a', 'p-p-b', 'q'])
+
+    def test_no_state_kept(self):
+        from zope.container.btree import BTreeContainer
+        container = self._fill(BTreeContainer(), ['a-%d' % i
+                                                  for i in range(50)])
+        renamer = ContainerItemPatternRenamer(container)
+        self.assertEqual(renamer.renameMatching('a-', 'z-', chunkSize=10),
+                         50)
+        self.assertEqual(len(container), 50)
+        self.assertEqual(vars(renamer), {'container': container})
+
+    def test_skipped_collisions_in_btree_chunks(self):
+        from zope.container.btree import BTreeContainer
+        container = self._fill(BTreeContainer(), ['a1', 'a2', 'b'])
+        renamer = ContainerItemPatternRenamer(container)
+        self.assertEqual(
+            renamer.renameMatching('a.', 'b', chunkSize=1,
+                                   skipCollisions=True),
+            0)
+        self.assertEqual(sorted(container), ['a1', 'a2', 'b'])
+
+    def test_unchanged_names_are_skipped(self):
+        container = self._fill(SampleContainer(), ['a', 'b'])
+        renamer = ContainerItemPatternRenamer(container)
+        self.assertEqual(renamer.renameMatching('a', 'a'), 0)
+
+    def test_obstinate_name_chooser(self):
+        provideAdapter(ObstinateNameChooser)
+        container = self._fill(TestContainer(), ['foobar'])
+        renamer = ContainerItemPatternRenamer(container)
+        self.assertEqual(renamer.renameMatching('foo', 'baz'), 0)
+        self.assertEqual(list(container), ['foobar'])
+
+
 container_setup = PlacelessSetup()
 
 
@@ -145,4 +231,8 @@ def test_suite():
             'zope.copypastemove',
             setUp=globalSetUp, tearDown=testing.tearDown,
             optionflags=flags),
+        doctest.DocTestSuite(
+            'zope.copypastemove.renaming',
+            setUp=globalSetUp, tearDown=testing.tearDown,
+            optionflags=flags),
     ))
@@ -0,0 +1,219 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Copy strategy tests
+"""
+import doctest
+import unittest
+from unittest import mock
+
+from persistent import Persistent
+from zope.component import provideAdapter
+from zope.component import testing
+from zope.container.contained import Contained
+from zope.container.sample import SampleContainer
+from zope.container.testing import PlacelessSetup
+from zope.copy.interfaces import ICopyHook
+from zope.copy.interfaces import ResumeCopy
+from zope.location.interfaces import ILocation
+from zope.location.pickling import LocationCopyHook
+
+from zope.copypastemove import ObjectCopier
+from zope.copypastemove import cloning
+from zope.copypastemove.strategies import copyAttributes
+from zope.copypastemove.strategies import getCopyStrategy
+from zope.copypastemove.strategies import registerCopyStrategy
+from zope.copypastemove.strategies import unregisterCopyStrategy
+
+
+class Record(Contained):
+
+    def __init__(self, title):
+        self.title = title
+
+
+class PersistentRecord(Persistent, Contained):
+
+    def __init__(self, title):
+        self.title = title
+        self._v_cached = 'volatile'
+
+
+class Plain:
+    pass
+
+
+class Slotted:
+
+    __slots__ = ('title', )
+
+
+class Counting:
+    # A strategy counting its calls.
+
+    def __init__(self, strategy=copyAttributes):
+        self.strategy = strategy
+        self.calls = 0
+
+    def __call__(self, obj, toplevel, register):
+        self.calls += 1
+        return self.strategy(obj, toplevel, register)
+
+
+class StrategyTest(unittest.TestCase):
+
+    def setUp(self):
+        testing.setUp()
+        PlacelessSetup().setUp()
+        provideAdapter(LocationCopyHook, (ILocation, ), ICopyHook)
+        self.strategy = Counting()
+        registerCopyStrategy(Record, self.strategy)
+
+    def tearDown(self):
+        testing.tearDown()
+
+    def test_registry(self):
+        self.assertIs(getCopyStrategy(Record), self.strategy)
+        self.assertIsNone(getCopyStrategy(Contained))
+        unregisterCopyStrategy(Record)
+        unregisterCopyStrategy(Record)
+        self.assertIsNone(getCopyStrategy(Record))
+
+    def test_copy_without_pickling(self):
+        container = SampleContainer()
+        container['record'] = record = Record('title')
+        with mock.patch.object(cloning, '_pickle') as pickle:
+            name = ObjectCopier(record).copyTo(container, 'copy')
+        self.assertFalse(pickle.called)
+        copied = container[name]
+        self.assertIsNot(copied, record)
+        self.assertEqual(copied.title, 'title')
+        self.assertIs(copied.__parent__, container)
+        self.assertEqual(self.strategy.calls, 1)
+
+    def test_contained_objects(self):
+        root = SampleContainer()
+        root['folder'] = folder = SampleContainer()
+        for name in ('a', 'b'):
+            folder[name] = Record(name)
+        folder['other'] = Contained()
+        folder['mutable'] = Record(['mutable'])
+        folder.favorite = folder['a']
+        copied = cloning.copy(folder)
+        self.assertEqual(self.strategy.calls, 3)
+        self.assertEqual(copied['mutable'].title, ['mutable'])
+        self.assertIs(copied['mutable'].__parent__, copied)
+        self.assertIsNone(copied.__parent__)
+        for name in ('a', 'b'):
+            self.assertIsNot(copied[name], folder[name])
+            self.assertEqual(copied[name].title, name)
+            self.assertIs(copied[name].__parent__, copied)
+        self.assertIs(copied['other'].__parent__, copied)
+        self.assertIs(copied.favorite, copied['a'])
+
+    def test_outside_references_are_shared(self):
+        root = SampleContainer()
+        root['a'] = folder = SampleContainer()
+        root['c'] = other = SampleContainer()
+        other['b'] = related = Record('related')
+        folder['item'] = item = Contained()
+        item.related = related
+        copied = cloning.copy(folder)
+        self.assertIs(copied['item'].related, related)
+        self.assertEqual(self.strategy.calls, 0)
+
+    def test_shareable_objects_are_shared(self):
+        from zope.interface import alsoProvides
+
+        from zope.copypastemove.cloning import shareableCopyHook
+        from zope.copypastemove.interfaces import IShareable
+        provideAdapter(shareableCopyHook)
+        folder = SampleContainer()
+        folder['record'] = Record('record')
+        folder.shared = shared = Record('shared')
+        shared.__parent__ = folder
+        alsoProvides(shared, IShareable)
+        copied = cloning.copy(folder)
+        self.assertIs(copied.shared, shared)
+        self.assertIsNot(copied['record'], folder['record'])
+        self.assertEqual(self.strategy.calls, 1)
+
+    def test_objects_without_hooks(self):
+        registerCopyStrategy(Plain, self.strategy)
+        plain = Plain()
+        plain.title = 'title'
+        holder = Contained()
+        holder.first = holder.second = plain
+        copied = cloning.clone(holder)
+        self.assertIsNot(copied.first, plain)
+        self.assertIs(copied.first, copied.second)
+        self.assertEqual(copied.first.title, 'title')
+        self.assertEqual(self.strategy.calls, 1)
+
+    def test_fallback_to_pickling(self):
+        record = Record(['mutable'])
+        record.__parent__ = parent = Contained()
+        copied = cloning.clone(record)
+        self.assertEqual(self.strategy.calls, 1)
+        self.assertEqual(copied.title, ['mutable'])
+        self.assertIsNot(copied.title, record.title)
+        self.assertIs(copied.__parent__, parent)
+
+    def test_cleanups(self):
+        converted = []
+
+        def strategy(obj, toplevel, register):
+            register(lambda convert: converted.append(convert(toplevel)))
+            if obj is toplevel:
+                register(lambda convert: convert(Contained()))
+            return Record('copy')
+
+        registerCopyStrategy(Record, strategy)
+        with self.assertRaises(KeyError):
+            cloning.clone(Record('original'))
+        self.assertEqual([record.title for record in converted], ['copy'])
+
+        # The cleanups of records inside a pickled object convert the
+        # objects of the pickle.
+        del converted[:]
+        holder = Contained()
+        holder.record = Record('original')
+        holder.record.__parent__ = holder
+        copied = cloning.clone(holder)
+        self.assertEqual(converted, [copied])
+        self.assertEqual(copied.record.title, 'copy')
+
+    def test_persistent(self):
+        registerCopyStrategy(PersistentRecord, copyAttributes)
+        record = PersistentRecord('title')
+        copied = cloning.clone(record)
+        self.assertIsNot(copied, record)
+        self.assertEqual(copied.title, 'title')
+        self.assertFalse(hasattr(copied, '_v_cached'))
+
+    def test_slots(self):
+        slotted = Slotted()
+        slotted.title = 'title'
+        with self.assertRaises(ResumeCopy):
+            copyAttributes(slotted, slotted, None)
+
+    def test_empty(self):
+        copied = copyAttributes(Contained(), None, None)
+        self.assertIsInstance(copied, Contained)
+
+
+def test_suite():
+    return unittest.TestSuite((
+        unittest.defaultTestLoader.loadTestsFromName(__name__),
+        doctest.DocTestSuite('zope.copypastemove.strategies'),
+    ))
@@ -0,0 +1,137 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Trusted batch mover and copier tests
+"""
+import unittest
+
+import zope.configuration.xmlconfig
+from zope.component import testing
+from zope.container.contained import Contained
+from zope.container.sample import SampleContainer
+from zope.container.testing import PlacelessSetup
+from zope.security.checker import ProxyFactory
+from zope.security.interfaces import Unauthorized
+from zope.security.management import endInteraction
+from zope.security.management import newInteraction
+from zope.security.management import setSecurityPolicy
+
+import zope.copypastemove
+from zope.copypastemove.interfaces import IObjectBatchCopier
+from zope.copypastemove.interfaces import IObjectBatchMover
+from zope.copypastemove.interfaces import OperationCancelled
+from zope.copypastemove.progress import CancellationToken
+from zope.copypastemove.trusted import TrustedObjectBatchMover
+
+
+class CountingPolicy:
+    # A security policy allowing everything but the `denied` objects.
+
+    checks = []
+    denied = ()
+
+    def __init__(self, *participations):
+        pass
+
+    def checkPermission(self, permission, object):
+        self.checks.append((permission, object))
+        return object not in self.denied
+
+
+class TrustedBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        testing.setUp()
+        PlacelessSetup().setUp()
+        zope.configuration.xmlconfig.XMLConfig(
+            'configure.zcml', zope.copypastemove)()
+        self._oldPolicy = setSecurityPolicy(CountingPolicy)
+        CountingPolicy.checks = []
+        CountingPolicy.denied = ()
+        self.sources = []
+        for source_name in ('s1', 's2'):
+            source = SampleContainer()
+            for name in ('a', 'b'):
+                source[source_name + name] = Contained()
+            self.sources.append(source)
+        self.target = SampleContainer()
+
+    def tearDown(self):
+        endInteraction()
+        setSecurityPolicy(self._oldPolicy)
+        testing.tearDown()
+
+    def _objects(self):
+        return [ProxyFactory(ob)
+                for source in self.sources for ob in source.values()]
+
+    def test_move_checks_once_per_container(self):
+        newInteraction()
+        mover = IObjectBatchMover(ProxyFactory(self.target))
+        objects = self._objects()
+        CountingPolicy.checks = []
+        names = mover.moveObjects(objects)
+        self.assertEqual(names, ['s1a', 's1b', 's2a', 's2b'])
+        self.assertEqual(sorted(self.target), names)
+        self.assertEqual([len(source) for source in self.sources], [0, 0])
+        # One check to call the method, then one for the target and one
+        # for each source.
+        self.assertEqual(len(CountingPolicy.checks), 4)
+        self.assertEqual(
+            [ob for permission, ob in CountingPolicy.checks[1:]],
+            [self.target] + self.sources)
+
+    def test_copy_checks_once_per_container(self):
+        newInteraction()
+        copier = IObjectBatchCopier(ProxyFactory(self.target))
+        objects = self._objects()
+        CountingPolicy.checks = []
+        copier.copyObjects(objects)
+        self.assertEqual(len(self.target), 4)
+        self.assertEqual([len(source) for source in self.sources], [2, 2])
+        self.assertEqual(len(CountingPolicy.checks), 4)
+
+    def test_unauthorized_source(self):
+        newInteraction()
+        CountingPolicy.denied = (self.sources[1], )
+        mover = IObjectBatchMover(ProxyFactory(self.target))
+        with self.assertRaises(Unauthorized):
+            mover.moveObjects(self._objects())
+        self.assertEqual(len(self.target), 0)
+
+    def test_without_interaction(self):
+        mover = TrustedObjectBatchMover(ProxyFactory(self.target))
+        mover.moveObjects(self._objects())
+        self.assertEqual(len(self.target), 4)
+        self.assertEqual(CountingPolicy.checks, [])
+
+    def test_progress_and_token(self):
+        newInteraction()
+        token = CancellationToken()
+        reports = []
+
+        def progress(report):
+            reports.append(report.items)
+            token.cancel()
+        copier = IObjectBatchCopier(ProxyFactory(self.target))
+        with self.assertRaises(OperationCancelled):
+            copier.copyObjects(self._objects(), progress=progress,
+                               token=token)
+        self.assertEqual(len(self.target), 1)
+        mover = IObjectBatchMover(ProxyFactory(self.target))
+        with self.assertRaises(OperationCancelled):
+            mover.moveObjects(self._objects(), token=token)
+
+
+def test_suite():
+    return unittest.defaultTestLoader.loadTestsFromName(__name__)
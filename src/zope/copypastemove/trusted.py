@@ -0,0 +1,93 @@
+##############################################################################
+#
+# Copyright (c) 2026 Zope Foundation and Contributors.
+# All Rights Reserved.
+#
+# This software is subject to the provisions of the Zope Public License,
+# Version 2.1 (ZPL).  A copy of the ZPL should accompany this distribution.
+# THIS SOFTWARE IS PROVIDED "AS IS" AND ANY AND ALL EXPRESS OR IMPLIED
+# WARRANTIES ARE DISCLAIMED, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF TITLE, MERCHANTABILITY, AGAINST INFRINGEMENT, AND FITNESS
+# FOR A PARTICULAR PURPOSE.
+#
+##############################################################################
+"""Batch movers and copiers for trusted code
+
+Moving or copying security proxied objects one by one checks permissions
+on every attribute access.  The adapters in this module check their
+permission once on the target container and once on every source
+container, and then work on the unproxied objects.  They are registered
+as trusted adapters in ``configure.zcml``.
+"""
+__docformat__ = 'restructuredtext'
+
+from zope.security.interfaces import Unauthorized
+from zope.security.management import queryInteraction
+from zope.security.proxy import removeSecurityProxy
+
+from zope.copypastemove import ObjectBatchCopier
+from zope.copypastemove import ObjectBatchMover
+
+
+def unproxiedObjects(objects, target, permission, name):
+    """Return the unproxied `objects` after checking `permission`.
+
+    The permission is checked once on `target` and once on every distinct
+    container the objects are in.  `Unauthorized` is raised, mentioning
+    `name`, if it is missing on any of them.  Without an interaction,
+    nothing is checked.
+    """
+    interaction = queryInteraction()
+    unproxied = [removeSecurityProxy(obj) for obj in objects]
+    if interaction is None:
+        return unproxied
+
+    checked = set()
+    for container in [target] + [obj.__parent__ for obj in unproxied]:
+        container = removeSecurityProxy(container)
+        if id(container) in checked:
+            continue
+        if not interaction.checkPermission(permission, container):
+            raise Unauthorized(container, name, permission)
+        checked.add(id(container))
+    return unproxied
+
+
+class TrustedObjectBatchMover(ObjectBatchMover):
+    """Moves several, possibly proxied, objects into a container.
+
+    The permission is checked once per container instead of on every
+    attribute access of every object.
+    """
+
+    permission = 'zope.ManageContent'
+
+    def __init__(self, container):
+        super().__init__(removeSecurityProxy(container))
+
+    def moveObjects(self, objects, index=None, before=None, after=None,
+                    progress=None, token=None):
+        objects = unproxiedObjects(
+            objects, self.context, self.permission, 'moveObjects')
+        return super().moveObjects(
+            objects, index, before, after, progress, token)
+
+
+class TrustedObjectBatchCopier(ObjectBatchCopier):
+    """Copies several, possibly proxied, objects into a container.
+
+    The permission is checked once per container instead of on every
+    attribute access of every object.
+    """
+
+    permission = 'zope.ManageContent'
+
+    def __init__(self, container):
+        super().__init__(removeSecurityProxy(container))
+
+    def copyObjects(self, objects, index=None, before=None, after=None,
+                    progress=None, token=None):
+        objects = unproxiedObjects(
+            objects, self.context, self.permission, 'copyObjects')
+        return super().copyObjects(
+            objects, index, before, after, progress, token)